@@ -11,6 +11,13 @@ import mediapipe as mp
 import numpy as np
 import threading
 import random
+import weakref
+import hashlib
+import bisect
+import io
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -40,6 +47,21 @@ def get_collision_rect(img):
     collision_rect.y += full_rect.y
     return collision_rect
 
+def sequence_neighbours(sequence, name):
+    """The entries after and before name in a lesson sequence"""
+    if name not in sequence:
+        return []
+    index = sequence.index(name)
+    return [sequence[i] for i in (index + 1, index - 1) if 0 <= i < len(sequence)]
+
+def sequence_step(sequence, name, step, menu):
+    """The entry step places from name in a lesson sequence, or menu past either end"""
+    if name in sequence:
+        index = sequence.index(name) + step
+        if 0 <= index < len(sequence):
+            return sequence[index]
+    return menu
+
 def format_lessons(lessons, max_length=25):
     """Format lessons into lines of a specified maximum length."""
     formatted_lines = []
@@ -58,6 +80,11 @@ def format_lessons(lessons, max_length=25):
     return formatted_lines
 
 class State:
+    partial_updates = False  # opt in to pushing only the regions reported to game.dirty
+    # Input that can change anything on screen; opted-in states repaint fully on these
+    redraw_events = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                     pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP)
+
     def __init__(self, game):
         self.game = game
     
@@ -76,45 +103,88 @@ class State:
     def render(self):
         pass
 
+    def draw_buttons(self, surface):
+        """Draw the screen's buttons and hover outline; menus cache this in a UILayer"""
+        for image, rect, collision_rect, _ in getattr(self, "buttons", []):
+            surface.blit(image, rect.topleft)
+            if collision_rect == self.hovered_button:
+                pygame.draw.rect(surface, (0, 255, 0), collision_rect, 3)
+        if hasattr(self, "back_button_img"):
+            surface.blit(self.back_button_img, self.back_button_rect.topleft)
+            if self.hovered_button == self.back_button_collision:
+                pygame.draw.rect(surface, (0, 255, 0), self.back_button_collision, 3)
+
+    def pacing(self):
+        """How Game.run paces frames while this state is active"""
+        return 30
+
+    def button_widgets(self, back_state=None):
+        """Register self.buttons, and the back button when back_state is given, in a Widgets index"""
+        widgets = Widgets(self.game)
+        if back_state:
+            widgets.add(self.back_button_collision, on_click=lambda: self.game.change_state(back_state))
+        for _, _, collision_rect, state in getattr(self, "buttons", []):
+            widgets.add(collision_rect, state)
+        return widgets
+
+    def successors(self):
+        """States reachable from this one, warmed up ahead of time by the Prefetcher"""
+        names = [button[-1] for button in getattr(self, "buttons", [])]
+        if getattr(self, "next_state", None):
+            names.insert(0, self.next_state)
+        return names
+
 class VideoState(State):
+    loop_video = False  # menu backgrounds set this so their frames go into the loop cache
+
     def __init__(self, game, video_key, next_state=None, audio_file=None):
         super().__init__(game)
         self.video_key = video_key
         self.next_state = next_state
         self.audio_file = audio_file
-        self.sound = None if audio_file is None else pygame.mixer.Sound(audio_file)
 
     def enter(self):
-        self.game.videos[self.video_key].set(cv2.CAP_PROP_POS_FRAMES, 0)
-        if self.sound:
-            self.sound.play()  # Play the corresponding audio file
+        # Clips with narration run on the narration's clock so the two stay in sync
+        clock = self.game.narration.elapsed if self.audio_file else None
+        self.game.videos[self.video_key].restart(loop=self.loop_video, clock=clock)
+        if self.audio_file:
+            self.game.narration.play(self.audio_file)  # Play the corresponding audio file
 
     def exit(self):
-        if self.sound:
-            self.sound.stop()  # Stop audio when exiting
+        self.game.videos[self.video_key].stop()
+        if self.audio_file:
+            self.game.narration.stop()  # Stop audio when exiting
+
+    def pacing(self):
+        return self.game.videos[self.video_key].fps  # One redraw per clip frame
 
     def update(self):
         ret, frame = self.game.videos[self.video_key].read()
         if ret:
-            surface = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
-            self.game.screen.blit(surface, (0, 0))
+            self.game.screen.blit(frame, (0, 0))
         else:
-            if self.sound:
-                self.sound.stop()  # Stop audio when video ends
-            self.game.videos[self.video_key].release()
+            if self.audio_file:
+                self.game.narration.stop()  # Stop audio when video ends
+            self.game.videos[self.video_key].stop()
             if self.next_state:
                 self.game.change_state(self.next_state)
 
 class OnScreenKeyboardState(State):
+    partial_updates = True  # only changes on input
+    # Hover only moves the highlight, which is reported through game.dirty.track
+    redraw_events = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP)
+
     def __init__(self, game, initial_text=''):
         super().__init__(game)
         self.text = initial_text
-        self.font = pygame.font.Font(resource_path("FONTS/ARIAL.ttf"), 36)
+        self.font = self.game.assets.font("FONTS/ARIAL.ttf", 36)
         
         # Load Done button image
-        self.done_button_image = pygame.image.load(resource_path("BUTTONS/DONE.png")).convert_alpha()
+        self.done_button_image = self.game.assets.image("BUTTONS/DONE.png")
         self.done_button_rect = self.done_button_image.get_rect()  # Adjust position as needed
-        self.done_button_collision = get_collision_rect(self.done_button_image)
+        self.done_button_collision = self.game.assets.collision_rect(self.done_button_image)
+        self.widgets = Widgets(self.game)
+        self.widgets.add(self.done_button_collision, "done", on_click=lambda: self.game.change_state("playing_lgsign", self.text))
 
         self.shift = False  # Track shift key state
 
@@ -131,92 +201,107 @@ class OnScreenKeyboardState(State):
         self.key_height = 80
         self.key_margin = 10
         self.spacebar_width = 700  # Longer spacebar
+        self.layout_size = None  # Screen size the key layout was built for
+        self.background = (255, 255, 255)
 
         self.hovered_button = None  # Track hovered button
 
-    def draw_keyboard(self):
-        """Draw the on-screen keyboard."""
-        y_offset = 100  # Starting position for the keyboard
+    def pacing(self):
+        return PACE_IDLE
+
+    def build_keyboard_layout(self):
+        """Lay out the keys for the current screen size and pre-render the keyboard per shift state."""
+        self.layout_size = self.game.screen.get_size()
+        self.keyboard_top = 100  # Starting position for the keyboard
+        self.row_pitch = self.key_height + self.key_margin
+        self.key_rows = []  # (key lefts, [(key, rect), ...]) per row
 
+        y_offset = self.keyboard_top
         for row in self.keyboard_keys:
             row_width = sum(
                 self.spacebar_width if key == " " else self.key_width for key in row
             ) + (len(row) - 1) * self.key_margin
 
-            x_offset = (self.game.screen.get_width() - row_width) // 2
-
+            x_offset = (self.layout_size[0] - row_width) // 2
+            lefts, keys = [], []
             for key in row:
                 key_rect = pygame.Rect(x_offset, y_offset, self.spacebar_width if key == " " else self.key_width, self.key_height)
-
-                # Draw key
-                pygame.draw.rect(self.game.screen, (200, 200, 200), key_rect, border_radius=10)
-
-                # Display uppercase or lowercase letters
-                key_display = key.upper() if self.shift and key.isalpha() else key.lower()
-                key_text = self.font.render(key_display, True, (0, 0, 0))
-                text_rect = key_text.get_rect(center=key_rect.center)
-                self.game.screen.blit(key_text, text_rect.topleft)
+                lefts.append(key_rect.left)
+                keys.append((key, key_rect))
 
                 # Move to the next key
-                x_offset += (self.spacebar_width + self.key_margin) if key == " " else (self.key_width + self.key_margin)
+                x_offset += key_rect.width + self.key_margin
+
+            self.key_rows.append((lefts, keys))
+            y_offset += self.row_pitch
+
+        # The whole keyboard as one opaque surface for each shift state, on the screen's background
+        self.keyboard_rect = pygame.Rect(0, self.keyboard_top, self.layout_size[0], y_offset - self.keyboard_top)
+        self.keyboard_surfaces = {}
+        for shift in (False, True):
+            surface = pygame.Surface(self.keyboard_rect.size).convert()
+            surface.fill(self.background)
+            for _, keys in self.key_rows:
+                for key, key_rect in keys:
+                    key_rect = key_rect.move(0, -self.keyboard_top)
+
+                    # Draw key
+                    pygame.draw.rect(surface, (200, 200, 200), key_rect, border_radius=10)
+
+                    # Display uppercase or lowercase letters
+                    key_display = key.upper() if shift and key.isalpha() else key.lower()
+                    key_text = self.font.render(key_display, True, (0, 0, 0))
+                    text_rect = key_text.get_rect(center=key_rect.center)
+                    surface.blit(key_text, text_rect.topleft)
+            self.keyboard_surfaces[shift] = surface
+
+    def key_at(self, pos):
+        """The key under pos, found from the row pitch and the row's key lefts, or None."""
+        if self.layout_size != self.game.screen.get_size():
+            self.build_keyboard_layout()
+        x, y = pos
+        row_index, row_y = divmod(y - self.keyboard_top, self.row_pitch)
+        if row_index < 0 or row_index >= len(self.key_rows) or row_y >= self.key_height:
+            return None
+        lefts, keys = self.key_rows[row_index]
+        column = bisect.bisect_right(lefts, x) - 1
+        if column < 0:
+            return None
+        key, key_rect = keys[column]
+        return key if key_rect.collidepoint(pos) else None
 
-            y_offset += self.key_height + self.key_margin
+    def draw_keyboard(self):
+        """Draw the on-screen keyboard."""
+        if self.layout_size != self.game.screen.get_size():
+            self.build_keyboard_layout()
+        self.game.screen.blit(self.keyboard_surfaces[self.shift], self.keyboard_rect.topleft)
 
     def handle_keyboard_click(self, pos):
         """Handle clicking on the on-screen keyboard."""
-        y_offset = 100
-
-        for row in self.keyboard_keys:
-            row_width = sum(
-                self.spacebar_width if key == " " else self.key_width for key in row
-            ) + (len(row) - 1) * self.key_margin
-
-            x_offset = (self.game.screen.get_width() - row_width) // 2
-
-            for key in row:
-                key_rect = pygame.Rect(x_offset, y_offset, self.spacebar_width if key == " " else self.key_width, self.key_height)
-
-                if key_rect.collidepoint(pos):
-                    if key == "←":
-                        self.text = self.text[:-1]  # Backspace
-                    elif key == " ":
-                        self.text += " "  # Space
-                    elif key == "↑":
-                        self.shift = not self.shift  # Toggle shift state
-                    else:
-                        self.text += key.upper() if self.shift else key.lower()  # Add character
-
-                x_offset += (self.spacebar_width + self.key_margin) if key == " " else (self.key_width + self.key_margin)
-
-            y_offset += self.key_height + self.key_margin
+        key = self.key_at(pos)
+        if key is None:
+            return
+        if key == "←":
+            self.text = self.text[:-1]  # Backspace
+        elif key == " ":
+            self.text += " "  # Space
+        elif key == "↑":
+            self.shift = not self.shift  # Toggle shift state
+        else:
+            self.text += key.upper() if self.shift else key.lower()  # Add character
 
     def handle_event(self, event):
         if event.type in [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN]:
-            if self.done_button_collision.collidepoint(event.pos):
-                self.hovered_button = self.done_button_collision
-            else:
-                self.hovered_button = None
-
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.done_button_collision.collidepoint(event.pos):
-                self.game.change_state("playing_lgsign", self.text)
-            else:
-                self.handle_keyboard_click(event.pos)
-        
-        # Check delete button
-        if event.type in [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN]:
-            if self.done_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.done_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.done_button_collision
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left mouse button
                 self.dragging = True
                 self.drag_start_y = event.pos[1]
 
-            if self.done_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
+            # The Done button hands the text back; anything else may be a key
+            if self.widgets.click(event.pos) is None:
+                self.handle_keyboard_click(event.pos)
 
         # Handle external keyboard input
         if event.type == pygame.KEYDOWN:
@@ -234,11 +319,11 @@ class OnScreenKeyboardState(State):
                 self.text += char
 
     def render(self):
-        self.game.screen.fill((255, 255, 255))  # Clear screen
+        self.game.screen.fill(self.background)  # Clear screen
 
         # Draw input box
         pygame.draw.rect(self.game.screen, pygame.Color('white'), pygame.Rect(10, 10, 900, 50), 2)
-        txt_surface = self.font.render(self.text, True, pygame.Color('black'))
+        txt_surface = self.game.text.render(self.font, self.text, True, pygame.Color('black'))
         self.game.screen.blit(txt_surface, (15, 15))
 
         # Draw the on-screen keyboard
@@ -248,11 +333,12 @@ class OnScreenKeyboardState(State):
         self.game.screen.blit(self.done_button_image, self.done_button_rect.topleft)
         if self.hovered_button == self.done_button_collision:
             pygame.draw.rect(self.game.screen, (0, 255, 0), self.done_button_collision, 3)
+        self.game.dirty.track("hover", self.hovered_button)
 
 class VideoWithSignInState(VideoState):
     def __init__(self, game, video_key, next_state=None, audio_file=None, next_button_collision_height=50):
         super().__init__(game, video_key, next_state, audio_file)
-        self.font = pygame.font.Font(None, 24)
+        self.font = self.game.assets.font(None, 24)
         
         # Create input box and button using consistent approach
         self.input_box_rect = pygame.Rect(362, 300, 300, 50)
@@ -261,14 +347,18 @@ class VideoWithSignInState(VideoState):
         self.input_box_surf.fill((0, 0, 0, 0))  # Transparent
 
         # Load NEXT.png button image
-        self.next_button_img = pygame.image.load(resource_path("BUTTONS/NEXT.png")).convert_alpha()
+        self.next_button_img = self.game.assets.image("BUTTONS/NEXT.png")
         self.next_button_rect = self.next_button_img.get_rect(topleft=(462, 370))
-        self.next_button_collision = get_collision_rect(self.next_button_img)
+        self.next_button_collision = self.game.assets.collision_rect(self.next_button_img)
 
         # Add back button
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
+
+        self.widgets = Widgets(self.game)
+        self.widgets.add(self.next_button_collision, on_click=self.submit)
+        self.widgets.add(self.back_button_collision, on_click=lambda: self.game.change_state("playing_blgsign"))
         
         # Adjust the height, width, x, and y of the collision rectangle for back button
         self.text = ''
@@ -285,7 +375,7 @@ class VideoWithSignInState(VideoState):
     def update(self):
         ret, frame = self.game.videos[self.video_key].read()
         if ret:
-            self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+            self.last_frame = frame
             self.game.screen.blit(self.last_frame, (0, 0))
         else:
             if self.last_frame:
@@ -293,18 +383,8 @@ class VideoWithSignInState(VideoState):
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            # Check next button hover
-            if self.next_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.next_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.next_button_collision
-            # Check back button hover
-            elif self.back_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.back_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.back_button_collision
-            else:
-                self.hovered_button = None
+            # Next button first, then back
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
                 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.input_box_rect.collidepoint(event.pos):
@@ -313,36 +393,26 @@ class VideoWithSignInState(VideoState):
             else:
                 self.active = False
                 
-            # Handle next button click
-            if self.next_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                print(f"Entered text: {self.text}")
-                # Save the profile name and create a save file
-                if self.text.strip():  # Only save if text isn't empty
-                    self.save_profile(self.text)
-                # Go to home screen
-                self.game.change_state("playing_home")
-                
-            # Handle back button click
-            elif self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                # Go back to blgsign screen
-                self.game.change_state("playing_blgsign")
+            # Next saves the profile and goes home; back returns to the blgsign screen
+            self.widgets.click(event.pos)
         
         if event.type == pygame.KEYDOWN:
             if self.active:
                 if event.key == pygame.K_RETURN:
-                    print(f"Entered text: {self.text}")
-                    # Save the profile name and create a save file
-                    if self.text.strip():  # Only save if text isn't empty
-                        self.save_profile(self.text)
-                    # Go to home screen
-                    self.game.change_state("playing_home")
+                    self.submit()
                 elif event.key == pygame.K_BACKSPACE:
                     self.text = self.text[:-1]
                 else:
                     self.text += event.unicode
 
+    def submit(self):
+        print(f"Entered text: {self.text}")
+        # Save the profile name and create a save file
+        if self.text.strip():  # Only save if text isn't empty
+            self.save_profile(self.text)
+        # Go to home screen
+        self.game.change_state("playing_home")
+
     def save_profile(self, profile_name):
         """Save the profile name to a save file"""
         # Set current profile in the game
@@ -376,7 +446,7 @@ class VideoWithSignInState(VideoState):
             
         # Draw input box
         pygame.draw.rect(self.game.screen, pygame.Color('white'), self.input_box_rect, 2)
-        txt_surface = self.font.render(self.text, True, pygame.Color('black'))
+        txt_surface = self.game.text.render(self.font, self.text, True, pygame.Color('black'))
         self.game.screen.blit(txt_surface, (self.input_box_rect.x + 5, self.input_box_rect.y + (self.input_box_rect.height - txt_surface.get_height()) // 2))
         
         # Draw NEXT button
@@ -399,31 +469,44 @@ class WelcomeState(State):
         
         # Load button images properly
         for img_path, _, state in button_data:
-            img = pygame.image.load(resource_path(img_path)).convert_alpha()
+            img = self.game.assets.image(img_path)
             img_rect = img.get_rect()
-            collision_rect = get_collision_rect(img)
+            collision_rect = self.game.assets.collision_rect(img)
             self.buttons.append((img, img_rect, collision_rect, state))
             
         self.audio_file = audio_file
-        self.sound = None if audio_file is None else pygame.mixer.Sound(audio_file)
+        self.next_state = "playing_intro"  # The launch button plays this state's own clip, then moves on
         self.last_frame = None
         self.video_started = False
         self.buttons_active = True  
         self.hovered_button = None  
+        self.widgets = Widgets(self.game)
+        for _, _, collision_rect, _ in self.buttons:
+            self.widgets.add(collision_rect, on_click=self.launch)
+
+    def successors(self):
+        return [self.next_state]
+
+    def launch(self):
+        """Any button starts this screen's own clip, then moves on to next_state"""
+        if self.audio_file:
+            self.game.narration.play(self.audio_file)  # Play the corresponding audio file
+        self.video_started = True
+        self.buttons_active = False
 
     def enter(self):
         self.video_started = False
         self.buttons_active = True  
         self.hovered_button = None  
-        self.game.videos[self.background_video].set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self.game.videos[self.background_video].restart()
         ret, frame = self.game.videos[self.background_video].read()
         if ret:
-            self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+            self.last_frame = frame
 
     def exit(self):
-        self.game.videos[self.background_video].release()
-        if self.sound:
-            self.sound.stop()  # Stop audio when exiting
+        self.game.videos[self.background_video].stop()
+        if self.audio_file:
+            self.game.narration.stop()  # Stop audio when exiting
 
     def update(self):
         if not self.video_started:
@@ -438,51 +521,41 @@ class WelcomeState(State):
         else:
             ret, frame = self.game.videos[self.background_video].read()
             if ret:
-                self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+                self.last_frame = frame
                 self.game.screen.blit(self.last_frame, (0, 0))
             else:
-                self.game.videos[self.background_video].release()
-                self.game.change_state("playing_intro")
+                self.game.videos[self.background_video].stop()
+                self.game.change_state(self.next_state)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION and self.buttons_active:
-            hovered = None
-            for _, _, collision_rect, _ in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    hovered = collision_rect
-                    break
-
-            if hovered and hovered != self.hovered_button:
-                pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-            
-            self.hovered_button = hovered
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
 
         if event.type == pygame.MOUSEBUTTONDOWN and self.buttons_active:
-            for _, _, collision_rect, state in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    if self.sound:
-                        self.sound.play()  # Play the corresponding audio file
-                    self.video_started = True
-                    self.buttons_active = False  
-                    break
+            self.widgets.click(event.pos)
 
 class UserTypeState(VideoState):
+    partial_updates = True  # static once the intro clip has finished
+    # Hover only moves the highlight, which is reported through game.dirty.track
+    redraw_events = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP)
+
     def __init__(self, game, video_key, button_data, audio_file=None):
         super().__init__(game, video_key, None, audio_file)
         self.buttons = []
         
         # Load button images properly
         for img_path, _, state in button_data:
-            img = pygame.image.load(img_path).convert_alpha()
+            img = self.game.assets.image(img_path)
             img_rect = img.get_rect()
-            collision_rect = get_collision_rect(img)
+            collision_rect = self.game.assets.collision_rect(img)
             self.buttons.append((img, img_rect, collision_rect, state))
             
         self.last_frame = None
         self.video_finished = False
         self.buttons_active = True  
         self.hovered_button = None  
+        self.button_layer = UILayer((1024, 600), self.draw_buttons)
+        self.widgets = self.button_widgets()
 
     def enter(self):
         super().enter()
@@ -493,46 +566,43 @@ class UserTypeState(VideoState):
     def exit(self):
         super().exit()
 
+    def pacing(self):
+        return PACE_IDLE if self.video_finished else super().pacing()
+
     def update(self):
         if not self.video_finished:
             ret, frame = self.game.videos[self.video_key].read()
             if ret:
-                self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+                if frame is not self.last_frame:
+                    self.game.dirty.invalidate()  # New video frame
+                self.last_frame = frame
                 self.game.screen.blit(self.last_frame, (0, 0))
             else:
                 self.video_finished = True  
+                self.game.dirty.invalidate()  # The buttons appear
         else:
             if self.last_frame:
                 self.game.screen.blit(self.last_frame, (0, 0))
-            for image, rect, collision_rect, _ in self.buttons:
-                self.game.screen.blit(image, rect.topleft)
-
-                if collision_rect == self.hovered_button:
-                    pygame.draw.rect(self.game.screen, (0, 255, 0), collision_rect, 3)
+            # Buttons and hover outline come pre-composited in one layer
+            self.button_layer.blit(self.game.screen, self.hovered_button)
+            self.game.dirty.track("hover", self.hovered_button)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION and self.buttons_active:
-            hovered = None
-            for _, _, collision_rect, _ in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    hovered = collision_rect
-                    break
-
-            if hovered and hovered != self.hovered_button:
-                pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-
-            self.hovered_button = hovered
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
 
         if event.type == pygame.MOUSEBUTTONDOWN and self.video_finished and self.buttons_active:
-            for _, _, collision_rect, state in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    self.game.change_state(state)
-                    self.buttons_active = False  
-                    break
+            state = self.widgets.click(event.pos)
+            if state:
+                self.game.change_state(state)
+                self.buttons_active = False  
 
 # New class for the BLGSIGN state with NEW GAME and LOAD GAME buttons
 class BLGSignState(State):
+    partial_updates = True  # static once the intro clip has finished
+    # Hover only moves the highlight, which is reported through game.dirty.track
+    redraw_events = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP)
+
     def __init__(self, game, video_key, button_data, audio_file=None):
         super().__init__(game)
         self.video_key = video_key
@@ -540,120 +610,107 @@ class BLGSignState(State):
         
         # Load button images properly
         for img_path, _, state in button_data:
-            img = pygame.image.load(img_path).convert_alpha()
+            img = self.game.assets.image(img_path)
             img_rect = img.get_rect()
-            collision_rect = get_collision_rect(img)
+            collision_rect = self.game.assets.collision_rect(img)
             self.buttons.append((img, img_rect, collision_rect, state))
         
         # Load back button image
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
 
         self.audio_file = audio_file
-        self.sound = None if audio_file is None else pygame.mixer.Sound(audio_file)
         self.last_frame = None
         self.video_finished = False
         self.buttons_active = True  
         self.hovered_button = None  
+        self.button_layer = UILayer((1024, 600), self.draw_buttons)
+        self.widgets = self.button_widgets("playing_usertype")
 
     def enter(self):
-        self.game.videos[self.video_key].set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self.game.videos[self.video_key].restart()
         self.video_finished = False
         self.buttons_active = True  
         self.hovered_button = None  
-        if self.sound:
-            self.sound.play()  # Play the corresponding audio file
+        if self.audio_file:
+            self.game.narration.play(self.audio_file)  # Play the corresponding audio file
 
     def exit(self):
-        self.game.videos[self.video_key].release()
-        if self.sound:
-            self.sound.stop()  # Stop audio when exiting
+        self.game.videos[self.video_key].stop()
+        if self.audio_file:
+            self.game.narration.stop()  # Stop audio when exiting
+
+    def pacing(self):
+        return PACE_IDLE if self.video_finished else self.game.videos[self.video_key].fps
 
     def update(self):
         if not self.video_finished:
             ret, frame = self.game.videos[self.video_key].read()
             if ret:
-                self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+                if frame is not self.last_frame:
+                    self.game.dirty.invalidate()  # New video frame
+                self.last_frame = frame
                 self.game.screen.blit(self.last_frame, (0, 0))
             else:
                 self.video_finished = True  
+                self.game.dirty.invalidate()  # The buttons appear
         
         # Always display the buttons after the video is finished
         if self.video_finished:
             if self.last_frame:
                 self.game.screen.blit(self.last_frame, (0, 0))
-            for image, rect, collision_rect, _ in self.buttons:
-                self.game.screen.blit(image, rect.topleft)
-
-                if collision_rect == self.hovered_button:
-                    pygame.draw.rect(self.game.screen, (0, 255, 0), collision_rect, 3)  # Cyan highlight
-            
-            # Draw the back button
-            self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
-            if self.hovered_button == self.back_button_collision:
-                pygame.draw.rect(self.game.screen, (0, 255, 0), self.back_button_collision, 3)  # Cyan highlight
+            # Buttons and hover outline come pre-composited in one layer
+            self.button_layer.blit(self.game.screen, self.hovered_button)
+            self.game.dirty.track("hover", self.hovered_button)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION and self.buttons_active:
-            hovered = None
-            for _, _, collision_rect, _ in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    hovered = collision_rect
-                    break
-
-            if hovered and hovered != self.hovered_button:
-                pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-
-            self.hovered_button = hovered
-
-            # Check if the back button is hovered
-            if self.back_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.back_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.back_button_collision
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
 
         if event.type == pygame.MOUSEBUTTONDOWN and self.video_finished and self.buttons_active:
-            for _, _, collision_rect, state in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    self.game.change_state(state)
-                    break
-
-            # Check if the back button is clicked
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_usertype")
+            state = self.widgets.click(event.pos)  # The back button switches screens itself
+            if state:
+                self.game.change_state(state)
 
 class LoadGameState(State):
+    partial_updates = True  # only changes on input
+    # Hover only moves the highlight, which is reported through game.dirty.track
+    redraw_events = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP)
+
     def __init__(self, game, video_key, audio_file=None):
         super().__init__(game)
         self.video_key = video_key
         self.audio_file = audio_file
-        self.sound = None if audio_file is None else pygame.mixer.Sound(audio_file)
         self.last_frame = None
-        self.font = pygame.font.Font(None, 30)
-        self.small_font = pygame.font.Font(None, 24)  # Smaller font for save data
+        self.font = self.game.assets.font(None, 30)
+        self.small_font = self.game.assets.font(None, 24)  # Smaller font for save data
         self.profile_buttons = []
         self.selected_profile_data = None  # To store the loaded profile data
         self.lines_to_draw = []  # Initialize lines_to_draw as an instance variable
+        self.line_layout = []  # (text, indent, colour) for each of lines_to_draw
         
         # Load back button image
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
 
         # Load LOAD and DELETE button images
-        self.load_button_img = pygame.image.load(resource_path("BUTTONS/LOAD.png")).convert_alpha()
+        self.load_button_img = self.game.assets.image("BUTTONS/LOAD.png")
         self.load_button_rect = self.load_button_img.get_rect()
-        self.load_button_collision = get_collision_rect(self.load_button_img)
+        self.load_button_collision = self.game.assets.collision_rect(self.load_button_img)
 
-        self.delete_button_img = pygame.image.load(resource_path("BUTTONS/DELETE.png")).convert_alpha()
+        self.delete_button_img = self.game.assets.image("BUTTONS/DELETE.png")
         self.delete_button_rect = self.delete_button_img.get_rect()
-        self.delete_button_collision = get_collision_rect(self.delete_button_img)
+        self.delete_button_collision = self.game.assets.collision_rect(self.delete_button_img)
 
         # Load background image
-        self.background_img = pygame.image.load(resource_path("SCENES/SENYASPIC.png")).convert()
+        self.background_img = self.game.assets.image("SCENES/SENYASPIC.png", alpha=False)
+
+        # Darkening overlay and the composited backdrop are built once, not every frame
+        self.overlay = pygame.Surface((1024, 600), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 128))
+        self.backdrop = UILayer((1024, 600), self.draw_backdrop, alpha=False)
 
         # Initialize scroll settings for both profile list and data panel
         self.hovered_button = None
@@ -663,6 +720,14 @@ class LoadGameState(State):
         self.scroll_offset = 0
         self.dragging = False
         self.drag_start_y = 0
+
+        # Profile list viewport; only the rows inside it are drawn, into a cached layer
+        self.profile_area = pygame.Rect(362, 150, 400, 420)
+        self.profile_lines = []  # Wrapped name of each row, computed once per reload
+        self.profile_tops = []  # Row tops in list order, for bisecting the visible window
+        self.profile_list_bottom = self.profile_area.top
+        self.profile_layer = UILayer(self.profile_area.size, self.draw_profile_rows)
+        self.build_widgets()
         
         # Data panel scroll settings - match the profile scroll implementation
         self.data_scroll_offset = 0
@@ -671,6 +736,10 @@ class LoadGameState(State):
         
         # Define data panel dimensions
         self.data_panel = pygame.Rect(50, 150, 280, 400)
+        self.data_layer = UILayer(self.data_panel.size, self.draw_data_panel, alpha=False)
+        self.selected_name_lines = []
+        self.data_content_top = 130  # Offset of the scrollable progress lines inside the panel
+        self.line_height = 25
         
         # Define bottom margin for content to prevent overlap
         self.bottom_margin = 10  # Margin at the bottom of the data panel
@@ -714,8 +783,7 @@ class LoadGameState(State):
 
         # Normal word wrapping
         for word in words:
-            word_surface = font.render(word, True, pygame.Color('white'))
-            word_width = word_surface.get_width()
+            word_width = font.size(word)[0]
             
             if current_width + word_width <= max_width:
                 current_line.append(word)
@@ -732,24 +800,30 @@ class LoadGameState(State):
         
     def enter(self):
         # Ensure the video starts from the beginning
-        self.game.videos[self.video_key].set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self.game.videos[self.video_key].restart()
         
         # Get the first frame immediately to ensure we have something to display
         ret, frame = self.game.videos[self.video_key].read()
         if ret:
-            self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+            self.last_frame = frame.copy()  # kept for good; the player reuses its frame buffers
         
         self.load_profiles()
-        if self.sound:
-            self.sound.play()
+        self.build_widgets()
+        if self.audio_file:
+            self.game.narration.play(self.audio_file)
         
     def exit(self):
-        if self.sound:
-            self.sound.stop()
+        self.game.videos[self.video_key].stop()
+        if self.audio_file:
+            self.game.narration.stop()
         
     def load_profiles(self):
         """Load existing profiles from the saves directory"""
         self.profile_buttons = []
+        self.profile_lines = []
+        self.profile_tops = []
+        self.profile_list_bottom = self.profile_area.top
+        self.profile_layer.invalidate()
         
         if not os.path.exists("saves"):
             return
@@ -773,9 +847,68 @@ class LoadGameState(State):
             # Create button rect with adaptive height
             button_rect = pygame.Rect(362, y_position, button_width, button_height)
             self.profile_buttons.append((profile_name, button_rect))
+            self.profile_lines.append(wrapped_lines)
+            self.profile_tops.append(y_position)
+            self.profile_list_bottom = button_rect.bottom
             
             # Update y_position for next button with some spacing
             y_position += button_height + 10  # 10 pixels gap between buttons
+
+    def build_widgets(self):
+        """Index the buttons, then the visible profile rows at their scrolled on-screen position.
+
+        Rows are clipped to the list viewport and re-registered whenever the
+        list scrolls or reloads; the buttons win where they overlap a row.
+        """
+        self.widgets = Widgets(self.game)
+        self.widgets.add(self.back_button_collision, on_click=lambda: self.game.change_state("playing_blgsign"))
+        self.widgets.add(self.load_button_collision, on_click=self.load_selected)
+        self.widgets.add(self.delete_button_collision, on_click=self.delete_selected)
+        for i in self.visible_profiles():
+            profile_name, button_rect = self.profile_buttons[i]
+            row = button_rect.move(0, self.scroll_offset).clip(self.profile_area)
+            if row.height:
+                self.widgets.add(row, profile_name, on_click=lambda name=profile_name: self.select_profile(name))
+
+    def select_profile(self, profile_name):
+        self.selected_profile = profile_name
+        self.load_profile_data(profile_name)
+        # Reset data scroll offset when selecting a new profile
+        self.data_scroll_offset = 0
+
+    def load_selected(self):
+        if not self.selected_profile:
+            return
+        self.game.current_profile = self.selected_profile
+        print(f"Loaded profile: {self.selected_profile}")
+        self.game.change_state("playing_home")
+
+    def delete_selected(self):
+        if not self.selected_profile:
+            return
+        os.remove(f"saves/{self.selected_profile}.json")
+        print(f"Deleted profile: {self.selected_profile}")
+        self.selected_profile = None
+        self.selected_profile_data = None
+        self.lines_to_draw = []
+        self.line_layout = []
+        self.load_profiles()
+        self.build_widgets()
+
+    def visible_profiles(self):
+        """Indices of the profile rows inside the list viewport at the current scroll offset"""
+        top = self.profile_area.top - self.scroll_offset
+        bottom = self.profile_area.bottom - self.scroll_offset
+        start = max(0, bisect.bisect_right(self.profile_tops, top) - 1)
+        end = bisect.bisect_left(self.profile_tops, bottom)
+        return range(start, end)
+
+    def max_profile_scroll(self):
+        return max(0, self.profile_list_bottom - self.profile_area.bottom)
+
+    def max_data_scroll(self):
+        visible_height = self.data_panel.height - self.data_content_top - self.bottom_margin
+        return max(0, len(self.lines_to_draw) * self.line_height - visible_height)
     
     def load_profile_data(self, profile_name):
         """Load the data from a specific profile"""
@@ -783,6 +916,10 @@ class LoadGameState(State):
             with open(f"saves/{profile_name}.json", "r") as f:
                 self.selected_profile_data = json.load(f)
                 print(f"Loaded data for profile: {profile_name}")
+
+                # Panel header layout only changes with the profile
+                self.selected_name_lines = self.wrap_text(profile_name, self.small_font, self.data_panel.width - 20)
+                self.data_content_top = 35 + len(self.selected_name_lines) * 25 + 60
                 
                 # After loading profile data, prepare the lines to draw
                 self.prepare_lines_to_draw()
@@ -790,10 +927,12 @@ class LoadGameState(State):
             print(f"Error loading profile data: {e}")
             self.selected_profile_data = None
             self.lines_to_draw = []
+        self.data_layer.invalidate()
     
     def prepare_lines_to_draw(self):
         """Prepare the lines to draw for the selected profile data"""
         self.lines_to_draw = []
+        self.line_layout = []
         if not self.selected_profile_data:
             return
             
@@ -822,13 +961,27 @@ class LoadGameState(State):
                 self.lines_to_draw.append((f"{lesson_type}:", category))
                 for line in formatted_lines:
                     self.lines_to_draw.append((line, category))
+
+        # Indentation and colour per line, worked out once instead of every frame
+        for line_text, category in self.lines_to_draw:
+            indent = 10
+            if ":" not in line_text:
+                indent = 30
+            elif any(word in line_text for word in ["Alphabets", "Number", "Phrase", "Fingerspelling"]):
+                indent = 20
+            color_key = category if category in ('galaxy_explorer', 'cosmic_copy', 'star_quest') else 'default'
+            self.line_layout.append((line_text, indent, self.colors[color_key]))
     
+    def pacing(self):
+        return PACE_IDLE if self.last_frame is not None else 30
+
     def update(self):
         # If we don't have a frame yet, try to get one
         if self.last_frame is None:
             ret, frame = self.game.videos[self.video_key].read()
             if ret:
-                self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+                self.last_frame = frame.copy()
+                self.game.dirty.invalidate()
     
     def handle_event(self, event):
         # Handle profile list scrolling
@@ -837,63 +990,35 @@ class LoadGameState(State):
             if self.dragging:
                 delta_y = event.pos[1] - self.drag_start_y
                 self.scroll_offset += delta_y
-                # Limit scrolling based on the number of profiles
-                self.scroll_offset = max(min(self.scroll_offset, 0), -max(0, (len(self.profile_buttons) - 1) * 60 - 400))
+                # Limit scrolling to the laid-out height of the list
+                self.scroll_offset = max(min(self.scroll_offset, 0), -self.max_profile_scroll())
                 self.drag_start_y = event.pos[1]
+                self.build_widgets()  # Rows are indexed where they are drawn
+                self.game.dirty.add(self.profile_area)
             # Handle data panel dragging
             elif self.data_dragging:
                 delta_y = event.pos[1] - self.data_drag_start_y
                 self.data_scroll_offset += delta_y
                 
-                # Get content dimensions
-                content_start_y = self.data_panel.y + 130  # Estimated fixed header height
-                visible_height = self.data_panel.height - (content_start_y - self.data_panel.y) - self.bottom_margin
-                total_content_height = len(self.lines_to_draw) * 25  # line_height
-                
                 # Limit scrolling based on content height and bottom margin
-                max_scroll = max(0, total_content_height - visible_height)
-                self.data_scroll_offset = max(min(self.data_scroll_offset, 0), -max_scroll)
+                self.data_scroll_offset = max(min(self.data_scroll_offset, 0), -self.max_data_scroll())
                 
                 self.data_drag_start_y = event.pos[1]
+                self.game.dirty.add(self.data_panel)
             else:
-                # Check profile buttons
-                self.hovered_button = None
-                for _, button_rect in self.profile_buttons:
-                    if button_rect.move(0, self.scroll_offset).collidepoint(event.pos):
-                        if self.hovered_button != button_rect:
-                            pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                        self.hovered_button = button_rect
-                        break
-                
-                # Check back button
-                if self.back_button_collision.collidepoint(event.pos):
-                    if self.hovered_button != self.back_button_collision:
-                        pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                    self.hovered_button = self.back_button_collision
-
-                # Check load button
-                if self.load_button_collision.collidepoint(event.pos):
-                    if self.hovered_button != self.load_button_collision:
-                        pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                    self.hovered_button = self.load_button_collision
-
-                # Check delete button
-                if self.delete_button_collision.collidepoint(event.pos):
-                    if self.hovered_button != self.delete_button_collision:
-                        pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                    self.hovered_button = self.delete_button_collision
+                # Buttons and the visible profile rows
+                self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
         
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left mouse button
                 # Check if the click is within the profile buttons area
-                profile_area = pygame.Rect(362, 150, 300, 420)
-                if profile_area.collidepoint(event.pos):
+                if self.profile_area.collidepoint(event.pos):
                     self.dragging = True
                     self.drag_start_y = event.pos[1]
                 
                 # Check if the click is within the data panel scrollable area
                 # Calculate content area
-                content_start_y = self.data_panel.y + 130  # Estimated fixed header height
+                content_start_y = self.data_panel.y + self.data_content_top
                 content_area = pygame.Rect(
                     self.data_panel.x, 
                     content_start_y,  
@@ -905,175 +1030,110 @@ class LoadGameState(State):
                     self.data_dragging = True
                     self.data_drag_start_y = event.pos[1]
                 
-                # Check profile buttons
-                for profile_name, button_rect in self.profile_buttons:
-                    if button_rect.move(0, self.scroll_offset).collidepoint(event.pos):
-                        pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                        self.selected_profile = profile_name
-                        self.load_profile_data(profile_name)
-                        
-                        # Reset data scroll offset when selecting a new profile
-                        self.data_scroll_offset = 0
-                        return
-                
-                # Check back button
-                if self.back_button_collision.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    self.game.change_state("playing_blgsign")
-
-                # Check load button
-                if self.load_button_collision.collidepoint(event.pos) and self.selected_profile:
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    self.game.current_profile = self.selected_profile
-                    print(f"Loaded profile: {self.selected_profile}")
-                    self.game.change_state("playing_home")
-
-                # Check delete button
-                if self.delete_button_collision.collidepoint(event.pos) and self.selected_profile:
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    os.remove(f"saves/{self.selected_profile}.json")
-                    print(f"Deleted profile: {self.selected_profile}")
-                    self.selected_profile = None
-                    self.selected_profile_data = None
-                    self.lines_to_draw = []
-                    self.load_profiles()
+                # Profile rows select, the buttons go back, load or delete
+                self.widgets.click(event.pos)
         
         if event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:  # Left mouse button
                 self.dragging = False
                 self.data_dragging = False
 
-    def render(self):
-        # Draw background and overlay
-        self.game.screen.blit(self.background_img, (0, 0))
+    def draw_backdrop(self, surface):
+        """Background, last video frame and the darkening overlay, composited once"""
+        surface.blit(self.background_img, (0, 0))
         if self.last_frame:
-            self.game.screen.blit(self.last_frame, (0, 0))
+            surface.blit(self.last_frame, (0, 0))
+        surface.blit(self.overlay, (0, 0))
+
+    def draw_data_panel(self, surface):
+        """Selected profile's details; redrawn only when the data or its scroll offset changes"""
+        panel = surface.get_rect()
+        pygame.draw.rect(surface, (30, 30, 60), panel)
+        pygame.draw.rect(surface, (0, 200, 200), panel, 2)
         
-        overlay = pygame.Surface((1024, 600), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.game.screen.blit(overlay, (0, 0))
+        # Draw headers and profile info with text wrapping
+        header_text = self.game.text.render(self.small_font, "PROFILE:", True, pygame.Color('white'))
+        surface.blit(header_text, (10, 10))
         
-        # Draw title
-        title_text = self.font.render("SELECT A PROFILE", True, pygame.Color('white'))
-        title_rect = title_text.get_rect(center=(512, 50))
-        self.game.screen.blit(title_text, title_rect)
-        
-        # Draw profile data panel
-        if self.selected_profile_data:
-            pygame.draw.rect(self.game.screen, (30, 30, 60), self.data_panel)
-            pygame.draw.rect(self.game.screen, (0, 200, 200), self.data_panel, 2)
-            
-            # Draw headers and profile info with text wrapping
-            header_text = self.small_font.render("PROFILE:", True, pygame.Color('white'))
-            header_rect = header_text.get_rect(x=self.data_panel.x + 10, y=self.data_panel.y + 10)
-            self.game.screen.blit(header_text, header_rect)
-            
-            # Wrap and draw profile name
-            wrapped_name = self.wrap_text(self.selected_profile, self.small_font, self.data_panel.width - 20)
-            y_offset = self.data_panel.y + 35
-            for line in wrapped_name:
-                name_text = self.small_font.render(line, True, self.colors['profile_name'])
-                name_rect = name_text.get_rect(x=self.data_panel.x + 10, y=y_offset)
-                self.game.screen.blit(name_text, name_rect)
-                y_offset += 25
-
-            # Draw creation date with new color
-            created_at_label = self.small_font.render("CREATED AT:", True, pygame.Color('white'))
-            created_at_label_rect = created_at_label.get_rect(x=self.data_panel.x + 10, y=y_offset)
-            self.game.screen.blit(created_at_label, created_at_label_rect)
-
-            created_at_value = self.small_font.render(
-                f"{self.selected_profile_data.get('created at', 'N/A')}", 
-                True, self.colors['created_at']
-            )
-            created_at_value_rect = created_at_value.get_rect(x=created_at_label_rect.right + 5, y=y_offset)
-            self.game.screen.blit(created_at_value, created_at_value_rect)
-            
-            # Set a fixed position for the PROGRESS header with proper spacing
-            progress_text = self.small_font.render("PROGRESS:", True, pygame.Color('white'))
-            progress_y = y_offset + 30  # Add more spacing between created_at and progress
-            progress_rect = progress_text.get_rect(x=self.data_panel.x + 10, y=progress_y)
-            self.game.screen.blit(progress_text, progress_rect)
-
-            # Define content start position with enough gap after the PROGRESS header
-            content_start_y = progress_y + 30  # Increase this value for more spacing
-
-            # Create a clipping rect for the scrollable content area
-            # This will stop content from being drawn in the bottom margin area
-            content_area = pygame.Rect(
-                self.data_panel.x,
-                content_start_y,
-                self.data_panel.width,
-                self.data_panel.height - (content_start_y - self.data_panel.y) - self.bottom_margin
-            )
-
-            # Save the current clip area
-            original_clip = self.game.screen.get_clip()
-
-            # Set the clip area to prevent drawing outside the content area
-            self.game.screen.set_clip(content_area)
-
-            # Draw scrollable progress content
-            line_height = 25  # Reduce line height to fit more content
-
-            for i, line_data in enumerate(self.lines_to_draw):
-                line_text, category = line_data
-                y_pos = content_start_y + (i * line_height) + self.data_scroll_offset
-                
-                # Skip rendering if position is outside the visible area
-                if y_pos < content_area.top - line_height or y_pos > content_area.bottom:
-                    continue
-                
-                # Adjust indentation based on line content
-                indent = 10
-                if ":" not in line_text:
-                    indent = 30
-                elif any(word in line_text for word in ["Alphabets", "Number", "Phrase", "Fingerspelling"]):
-                    indent = 20
-                
-                # Determine text color based on category
-                color_key = 'default'
-                if category == 'galaxy_explorer':
-                    color_key = 'galaxy_explorer'
-                elif category == 'cosmic_copy':
-                    color_key = 'cosmic_copy'
-                elif category == 'star_quest':
-                    color_key = 'star_quest'
-                
-                line_surface = self.small_font.render(line_text, True, self.colors[color_key])
-                self.game.screen.blit(line_surface, (self.data_panel.x + indent, y_pos))
-
-            # Restore the original clip area
-            self.game.screen.set_clip(original_clip)
-            
-        # Draw profile buttons with text wrapping
-        profile_height = 60
-        max_visible_profiles = 7
-        start_index = max(0, -self.scroll_offset // profile_height)
-        end_index = min(len(self.profile_buttons), start_index + max_visible_profiles)
+        # Draw profile name, wrapped when the profile was loaded
+        y_offset = 35
+        for line in self.selected_name_lines:
+            name_text = self.game.text.render(self.small_font, line, True, self.colors['profile_name'])
+            surface.blit(name_text, (10, y_offset))
+            y_offset += 25
+
+        # Draw creation date with new color
+        created_at_label = self.game.text.render(self.small_font, "CREATED AT:", True, pygame.Color('white'))
+        created_at_label_rect = created_at_label.get_rect(x=10, y=y_offset)
+        surface.blit(created_at_label, created_at_label_rect)
+
+        created_at_value = self.game.text.render(self.small_font,
+            f"{self.selected_profile_data.get('created at', 'N/A')}", 
+            True, self.colors['created_at']
+        )
+        surface.blit(created_at_value, (created_at_label_rect.right + 5, y_offset))
         
-        for i in range(start_index, end_index):
+        # Set a fixed position for the PROGRESS header with proper spacing
+        progress_text = self.game.text.render(self.small_font, "PROGRESS:", True, pygame.Color('white'))
+        surface.blit(progress_text, (10, y_offset + 30))
+
+        # Clip the scrollable progress lines to the content area above the bottom margin
+        content_area = pygame.Rect(0, self.data_content_top, panel.width,
+                                   panel.height - self.data_content_top - self.bottom_margin)
+        surface.set_clip(content_area)
+
+        # Only the lines inside the content area are rendered
+        first = max(0, -self.data_scroll_offset // self.line_height - 1)
+        last = min(len(self.line_layout), first + content_area.height // self.line_height + 3)
+        for i in range(first, last):
+            line_text, indent, color = self.line_layout[i]
+            y_pos = content_area.top + (i * self.line_height) + self.data_scroll_offset
+            line_surface = self.game.text.render(self.small_font, line_text, True, color)
+            surface.blit(line_surface, (indent, y_pos))
+
+        surface.set_clip(None)
+
+    def draw_profile_rows(self, surface):
+        """Profile rows inside the list viewport; redrawn only on scroll, selection or reload"""
+        offset_x, offset_y = -self.profile_area.x, self.scroll_offset - self.profile_area.y
+        line_height = self.font.get_linesize()
+        for i in self.visible_profiles():
             profile_name, button_rect = self.profile_buttons[i]
-            adjusted_rect = button_rect.move(0, self.scroll_offset)
+            adjusted_rect = button_rect.move(offset_x, offset_y)
             
             # Draw button background and border
-            pygame.draw.rect(self.game.screen, (50, 50, 100), adjusted_rect)
+            pygame.draw.rect(surface, (50, 50, 100), adjusted_rect)
             border_color = (0, 255, 0) if profile_name == self.selected_profile else (255, 255, 255)
-            pygame.draw.rect(self.game.screen, border_color, adjusted_rect, 2)
+            pygame.draw.rect(surface, border_color, adjusted_rect, 2)
             
-            # Wrap and draw profile name in button
-            wrapped_lines = self.wrap_text(profile_name, self.font, button_rect.width - 40)  # 40 = padding_x * 2
-            line_height = self.font.get_linesize()
+            # Draw the profile name, wrapped when the list was loaded
+            wrapped_lines = self.profile_lines[i]
             total_text_height = len(wrapped_lines) * line_height
             
             # Calculate starting y position to center text vertically
             y_offset = adjusted_rect.y + (adjusted_rect.height - total_text_height) // 2
             
             for line in wrapped_lines:
-                text_surface = self.font.render(line, True, pygame.Color('white'))
+                text_surface = self.game.text.render(self.font, line, True, pygame.Color('white'))
                 text_rect = text_surface.get_rect(centerx=adjusted_rect.centerx, y=y_offset)
-                self.game.screen.blit(text_surface, text_rect)
+                surface.blit(text_surface, text_rect)
                 y_offset += line_height
+
+    def render(self):
+        # Draw background and overlay
+        self.backdrop.blit(self.game.screen, self.last_frame)
+        
+        # Draw title
+        title_text = self.game.text.render(self.font, "SELECT A PROFILE", True, pygame.Color('white'))
+        title_rect = title_text.get_rect(center=(512, 50))
+        self.game.screen.blit(title_text, title_rect)
+        
+        # Draw profile data panel
+        if self.selected_profile_data:
+            self.data_layer.blit(self.game.screen, self.data_scroll_offset, self.data_panel.topleft)
+            
+        # Draw the visible profile rows
+        self.profile_layer.blit(self.game.screen, (self.scroll_offset, self.selected_profile), self.profile_area.topleft)
         
         # Draw control buttons
         self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
@@ -1083,14 +1143,17 @@ class LoadGameState(State):
         # Draw button highlights
         if self.hovered_button:
             pygame.draw.rect(self.game.screen, (0, 255, 0), self.hovered_button, 3)
+        self.game.dirty.track("hover", self.hovered_button)
         
         # Show message if no profiles
         if not self.profile_buttons:
-            no_profiles_text = self.font.render("No saved profiles found", True, pygame.Color('white'))
+            no_profiles_text = self.game.text.render(self.font, "No saved profiles found", True, pygame.Color('white'))
             no_profiles_rect = no_profiles_text.get_rect(center=(512, 300))
             self.game.screen.blit(no_profiles_text, no_profiles_rect)
 
 class HomeState(VideoState):
+    loop_video = True
+
     def __init__(self, game, video_key, next_state=None, audio_file=None):
         super().__init__(game, video_key, next_state, audio_file)
         
@@ -1104,20 +1167,22 @@ class HomeState(VideoState):
         ]
         
         for img_path, state in button_data:
-            img = pygame.image.load(img_path).convert_alpha()
+            img = self.game.assets.image(img_path)
             img_rect = img.get_rect()
-            collision_rect = get_collision_rect(img)
+            collision_rect = self.game.assets.collision_rect(img)
             self.buttons.append((img, img_rect, collision_rect, state))
         
         # Add back button
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
 
 
         self.last_frame = None
         self.hovered_button = None
-        self.font = pygame.font.Font(None, 24)
+        self.button_layer = UILayer((1024, 600), self.draw_buttons)
+        self.widgets = self.button_widgets("playing_usertype")
+        self.font = self.game.assets.font(None, 24)
 
     def enter(self):
         super().enter()
@@ -1128,91 +1193,121 @@ class HomeState(VideoState):
     def update(self):
         ret, frame = self.game.videos[self.video_key].read()
         if ret:
-            self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+            self.last_frame = frame
             self.game.screen.blit(self.last_frame, (0, 0))
             
             # Draw buttons on top of the video frame with their original positions
-            for image, rect, collision_rect, _ in self.buttons:
-                self.game.screen.blit(image, rect.topleft)
-                
-                # Highlight hovered button
-                if collision_rect == self.hovered_button:
-                    pygame.draw.rect(self.game.screen, (0, 255, 0), collision_rect, 3)  # Cyan highlight
-            # Draw back button
-            self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
-            if self.hovered_button == self.back_button_collision:
-                pygame.draw.rect(self.game.screen, (0, 255, 0), self.back_button_collision, 3)
+            self.button_layer.blit(self.game.screen, self.hovered_button)
 
             # Display current profile name
             if hasattr(self.game, 'current_profile') and self.game.current_profile:
-                profile_text = self.font.render(f"Profile: {self.game.current_profile}", True, pygame.Color('white'))
+                profile_text = self.game.text.render(self.font, f"Profile: {self.game.current_profile}", True, pygame.Color('white'))
                 self.game.screen.blit(profile_text, (10, 10))
         else:
             # If video ends, loop it
-            self.game.videos[self.video_key].set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.game.videos[self.video_key].restart(loop=True)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            hovered = None
-            for _, _, collision_rect, _ in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    hovered = collision_rect
-                    break
-
-            # Check back button
-            if self.back_button_collision.collidepoint(event.pos):
-                hovered = self.back_button_collision
-
-            if hovered and hovered != self.hovered_button:
-                pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-            
-            self.hovered_button = hovered
+            # One grid lookup resolves the category and back buttons
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
         
         if event.type == pygame.MOUSEBUTTONDOWN:
-            for _, _, collision_rect, state in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    # Actually change the state now
-                    print(f"Button clicked: {state}")
-                    self.game.change_state(state)
-                    return
-                
-            # Check back button
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_usertype")
-
-class Confetti:
-    def __init__(self, screen_width, screen_height):
-        self.x = random.randint(0, screen_width)
-        self.y = random.randint(0, screen_height // 3)  # Start in top third
-        self.color = random.choice([(255, 0, 0), (0, 255, 0), (0, 0, 255), 
-                                  (255, 255, 0), (255, 0, 255), (0, 255, 255)])
-        self.width = random.randint(5, 15)
-        self.height = random.randint(5, 15)
-        self.speed = random.uniform(5, 12)
-        self.rotation = random.randint(0, 360)
-        self.rotation_speed = random.uniform(-8, 8)
-
-    def fall(self):
+            state = self.widgets.click(event.pos)  # The back button switches screens itself
+            if state:
+                print(f"Button clicked: {state}")
+                self.game.change_state(state)
+
+class ConfettiAtlas:
+    """Every confetti sprite a celebration can show, rotated ahead of time.
+
+    Pieces come in a few sizes and six colours; each combination is rotated
+    once per angle step, so drawing a piece is a lookup instead of a new
+    Surface, a rect fill and a transform.rotate.
+    """
+    COLORS = [(255, 0, 0), (0, 255, 0), (0, 0, 255),
+              (255, 255, 0), (255, 0, 255), (0, 255, 255)]
+    SIZES = (5, 8, 11, 14)
+    ANGLE_STEP = 15  # degrees
+
+    def __init__(self, screen_width=1024, screen_height=600):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.angles = 360 // self.ANGLE_STEP
+        self.sprites = []
+        for width in self.SIZES:
+            for height in self.SIZES:
+                for color in self.COLORS:
+                    piece = pygame.Surface((width, height), pygame.SRCALPHA)
+                    piece.fill(color)
+                    for step in range(self.angles):
+                        self.sprites.append(pygame.transform.rotate(piece, step * self.ANGLE_STEP))
+        self.kinds = len(self.sprites) // self.angles
+        # Offsets from a piece's centre to its sprite's top-left corner
+        self.half_width = np.array([sprite.get_width() // 2 for sprite in self.sprites])
+        self.half_height = np.array([sprite.get_height() // 2 for sprite in self.sprites])
+        self.widths = np.array([sprite.get_width() for sprite in self.sprites])
+        self.heights = np.array([sprite.get_height() for sprite in self.sprites])
+
+    def burst(self, count):
+        return ConfettiBurst(self, count)
+
+class ConfettiBurst:
+    """One celebration's confetti, simulated as NumPy arrays"""
+    def __init__(self, atlas, count):
+        self.atlas = atlas
+        rng = np.random.default_rng()
+        self.x = rng.integers(0, atlas.screen_width, count, endpoint=True)
+        self.y = rng.integers(0, atlas.screen_height // 3, count, endpoint=True).astype(np.float64)  # Start in top third
+        self.speed = rng.uniform(5, 12, count)
+        self.rotation = rng.integers(0, 360, count, endpoint=True).astype(np.float64)
+        self.rotation_speed = rng.uniform(-8, 8, count)
+        self.kind = rng.integers(0, atlas.kinds, count)
+
+    def __len__(self):
+        return len(self.x)
+
+    def step(self, surface):
+        """Move every piece, draw it, drop the ones that fell off screen; returns the drawn bounds"""
+        if not len(self.x):
+            return None
+        atlas = self.atlas
         self.y += self.speed
         self.rotation += self.rotation_speed
 
-    def draw(self, surface):
-        # Create a surface for the rotated rectangle
-        confetti_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.rect(confetti_surface, self.color, (0, 0, self.width, self.height))
-        
-        # Rotate the surface
-        rotated_surface = pygame.transform.rotate(confetti_surface, self.rotation)
-        
-        # Get the rect of the rotated surface and set its center to the confetti position
-        rect = rotated_surface.get_rect(center=(self.x, self.y))
-        
-        # Draw the rotated surface
-        surface.blit(rotated_surface, rect.topleft)
+        angle = np.rint(self.rotation / atlas.ANGLE_STEP).astype(np.int64) % atlas.angles
+        index = self.kind * atlas.angles + angle
+        left = self.x - atlas.half_width[index]
+        top = self.y.astype(np.int64) - atlas.half_height[index]
+        sprites = atlas.sprites
+        surface.blits([(sprites[i], (l, t)) for i, l, t in zip(index.tolist(), left.tolist(), top.tolist())],
+                      doreturn=False)
+        bounds = pygame.Rect(int(left.min()), int(top.min()), 0, 0)
+        bounds.width = int((left + atlas.widths[index]).max()) - bounds.x
+        bounds.height = int((top + atlas.heights[index]).max()) - bounds.y
+
+        # Pieces are drawn once below the bottom edge before they are dropped, like before
+        keep = self.y <= atlas.screen_height
+        if not keep.all():
+            self.x, self.y = self.x[keep], self.y[keep]
+            self.speed, self.rotation = self.speed[keep], self.rotation[keep]
+            self.rotation_speed, self.kind = self.rotation_speed[keep], self.kind[keep]
+        return bounds
+
+def report_lesson_regions(state, confetti_rect, text_rects=()):
+    """Report what a lesson screen redraws every frame to game.dirty"""
+    dirty = state.game.dirty
+    dirty.add(pygame.Rect(state.webcam_position, state.webcam_size))
+    # Result/debug text where it was actually drawn; tracked so a shorter or vanished line is cleared
+    text_rect = text_rects[0].unionall(text_rects[1:]) if text_rects else None
+    dirty.add(text_rect)
+    dirty.track("text", text_rect)
+    dirty.track("confetti", confetti_rect)
+    dirty.track("hover", state.hovered_button)
 
 class GalaxyExplorerState(VideoState):
+    loop_video = True
+
     def __init__(self, game, video_key, next_state=None, audio_file=None):
         super().__init__(game, video_key, next_state, audio_file)
         
@@ -1226,18 +1321,20 @@ class GalaxyExplorerState(VideoState):
         ]
         
         for img_path, state in button_data:
-            img = pygame.image.load(img_path).convert_alpha()
+            img = self.game.assets.image(img_path)
             img_rect = img.get_rect()
-            collision_rect = get_collision_rect(img)
+            collision_rect = self.game.assets.collision_rect(img)
             self.buttons.append((img, img_rect, collision_rect, state))
         
         # Add back button
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
 
         self.last_frame = None
         self.hovered_button = None
+        self.button_layer = UILayer((1024, 600), self.draw_buttons)
+        self.widgets = self.button_widgets("playing_home")
 
     def enter(self):
         super().enter()
@@ -1248,60 +1345,29 @@ class GalaxyExplorerState(VideoState):
     def update(self):
         ret, frame = self.game.videos[self.video_key].read()
         if ret:
-            self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+            self.last_frame = frame
             self.game.screen.blit(self.last_frame, (0, 0))
             
             # Draw buttons on top of the video frame
-            for image, rect, collision_rect, _ in self.buttons:
-                self.game.screen.blit(image, rect.topleft)
-                
-                # Highlight hovered button
-                if collision_rect == self.hovered_button:
-                    pygame.draw.rect(self.game.screen, (0, 255, 0), collision_rect, 3)
-            
-            # Draw back button
-            self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
-            if self.hovered_button == self.back_button_collision:
-                pygame.draw.rect(self.game.screen, (0, 255, 0), self.back_button_collision, 3)
+            self.button_layer.blit(self.game.screen, self.hovered_button)
         else:
             # If video ends, loop it
-            self.game.videos[self.video_key].set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.game.videos[self.video_key].restart(loop=True)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            # Check category buttons
-            hovered = None
-            for _, _, collision_rect, _ in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    hovered = collision_rect
-                    break
-            
-            # Check back button
-            if self.back_button_collision.collidepoint(event.pos):
-                hovered = self.back_button_collision
-            
-            # Play hover sound if we have a new hovered button
-            if hovered and hovered != self.hovered_button:
-                pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-            
-            self.hovered_button = hovered
+            # One grid lookup resolves the category and back buttons
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
         
         if event.type == pygame.MOUSEBUTTONDOWN:
-            # Check category buttons
-            for _, _, collision_rect, state in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    # Transition to the appropriate state
-                    print(f"Button clicked: {state}")
-                    self.game.change_state(state)
-                    return
-            
-            # Check back button
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_home")
+            state = self.widgets.click(event.pos)  # The back button switches screens itself
+            if state:
+                print(f"Button clicked: {state}")
+                self.game.change_state(state)
 
 class GalaxyExplorerAlphabetState(VideoState):
+    loop_video = True
+
     def __init__(self, game, video_key, next_state=None, audio_file=None):
         super().__init__(game, video_key, next_state, audio_file)
         
@@ -1325,18 +1391,20 @@ class GalaxyExplorerAlphabetState(VideoState):
         ]
         
         for img_path, state in button_data:
-            img = pygame.image.load(img_path).convert_alpha()
+            img = self.game.assets.image(img_path)
             img_rect = img.get_rect()
-            collision_rect = get_collision_rect(img)
+            collision_rect = self.game.assets.collision_rect(img)
             self.buttons.append((img, img_rect, collision_rect, state))
         
         # Add back button
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
 
         self.last_frame = None
         self.hovered_button = None
+        self.button_layer = UILayer((1024, 600), self.draw_buttons)
+        self.widgets = self.button_widgets("playing_galaxy")
 
     def enter(self):
         super().enter()
@@ -1347,89 +1415,61 @@ class GalaxyExplorerAlphabetState(VideoState):
     def update(self):
         ret, frame = self.game.videos[self.video_key].read()
         if ret:
-            self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+            self.last_frame = frame
             self.game.screen.blit(self.last_frame, (0, 0))
             
             # Draw buttons on top of the video frame
-            for image, rect, collision_rect, _ in self.buttons:
-                self.game.screen.blit(image, rect.topleft)
-                
-                # Highlight hovered button
-                if collision_rect == self.hovered_button:
-                    pygame.draw.rect(self.game.screen, (0, 255, 0), collision_rect, 3)
-            
-            # Draw back button
-            self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
-            if self.hovered_button == self.back_button_collision:
-                pygame.draw.rect(self.game.screen, (0, 255, 0), self.back_button_collision, 3)
+            self.button_layer.blit(self.game.screen, self.hovered_button)
         else:
             # If video ends, loop it
-            self.game.videos[self.video_key].set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.game.videos[self.video_key].restart(loop=True)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            # Check category buttons
-            hovered = None
-            for _, _, collision_rect, _ in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    hovered = collision_rect
-                    break
-            
-            # Check back button
-            if self.back_button_collision.collidepoint(event.pos):
-                hovered = self.back_button_collision
-            
-            # Play hover sound if we have a new hovered button
-            if hovered and hovered != self.hovered_button:
-                pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-            
-            self.hovered_button = hovered
+            # One grid lookup resolves the category and back buttons
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
         
         if event.type == pygame.MOUSEBUTTONDOWN:
-            # Check category buttons
-            for _, _, collision_rect, state in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    # Transition to the appropriate state
-                    print(f"Button clicked: {state}")
-                    self.game.change_state(state)
-                    return
-            
-            # Check back button
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_galaxy")
+            state = self.widgets.click(event.pos)  # The back button switches screens itself
+            if state:
+                print(f"Button clicked: {state}")
+                self.game.change_state(state)
 
 class AlphabetDisplayState(State):
+    partial_updates = True  # webcam, result text, confetti and hover are reported each frame
+    redraw_events = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+
     def __init__(self, game, image_path, expected_letter, webcam_position=(700, 150), webcam_size=(300, 225)):
         super().__init__(game)
-        self.original_image = pygame.image.load(image_path).convert_alpha()
-
-        # Scale the image to fit within 1024x600 while maintaining aspect ratio
-        self.image = pygame.transform.smoothscale(self.original_image, self.get_scaled_dimensions(self.original_image, 1024, 600))
-        self.image_rect = self.image.get_rect(center=(1024 // 2, 600 // 2))  # Center the image
+        # Lesson art is fetched from the asset cache on enter() and let go on exit()
+        self.image_path = image_path
+        self.image = None
+        self.image_rect = None
 
         # Add confetti-related attributes
         self.confetti_particles = []
         self.confetti_triggered = False
 
-        # Load confetti sound effect
-        self.confetti_sound = pygame.mixer.Sound(resource_path("AUDIO/CELEB.mp3"))
-
         # Back button (Initialize once)
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
 
         # Next button
-        self.next_button_img = pygame.image.load(resource_path("BUTTONS/NXT.png")).convert_alpha()
+        self.next_button_img = self.game.assets.image("BUTTONS/NXT.png")
         self.next_button_rect = self.next_button_img.get_rect()  # Position at top right
-        self.next_button_collision = get_collision_rect(self.next_button_img)
+        self.next_button_collision = self.game.assets.collision_rect(self.next_button_img)
 
         # Previous button
-        self.prev_button_img = pygame.image.load(resource_path("BUTTONS/PREV.png")).convert_alpha()
+        self.prev_button_img = self.game.assets.image("BUTTONS/PREV.png")
         self.prev_button_rect = self.prev_button_img.get_rect()  # Position at top left
-        self.prev_button_collision = get_collision_rect(self.prev_button_img)
+        self.prev_button_collision = self.game.assets.collision_rect(self.prev_button_img)
+
+        # Hover and clicks are resolved through one grid lookup; back, next and previous in that priority
+        self.widgets = Widgets(self.game)
+        self.widgets.add(self.back_button_collision, on_click=lambda: self.game.change_state("playing_alphabets"))
+        self.widgets.add(self.next_button_collision, on_click=lambda: self.step_lesson(1))
+        self.widgets.add(self.prev_button_collision, on_click=lambda: self.step_lesson(-1))
 
         self.last_frame = None
         self.hovered_button = None
@@ -1439,16 +1479,13 @@ class AlphabetDisplayState(State):
         self.webcam_size = (350, 263)
         self.webcam = None  # Initialize webcam as None
 
-        # Load the TFLite model
-        self.interpreter = tflite.Interpreter(model_path=resource_path("MODEL/asl_mlp_model_v2.tflite"))
-        self.interpreter.allocate_tensors()
-        self.input_details = self.interpreter.get_input_details()
-        self.output_details = self.interpreter.get_output_details()
+        # Shared TFLite model (one interpreter per model file)
+        self.classifier = self.game.models.get("MODEL/asl_mlp_model_v2.tflite")
 
         # Mediapipe Hands setup
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(static_image_mode=False, max_num_hands=1, min_detection_confidence=0.5)
+        self.mp_hands = mp.solutions.hands  # Graph itself is shared via game.tracker
         self.mp_drawing = mp.solutions.drawing_utils
+        self.landmark_adapter = LandmarkAdapter()  # Reusable model-input buffers for the worker
 
         # Label map
         self.labels = [chr(i) for i in range(ord('A'), ord('Z') + 1)]
@@ -1465,130 +1502,150 @@ class AlphabetDisplayState(State):
         self.last_prediction = None
         self.last_confidence = None
 
-    def get_scaled_dimensions(self, image, max_width, max_height):
-        """Returns new dimensions for the image while maintaining aspect ratio"""
-        img_width, img_height = image.get_size()
-        scale_factor = min(max_width / img_width, max_height / img_height)
-        return int(img_width * scale_factor), int(img_height * scale_factor)
+    def successors(self):
+        return sequence_neighbours(self.game.alphabet_sequence, self.game.current_state_name)
 
     def enter(self):
-        self.webcam = cv2.VideoCapture(0, cv2.CAP_DSHOW)  # Initialize webcam
+        # Scaled to fit within 1024x600 while maintaining aspect ratio, and centered
+        self.image = self.game.assets.image(self.image_path, evictable=True, fit=(1024, 600))
+        self.image_rect = self.image.get_rect(center=(1024 // 2, 600 // 2))
+        self.webcam = self.game.camera.subscribe(self)  # Shared, already-open webcam
         self.correct = False
         self.start_time = None
         self.confetti_triggered = False
         self.confetti_particles = []
         self.last_prediction = None
         self.last_confidence = None
+        self.webcam_surface = None
+        self.last_result_sequence = 0
+        self.game.recognition.start(self.process_frame)
 
     def exit(self):
+        self.game.recognition.stop()
         if self.webcam:
-            self.webcam.release()  # Release the webcam
+            self.game.camera.unsubscribe(self)  # Camera stays open for the next state
             self.webcam = None
+        self.image = None  # The asset cache owns the art, so evicting it frees the memory
+
+    def process_frame(self, webcam_frame):
+        """Runs on the recognition worker: hand landmarks, classification and overlay"""
+        # Flip the webcam frame horizontally to mirror it
+        webcam_frame = cv2.flip(webcam_frame, 1)
+        h, w, _ = webcam_frame.shape
+        roi = webcam_frame[:, w//2:]  # Right side ROI
+        roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
+        result = self.game.tracker.process_hands(roi_rgb)
+
+        prediction = None
+        confidence = None
+
+        # Only process hand landmarks if no celebration is active
+        if result.multi_hand_landmarks and not self.confetti_triggered:
+            for hand_landmarks in result.multi_hand_landmarks:
+                # x and y coordinates only, as a (1, 42) view into the adapter's buffer
+                input_data = self.landmark_adapter.hand(hand_landmarks, dims=2)
+                
+                # Ensure the input data has the correct shape
+                if input_data.shape[1] == self.classifier.input_shape[1]:
+                    # Perform inference
+                    output_data = self.classifier.predict(input_data)
+                    index = np.argmax(output_data)
+                    prediction = self.labels[index]
+                    confidence = output_data[0][index]
+
+                # Draw landmarks
+                self.mp_drawing.draw_landmarks(
+                    roi, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
+                    self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
+                    self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
+                )
+
+        return {
+            "frame": webcam_frame,
+            "hands": bool(result.multi_hand_landmarks),
+            "landmarks": result.multi_hand_landmarks,
+            "prediction": prediction,
+            "confidence": confidence
+        }
+
+    def apply_result(self, result):
+        """Runs on the main thread: turn a worker result into lesson progress"""
+        if result["hands"] and not self.confetti_triggered:
+            if result["prediction"] is not None:
+                # Store last prediction and confidence for debugging
+                self.last_prediction = result["prediction"]
+                self.last_confidence = result["confidence"]
+                
+                # *** CHANGED: Reduced confidence threshold from 0.99 to 0.85 for letter "I" specifically ***
+                confidence_threshold = 0.85 if self.expected_letter == "I" else 0.95
+                
+                if result["confidence"] >= confidence_threshold and result["prediction"] == self.expected_letter:
+                    self.correct = True
+                    if self.start_time is None:
+                        self.start_time = time.time()  # Start the timer
+                        self.save_progress()  # Save progress when correct
+
+                        # Trigger confetti effect when correct sign is made
+                        if not self.confetti_triggered:
+                            self.confetti_particles = self.game.confetti.burst(100)
+                            self.confetti_triggered = True
+                            self.game.sfx.play("celebrate")  # Play confetti sound when triggered
+                else:
+                    # Only set to false if we're not in celebration mode
+                    if not self.confetti_triggered:
+                        self.correct = False
+        elif self.confetti_triggered:
+            # We're in celebration mode, keep the correct state
+            pass
+        else:
+            # No hand landmarks detected and not in celebration
+            self.correct = None
+
+    def pacing(self):
+        # Follow the camera, but keep a steady rate while confetti falls
+        return 30 if self.confetti_particles else PACE_CAMERA
 
     def update(self):
         self.game.screen.fill((0, 0, 0))  # Clear screen
         self.game.screen.blit(self.image, self.image_rect.topleft)  # Centered display
 
+        # Pick up the newest result published by the recognition worker
+        result = self.game.recognition.latest()
+        if result is not None and result["sequence"] != self.last_result_sequence:
+            self.last_result_sequence = result["sequence"]
+            self.apply_result(result)
+            self.webcam_surface = self.game.presenter.present(result["frame"], self.webcam_size)
+
+        text_rects = []  # Where the result/debug text lands, for game.dirty
         # Update webcam feed
-        if self.webcam:
-            ret, webcam_frame = self.webcam.read()
-            if ret:
-                # Flip the webcam frame horizontally to mirror it
-                webcam_frame = cv2.flip(webcam_frame, 1)
-                h, w, _ = webcam_frame.shape
-                roi = webcam_frame[:, w//2:]  # Right side ROI
-                roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
-                result = self.hands.process(roi_rgb)
-
-                # Only process hand landmarks if no celebration is active
-                if result.multi_hand_landmarks and not self.confetti_triggered:
-                    for hand_landmarks in result.multi_hand_landmarks:
-                        landmarks = []
-                        for lm in hand_landmarks.landmark:
-                            landmarks.extend([lm.x, lm.y])  # Use only x and y coordinates
-                        
-                        # Convert landmarks to NumPy array and reshape
-                        input_data = np.array(landmarks, dtype=np.float32).reshape(1, -1)
-                        
-                        # Ensure the input data has the correct shape
-                        if input_data.shape[1] == self.input_details[0]['shape'][1]:
-                            # Perform inference
-                            self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
-                            self.interpreter.invoke()
-                            output_data = self.interpreter.get_tensor(self.output_details[0]['index'])
-                            prediction = np.argmax(output_data)
-                            
-                            # Store last prediction and confidence for debugging
-                            self.last_prediction = self.labels[prediction]
-                            self.last_confidence = output_data[0][prediction]
-                            
-                            # *** CHANGED: Reduced confidence threshold from 0.99 to 0.85 for letter "I" specifically ***
-                            confidence = output_data[0][prediction]
-                            confidence_threshold = 0.85 if self.expected_letter == "I" else 0.95
-                            
-                            if confidence >= confidence_threshold and self.labels[prediction] == self.expected_letter:
-                                self.correct = True
-                                if self.start_time is None:
-                                    self.start_time = time.time()  # Start the timer
-                                    self.save_progress()  # Save progress when correct
-
-                                    # Trigger confetti effect when correct sign is made
-                                    if not self.confetti_triggered:
-                                        self.confetti_particles = [Confetti(1024, 600) for _ in range(100)]
-                                        self.confetti_triggered = True
-                                        self.confetti_sound.play()  # Play confetti sound when triggered
-                            else:
-                                # Only set to false if we're not in celebration mode
-                                if not self.confetti_triggered:
-                                    self.correct = False
-
-                        # Draw landmarks
-                        self.mp_drawing.draw_landmarks(
-                            roi, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
-                            self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
-                            self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
-                        )
-                elif self.confetti_triggered:
-                    # We're in celebration mode, keep the correct state
-                    pass
-                else:
-                    # No hand landmarks detected and not in celebration
-                    self.correct = None
-
-                # Display result
-                if self.correct is True:
-                    result_text = "Correct"
-                elif self.correct is False:
-                    result_text = "Try Again"  # Display "Try Again" only if a wrong gesture is performed
-                else:
-                    result_text = ""  # No gesture detected, display nothing
+        if self.webcam_surface is not None:
+            # Display result
+            if self.correct is True:
+                result_text = "Correct"
+            elif self.correct is False:
+                result_text = "Try Again"  # Display "Try Again" only if a wrong gesture is performed
+            else:
+                result_text = ""  # No gesture detected, display nothing
 
-                result_surface = self.game.font.render(result_text, True, pygame.Color('white'))
+            result_surface = self.game.text.render(self.game.font, result_text, True, pygame.Color('white'))
 
-                # Calculate the x-coordinate to center the text below the webcam
-                result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
-                result_y = self.webcam_position[1] + self.webcam_size[1] + 8
+            # Calculate the x-coordinate to center the text below the webcam
+            result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
+            result_y = self.webcam_position[1] + self.webcam_size[1] + 8
 
-                self.game.screen.blit(result_surface, (result_x, result_y))
-                
-                # Display debug information if debug mode is enabled
-                if self.debug_mode and self.last_prediction is not None:
-                    debug_text = f"Prediction: {self.last_prediction}, Confidence: {self.last_confidence:.2f}"
-                    debug_surface = self.game.font.render(debug_text, True, pygame.Color('yellow'))
-                    self.game.screen.blit(debug_surface, (result_x, result_y + 30))
+            text_rects.append(self.game.screen.blit(result_surface, (result_x, result_y)))
+            
+            # Display debug information if debug mode is enabled
+            if self.debug_mode and self.last_prediction is not None:
+                debug_text = f"Prediction: {self.last_prediction}, Confidence: {self.last_confidence:.2f}"
+                debug_surface = self.game.text.render(self.game.font, debug_text, True, pygame.Color('yellow'))
+                text_rects.append(self.game.screen.blit(debug_surface, (result_x, result_y + 30)))
 
-                # Convert the webcam frame to a surface and blit it
-                webcam_surface = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(webcam_frame, cv2.COLOR_BGR2RGB), self.webcam_size).swapaxes(0, 1))
-                self.game.screen.blit(webcam_surface, self.webcam_position)
+            # Blit the webcam frame prepared by the worker
+            self.game.screen.blit(self.webcam_surface, self.webcam_position)
 
         # Update and draw confetti particles
-        for particle in self.confetti_particles[:]:
-            particle.fall()
-            particle.draw(self.game.screen)
-            
-            # Remove particles that fall off screen
-            if particle.y > 600:
-                self.confetti_particles.remove(particle)
+        confetti_rect = self.confetti_particles.step(self.game.screen) if self.confetti_particles else None
         
         # Check if celebration has ended (no more confetti particles)
         if self.confetti_triggered and len(self.confetti_particles) == 0:
@@ -1613,22 +1670,11 @@ class AlphabetDisplayState(State):
         elif self.hovered_button == self.prev_button_collision:
             pygame.draw.rect(self.game.screen, (0, 255, 0), self.prev_button_collision, 3)
 
+        report_lesson_regions(self, confetti_rect, text_rects)
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            if self.back_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.back_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.back_button_collision
-            elif self.next_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.next_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.next_button_collision
-            elif self.prev_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.prev_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.prev_button_collision
-            else:
-                self.hovered_button = None
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
                 
         # Toggle debug mode with 'D' key
         if event.type == pygame.KEYDOWN:
@@ -1637,35 +1683,11 @@ class AlphabetDisplayState(State):
                 print(f"Debug mode {'enabled' if self.debug_mode else 'disabled'}")
 
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_alphabets")  # Return to alphabet selection
-            elif self.next_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                # Find the next letter in sequence
-                if self.game.current_state_name in self.game.alphabet_sequence:
-                    current_index = self.game.alphabet_sequence.index(self.game.current_state_name)
-                    if current_index < len(self.game.alphabet_sequence) - 1:
-                        next_state = self.game.alphabet_sequence[current_index + 1]
-                    else:
-                        next_state = "playing_alphabets"  # Return to alphabet selection if last letter is reached
-                else:
-                    next_state = "playing_alphabets"  # Default fallback
-
-                self.game.change_state(next_state)
-            elif self.prev_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                # Find the previous letter in sequence
-                if self.game.current_state_name in self.game.alphabet_sequence:
-                    current_index = self.game.alphabet_sequence.index(self.game.current_state_name)
-                    if current_index > 0:
-                        prev_state = self.game.alphabet_sequence[current_index - 1]
-                    else:
-                        prev_state = "playing_alphabets"  # Return to alphabet selection if first letter is reached
-                else:
-                    prev_state = "playing_alphabets"  # Default fallback
+            self.widgets.click(event.pos)  # Back returns to the menu; next and previous walk the sequence
 
-                self.game.change_state(prev_state)
+    def step_lesson(self, step):
+        """Move step places along the lesson sequence, back to the menu past either end"""
+        self.game.change_state(sequence_step(self.game.alphabet_sequence, self.game.current_state_name, step, "playing_alphabets"))
 
     def save_progress(self):
         """Save the progress of the current profile"""
@@ -1692,6 +1714,8 @@ class AlphabetDisplayState(State):
                 print(f"Progress saved for letter: {self.expected_letter} in Galaxy Explorer")
 
 class GalaxyExplorerNumberState(VideoState):
+    loop_video = True
+
     def __init__(self, game, video_key, next_state=None, audio_file=None):
         super().__init__(game, video_key, next_state, audio_file)
         
@@ -1709,18 +1733,20 @@ class GalaxyExplorerNumberState(VideoState):
 
         for gnum, state in button_data:
             full_path = resource_path(os.path.join(gnum_path, gnum))   # single wrap
-            btn_surface = pygame.image.load(full_path).convert_alpha()
+            btn_surface = self.game.assets.image(full_path)
             btn_rect = btn_surface.get_rect()
-            collision_rect = get_collision_rect(btn_surface)
+            collision_rect = self.game.assets.collision_rect(btn_surface)
             self.buttons.append((btn_surface, btn_rect, collision_rect, state))
 
         # Add back button
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
         
         self.last_frame = None
         self.hovered_button = None
+        self.button_layer = UILayer((1024, 600), self.draw_buttons)
+        self.widgets = self.button_widgets("playing_galaxy")
 
     def enter(self):
         super().enter()
@@ -1731,83 +1757,60 @@ class GalaxyExplorerNumberState(VideoState):
     def update(self):
         ret, frame = self.game.videos[self.video_key].read()
         if ret:
-            self.game.screen.blit(
-                pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1)), 
-                (0, 0)
-            )
+            self.game.screen.blit(frame, (0, 0))
 
             # Draw buttons
-            for image, rect, collision_rect, _ in self.buttons:
-                self.game.screen.blit(image, rect.topleft)
-                if collision_rect == self.hovered_button:
-                    pygame.draw.rect(self.game.screen, (0, 255, 0), collision_rect, 3)
-
-            # Draw back button
-            self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
-            if self.hovered_button == self.back_button_collision:
-                pygame.draw.rect(self.game.screen, (0, 255, 0), self.back_button_collision, 3)
+            self.button_layer.blit(self.game.screen, self.hovered_button)
                 
         else:
             # If video ends, loop it
-            self.game.videos[self.video_key].set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.game.videos[self.video_key].restart(loop=True)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            hovered = None
-            for _, _, collision_rect, _ in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    hovered = collision_rect
-                    break
-
-            if self.back_button_collision.collidepoint(event.pos):
-                hovered = self.back_button_collision
-
-            if hovered and hovered != self.hovered_button:
-                pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-
-            self.hovered_button = hovered
-
+            # One grid lookup resolves the category and back buttons
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
+        
         if event.type == pygame.MOUSEBUTTONDOWN:
-            for _, _, collision_rect, state in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    self.game.change_state(state)
-                    return
-
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_galaxy")
+            state = self.widgets.click(event.pos)  # The back button switches screens itself
+            if state:
+                self.game.change_state(state)
 
 class NumberDisplayState(State):
+    partial_updates = True  # webcam, result text, confetti and hover are reported each frame
+    redraw_events = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+
     def __init__(self, game, image_path, expected_number, webcam_position=(700, 150), webcam_size=(300, 225)):
         super().__init__(game)
-        self.original_image = pygame.image.load(image_path).convert_alpha()
-
-        # Scale the image to fit within 1024x600 while maintaining aspect ratio
-        self.image = pygame.transform.smoothscale(self.original_image, self.get_scaled_dimensions(self.original_image, 1024, 600))
-        self.image_rect = self.image.get_rect(center=(1024 // 2, 600 // 2))  # Center the image
+        # Lesson art is fetched from the asset cache on enter() and let go on exit()
+        self.image_path = image_path
+        self.image = None
+        self.image_rect = None
 
         # Add confetti-related attributes
         self.confetti_particles = []
         self.confetti_triggered = False
 
-        # Load confetti sound effect
-        self.confetti_sound = pygame.mixer.Sound(resource_path("AUDIO/CELEB.mp3"))
-
         # Back button (Initialize once)
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
 
         # Next button
-        self.next_button_img = pygame.image.load(resource_path("BUTTONS/NXT.png")).convert_alpha()
+        self.next_button_img = self.game.assets.image("BUTTONS/NXT.png")
         self.next_button_rect = self.next_button_img.get_rect()  # Position at top right
-        self.next_button_collision = get_collision_rect(self.next_button_img)
+        self.next_button_collision = self.game.assets.collision_rect(self.next_button_img)
 
         # Previous button
-        self.prev_button_img = pygame.image.load(resource_path("BUTTONS/PREV.png")).convert_alpha()
+        self.prev_button_img = self.game.assets.image("BUTTONS/PREV.png")
         self.prev_button_rect = self.prev_button_img.get_rect()  # Position at top left
-        self.prev_button_collision = get_collision_rect(self.prev_button_img)
+        self.prev_button_collision = self.game.assets.collision_rect(self.prev_button_img)
+
+        # Hover and clicks are resolved through one grid lookup; back, next and previous in that priority
+        self.widgets = Widgets(self.game)
+        self.widgets.add(self.back_button_collision, on_click=lambda: self.game.change_state("playing_numbers"))
+        self.widgets.add(self.next_button_collision, on_click=lambda: self.step_lesson(1))
+        self.widgets.add(self.prev_button_collision, on_click=lambda: self.step_lesson(-1))
 
         self.last_frame = None
         self.hovered_button = None
@@ -1817,16 +1820,13 @@ class NumberDisplayState(State):
         self.webcam_size = (350, 263)
         self.webcam = None  # Initialize webcam as None
 
-        # Load the TFLite model
-        self.interpreter = tflite.Interpreter(model_path=resource_path("MODEL/asl_number_classifier.tflite"))
-        self.interpreter.allocate_tensors()
-        self.input_details = self.interpreter.get_input_details()
-        self.output_details = self.interpreter.get_output_details()
+        # Shared TFLite model (one interpreter per model file)
+        self.classifier = self.game.models.get("MODEL/asl_number_classifier.tflite")
 
         # Mediapipe Hands setup
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(static_image_mode=False, max_num_hands=1, min_detection_confidence=0.5)
+        self.mp_hands = mp.solutions.hands  # Graph itself is shared via game.tracker
         self.mp_drawing = mp.solutions.drawing_utils
+        self.landmark_adapter = LandmarkAdapter()  # Reusable model-input buffers for the worker
 
         # Label map
         self.labels = [str(i) for i in range(10)]
@@ -1838,115 +1838,135 @@ class NumberDisplayState(State):
         # Expected number for this state
         self.expected_number = expected_number
 
-    def get_scaled_dimensions(self, image, max_width, max_height):
-        """Returns new dimensions for the image while maintaining aspect ratio"""
-        img_width, img_height = image.get_size()
-        scale_factor = min(max_width / img_width, max_height / img_height)
-        return int(img_width * scale_factor), int(img_height * scale_factor)
+    def successors(self):
+        return sequence_neighbours(self.game.number_sequence, self.game.current_state_name)
 
     def enter(self):
-        self.webcam = cv2.VideoCapture(0, cv2.CAP_DSHOW)  # Initialize webcam
+        # Scaled to fit within 1024x600 while maintaining aspect ratio, and centered
+        self.image = self.game.assets.image(self.image_path, evictable=True, fit=(1024, 600))
+        self.image_rect = self.image.get_rect(center=(1024 // 2, 600 // 2))
+        self.webcam = self.game.camera.subscribe(self)  # Shared, already-open webcam
         self.correct = False
         self.start_time = None
         self.confetti_triggered = False
         self.confetti_particles = []
+        self.webcam_surface = None
+        self.last_result_sequence = 0
+        self.game.recognition.start(self.process_frame)
 
     def exit(self):
+        self.game.recognition.stop()
         if self.webcam:
-            self.webcam.release()  # Release the webcam
+            self.game.camera.unsubscribe(self)  # Camera stays open for the next state
             self.webcam = None
+        self.image = None  # The asset cache owns the art, so evicting it frees the memory
+
+    def process_frame(self, webcam_frame):
+        """Runs on the recognition worker: hand landmarks, classification and overlay"""
+        # Flip the webcam frame horizontally to mirror it
+        webcam_frame = cv2.flip(webcam_frame, 1)
+        h, w, _ = webcam_frame.shape
+        roi = webcam_frame[:, w//2:]  # Right side ROI
+        roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
+        result = self.game.tracker.process_hands(roi_rgb)
+
+        prediction = None
+        confidence = None
+
+        # Only process hand landmarks if no celebration is active
+        if result.multi_hand_landmarks and not self.confetti_triggered:
+            for hand_landmarks in result.multi_hand_landmarks:
+                # x, y and z coordinates, as a (1, 63) view into the adapter's buffer
+                input_data = self.landmark_adapter.hand(hand_landmarks, dims=3)
+                
+                # Ensure the input data has the correct shape
+                if input_data.shape[1] == self.classifier.input_shape[1]:
+                    # Perform inference
+                    output_data = self.classifier.predict(input_data)
+                    index = np.argmax(output_data)
+                    prediction = self.labels[index]
+                    confidence = output_data[0][index]
+
+                # Draw landmarks
+                self.mp_drawing.draw_landmarks(
+                    roi, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
+                    self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
+                    self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
+                )
+
+        return {
+            "frame": webcam_frame,
+            "hands": bool(result.multi_hand_landmarks),
+            "landmarks": result.multi_hand_landmarks,
+            "prediction": prediction,
+            "confidence": confidence
+        }
+
+    def apply_result(self, result):
+        """Runs on the main thread: turn a worker result into lesson progress"""
+        if result["hands"] and not self.confetti_triggered:
+            if result["prediction"] is not None:
+                if result["confidence"] >= 0.70 and result["prediction"] == str(self.expected_number):
+                    self.correct = True
+                    if self.start_time is None:
+                        self.start_time = time.time()  # Start the timer
+                        self.save_progress()  # Save progress when correct
+
+                        # Trigger confetti effect when correct sign is made
+                        if not self.confetti_triggered:
+                            self.confetti_particles = self.game.confetti.burst(100)
+                            self.confetti_triggered = True
+                            self.game.sfx.play("celebrate")  # Play confetti sound when triggered
+                else:
+                    # Only set to false if we're not in celebration mode
+                    if not self.confetti_triggered:
+                        self.correct = False
+        elif self.confetti_triggered:
+            # We're in celebration mode, keep the correct state
+            pass
+        else:
+            # No hand landmarks detected and not in celebration
+            self.correct = None
+
+    def pacing(self):
+        # Follow the camera, but keep a steady rate while confetti falls
+        return 30 if self.confetti_particles else PACE_CAMERA
 
     def update(self):
         self.game.screen.fill((0, 0, 0))  # Clear screen
         self.game.screen.blit(self.image, self.image_rect.topleft)  # Centered display
 
+        # Pick up the newest result published by the recognition worker
+        result = self.game.recognition.latest()
+        if result is not None and result["sequence"] != self.last_result_sequence:
+            self.last_result_sequence = result["sequence"]
+            self.apply_result(result)
+            self.webcam_surface = self.game.presenter.present(result["frame"], self.webcam_size)
+
+        text_rects = []  # Where the result/debug text lands, for game.dirty
         # Update webcam feed
-        if self.webcam:
-            ret, webcam_frame = self.webcam.read()
-            if ret:
-                # Flip the webcam frame horizontally to mirror it
-                webcam_frame = cv2.flip(webcam_frame, 1)
-                h, w, _ = webcam_frame.shape
-                roi = webcam_frame[:, w//2:]  # Right side ROI
-                roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
-                result = self.hands.process(roi_rgb)
-
-                # Only process hand landmarks if no celebration is active
-                if result.multi_hand_landmarks and not self.confetti_triggered:
-                    for hand_landmarks in result.multi_hand_landmarks:
-                        landmarks = []
-                        for lm in hand_landmarks.landmark:
-                            landmarks.extend([lm.x, lm.y, lm.z])  # Use x, y, and z coordinates
-                        
-                        # Convert landmarks to NumPy array and reshape
-                        input_data = np.array(landmarks, dtype=np.float32).reshape(1, -1)
-                        
-                        # Ensure the input data has the correct shape
-                        if input_data.shape[1] == self.input_details[0]['shape'][1]:
-                            # Perform inference
-                            self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
-                            self.interpreter.invoke()
-                            output_data = self.interpreter.get_tensor(self.output_details[0]['index'])
-                            prediction = np.argmax(output_data)
-                            
-                            confidence = output_data[0][prediction]
-                            if confidence >= 0.70 and self.labels[prediction] == str(self.expected_number):
-                                self.correct = True
-                                if self.start_time is None:
-                                    self.start_time = time.time()  # Start the timer
-                                    self.save_progress()  # Save progress when correct
-
-                                    # Trigger confetti effect when correct sign is made
-                                    if not self.confetti_triggered:
-                                        self.confetti_particles = [Confetti(1024, 600) for _ in range(100)]
-                                        self.confetti_triggered = True
-                                        self.confetti_sound.play()  # Play confetti sound when triggered
-                            else:
-                                # Only set to false if we're not in celebration mode
-                                if not self.confetti_triggered:
-                                    self.correct = False
-
-                        # Draw landmarks
-                        self.mp_drawing.draw_landmarks(
-                            roi, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
-                            self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
-                            self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
-                        )
-                elif self.confetti_triggered:
-                    # We're in celebration mode, keep the correct state
-                    pass
-                else:
-                    # No hand landmarks detected and not in celebration
-                    self.correct = None
-
-                # Display result
-                if self.correct is True:
-                    result_text = "Correct"
-                elif self.correct is False:
-                    result_text = "Try Again"  # Display "Try Again" only if a wrong gesture is performed
-                else:
-                    result_text = ""  # No gesture detected, display nothing
+        if self.webcam_surface is not None:
+            # Display result
+            if self.correct is True:
+                result_text = "Correct"
+            elif self.correct is False:
+                result_text = "Try Again"  # Display "Try Again" only if a wrong gesture is performed
+            else:
+                result_text = ""  # No gesture detected, display nothing
 
-                result_surface = self.game.font.render(result_text, True, pygame.Color('white'))
+            result_surface = self.game.text.render(self.game.font, result_text, True, pygame.Color('white'))
 
-                # Calculate the x-coordinate to center the text below the webcam
-                result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
-                result_y = self.webcam_position[1] + self.webcam_size[1] + 8
+            # Calculate the x-coordinate to center the text below the webcam
+            result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
+            result_y = self.webcam_position[1] + self.webcam_size[1] + 8
 
-                self.game.screen.blit(result_surface, (result_x, result_y))
+            text_rects.append(self.game.screen.blit(result_surface, (result_x, result_y)))
 
-                # Convert the webcam frame to a surface and blit it
-                webcam_surface = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(webcam_frame, cv2.COLOR_BGR2RGB), self.webcam_size).swapaxes(0, 1))
-                self.game.screen.blit(webcam_surface, self.webcam_position)
+            # Blit the webcam frame prepared by the worker
+            self.game.screen.blit(self.webcam_surface, self.webcam_position)
 
         # Update and draw confetti particles
-        for particle in self.confetti_particles[:]:
-            particle.fall()
-            particle.draw(self.game.screen)
-            
-            # Remove particles that fall off screen
-            if particle.y > 600:
-                self.confetti_particles.remove(particle)
+        confetti_rect = self.confetti_particles.step(self.game.screen) if self.confetti_particles else None
         
         # Check if celebration has ended (no more confetti particles)
         if self.confetti_triggered and len(self.confetti_particles) == 0:
@@ -1971,53 +1991,18 @@ class NumberDisplayState(State):
         elif self.hovered_button == self.prev_button_collision:
             pygame.draw.rect(self.game.screen, (0, 255, 0), self.prev_button_collision, 3)
 
+        report_lesson_regions(self, confetti_rect, text_rects)
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            if self.back_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.back_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.back_button_collision
-            elif self.next_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.next_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.next_button_collision
-            elif self.prev_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.prev_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.prev_button_collision
-            else:
-                self.hovered_button = None
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
 
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_numbers")  # Return to number selection
-            elif self.next_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                # Find the next number in sequence
-                if self.game.current_state_name in self.game.number_sequence:
-                    current_index = self.game.number_sequence.index(self.game.current_state_name)
-                    if current_index < len(self.game.number_sequence) - 1:
-                        next_state = self.game.number_sequence[current_index + 1]
-                    else:
-                        next_state = "playing_numbers"  # Return to number selection if last number is reached
-                else:
-                    next_state = "playing_numbers"  # Default fallback
-
-                self.game.change_state(next_state)
-            elif self.prev_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                # Find the previous number in sequence
-                if self.game.current_state_name in self.game.number_sequence:
-                    current_index = self.game.number_sequence.index(self.game.current_state_name)
-                    if current_index > 0:
-                        prev_state = self.game.number_sequence[current_index - 1]
-                    else:
-                        prev_state = "playing_numbers"  # Return to number selection if first number is reached
-                else:
-                    prev_state = "playing_numbers"  # Default fallback
+            self.widgets.click(event.pos)  # Back returns to the menu; next and previous walk the sequence
 
-                self.game.change_state(prev_state)
+    def step_lesson(self, step):
+        """Move step places along the lesson sequence, back to the menu past either end"""
+        self.game.change_state(sequence_step(self.game.number_sequence, self.game.current_state_name, step, "playing_numbers"))
 
     def save_progress(self):
         """Save the progress of the current profile"""
@@ -2044,6 +2029,8 @@ class NumberDisplayState(State):
                 print(f"Progress saved for number: {self.expected_number} in Galaxy Explorer")
 
 class GalaxyExplorerPhrasesstate(VideoState):
+    loop_video = True
+
     def __init__(self, game, video_key, next_state=None, audio_file=None):
         super().__init__(game, video_key, next_state, audio_file)
         
@@ -2056,18 +2043,20 @@ class GalaxyExplorerPhrasesstate(VideoState):
         ]
         
         for img_path, state in button_data:
-            img = pygame.image.load(resource_path(img_path)).convert_alpha()
+            img = self.game.assets.image(img_path)
             img_rect = img.get_rect()
-            collision_rect = get_collision_rect(img)
+            collision_rect = self.game.assets.collision_rect(img)
             self.buttons.append((img, img_rect, collision_rect, state))
         
         # Add back button
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
         
         self.last_frame = None
         self.hovered_button = None
+        self.button_layer = UILayer((1024, 600), self.draw_buttons)
+        self.widgets = self.button_widgets("playing_galaxy")
 
     def enter(self):
         super().enter()
@@ -2078,103 +2067,72 @@ class GalaxyExplorerPhrasesstate(VideoState):
     def update(self):
         ret, frame = self.game.videos[self.video_key].read()
         if ret:
-            self.last_frame = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (1024, 600)).swapaxes(0, 1))
+            self.last_frame = frame
             self.game.screen.blit(self.last_frame, (0, 0))
             
             # Draw buttons on top of the video frame
-            for image, rect, collision_rect, _ in self.buttons:
-                self.game.screen.blit(image, rect.topleft)
-                
-                # Highlight hovered button
-                if collision_rect == self.hovered_button:
-                    pygame.draw.rect(self.game.screen, (0, 255, 0), collision_rect, 3)
-            
-            # Draw back button
-            self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
-            if self.hovered_button == self.back_button_collision:
-                pygame.draw.rect(self.game.screen, (0, 255, 0), self.back_button_collision, 3)
+            self.button_layer.blit(self.game.screen, self.hovered_button)
         else:
             # If video ends, loop it
-            self.game.videos[self.video_key].set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.game.videos[self.video_key].restart(loop=True)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            # Check category buttons
-            hovered = None
-            for _, _, collision_rect, _ in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    hovered = collision_rect
-                    break
-            
-            # Check back button
-            if self.back_button_collision.collidepoint(event.pos):
-                hovered = self.back_button_collision
-            
-            # Play hover sound if we have a new hovered button
-            if hovered and hovered != self.hovered_button:
-                pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-            
-            self.hovered_button = hovered
+            # One grid lookup resolves the category and back buttons
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
         
         if event.type == pygame.MOUSEBUTTONDOWN:
-            # Check category buttons
-            for _, _, collision_rect, state in self.buttons:
-                if collision_rect.collidepoint(event.pos):
-                    pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                    # Transition to the appropriate state
-                    print(f"Button clicked: {state}")
-                    self.game.change_state(state)
-                    return
-            
-            # Check back button
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_galaxy")
+            state = self.widgets.click(event.pos)  # The back button switches screens itself
+            if state:
+                print(f"Button clicked: {state}")
+                self.game.change_state(state)
 
 class PhraseDisplayState(State):
+    partial_updates = True  # webcam, result text, confetti and hover are reported each frame
+    redraw_events = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+
     def __init__(self, game, image_path, expected_phrase, webcam_position=(700, 150), webcam_size=(300, 225)):
         super().__init__(game)
-        self.original_image = pygame.image.load(resource_path(image_path)).convert_alpha()
-
-        # Scale the image to fit within 1024x600 while maintaining aspect ratio
-        self.image = pygame.transform.smoothscale(self.original_image, self.get_scaled_dimensions(self.original_image, 1024, 600))
-        self.image_rect = self.image.get_rect(center=(1024 // 2, 600 // 2))  # Center the image
+        # Lesson art is fetched from the asset cache on enter() and let go on exit()
+        self.image_path = image_path
+        self.image = None
+        self.image_rect = None
 
         # Add confetti-related attributes
         self.confetti_particles = []
         self.confetti_triggered = False
 
-        # Load the TFLite model
-        self.interpreter = tflite.Interpreter(model_path=resource_path('MODEL/gesture_model.tflite'))
-        self.interpreter.allocate_tensors()
-        self.input_details = self.interpreter.get_input_details()
-        self.output_details = self.interpreter.get_output_details()
-
-        # Load confetti sound effect
-        self.confetti_sound = pygame.mixer.Sound(resource_path("AUDIO/CELEB.mp3"))
+        # Shared TFLite model (one interpreter per model file)
+        self.classifier = self.game.models.get("MODEL/gesture_model.tflite")
 
         # Back button (Initialize once)
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
 
         # Next button
-        self.next_button_img = pygame.image.load(resource_path("BUTTONS/NXT.png")).convert_alpha()
+        self.next_button_img = self.game.assets.image("BUTTONS/NXT.png")
         self.next_button_rect = self.next_button_img.get_rect()  # Position at top right
-        self.next_button_collision = get_collision_rect(self.next_button_img)
+        self.next_button_collision = self.game.assets.collision_rect(self.next_button_img)
 
         # Previous button
-        self.prev_button_img = pygame.image.load(resource_path("BUTTONS/PREV.png")).convert_alpha()
+        self.prev_button_img = self.game.assets.image("BUTTONS/PREV.png")
         self.prev_button_rect = self.prev_button_img.get_rect()  # Position at top left
-        self.prev_button_collision = get_collision_rect(self.prev_button_img)
+        self.prev_button_collision = self.game.assets.collision_rect(self.prev_button_img)
+
+        # Hover and clicks are resolved through one grid lookup; back, next and previous in that priority
+        self.widgets = Widgets(self.game)
+        self.widgets.add(self.back_button_collision, on_click=lambda: self.game.change_state("playing_phrases"))
+        self.widgets.add(self.next_button_collision, on_click=lambda: self.step_lesson(1))
+        self.widgets.add(self.prev_button_collision, on_click=lambda: self.step_lesson(-1))
 
         self.last_frame = None
         self.hovered_button = None
         
         # Mediapipe Holistic setup
-        self.mp_holistic = mp.solutions.holistic
-        self.holistic = self.mp_holistic.Holistic(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+        self.mp_holistic = mp.solutions.holistic  # Graph itself is shared via game.tracker
         self.mp_drawing = mp.solutions.drawing_utils
+        self.landmark_adapter = LandmarkAdapter()  # Reusable model-input buffers for the worker
 
         # Webcam feed parameters
         self.webcam_position = (600, 152)
@@ -2182,12 +2140,13 @@ class PhraseDisplayState(State):
         self.webcam = None  # Initialize webcam as None
 
         # Initialize sequence and gesture recognition variables
-        self.sequence = []
         self.sequence_length = 30
-        self.predictions = []
+        self.sequence = SequenceWindow(self.sequence_length)  # Sliding (30, 258) keypoint window
+        self.predictions = PredictionStreak()  # Same phrase predicted in a row
+        self.visit = 0  # Bumped by enter(); the worker starts a fresh sequence when it changes
+        self.sequence_visit = None  # visit the sequence was collected for
         self.threshold = 0.85
         self.min_consecutive_predictions = 5
-        self.prediction_history_size = 15
         self.confidence_threshold = 0.90
 
         # Expected phrase for this state
@@ -2205,39 +2164,41 @@ class PhraseDisplayState(State):
             'sorry': 'SORRY'
         }
 
-    def get_scaled_dimensions(self, image, max_width, max_height):
-        """Returns new dimensions for the image while maintaining aspect ratio"""
-        img_width, img_height = image.get_size()
-        scale_factor = min(max_width / img_width, max_height / img_height)
-        return int(img_width * scale_factor), int(img_height * scale_factor)
+    def successors(self):
+        return sequence_neighbours(self.game.phrase_sequence, self.game.current_state_name)
 
     def enter(self):
-        self.webcam = cv2.VideoCapture(0, cv2.CAP_DSHOW)  # Initialize webcam
+        # Scaled to fit within 1024x600 while maintaining aspect ratio, and centered
+        self.image = self.game.assets.image(self.image_path, evictable=True, fit=(1024, 600))
+        self.image_rect = self.image.get_rect(center=(1024 // 2, 600 // 2))
+        self.webcam = self.game.camera.subscribe(self)  # Shared, already-open webcam
         self.correct = False
         self.start_time = None
         self.confetti_triggered = False
         self.confetti_particles = []
-        self.sequence = []
-        self.predictions = []
+        self.visit += 1  # The worker owns the sequence; it resets it when it sees the new visit
+        self.webcam_surface = None
+        self.last_result_sequence = 0
+        self.game.recognition.start(self.process_frame)
 
     def exit(self):
+        self.game.recognition.stop()
         if self.webcam:
-            self.webcam.release()  # Release the webcam
+            self.game.camera.unsubscribe(self)  # Camera stays open for the next state
             self.webcam = None
+        self.image = None  # The asset cache owns the art, so evicting it frees the memory
 
     def mediapipe_detection(self, image):
         image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         image.flags.writeable = False
-        results = self.holistic.process(image)
+        results = self.game.tracker.process_holistic(image)
         image.flags.writeable = True
         image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
         return image, results
 
     def extract_keypoints(self, results):
-        pose = np.array([[res.x, res.y, res.z, res.visibility] for res in results.pose_landmarks.landmark]).flatten() if results.pose_landmarks else np.zeros(33*4)
-        lh = np.array([[res.x, res.y, res.z] for res in results.left_hand_landmarks.landmark]).flatten() if results.left_hand_landmarks else np.zeros(21*3)
-        rh = np.array([[res.x, res.y, res.z] for res in results.right_hand_landmarks.landmark]).flatten() if results.right_hand_landmarks else np.zeros(21*3)
-        return np.concatenate([pose, lh, rh])
+        """258 keypoints as a view into the adapter's buffer (valid until the next frame)"""
+        return self.landmark_adapter.holistic(results)
 
     def has_hands(self, results):
         return results.left_hand_landmarks is not None or results.right_hand_landmarks is not None
@@ -2246,106 +2207,122 @@ class PhraseDisplayState(State):
         hand_points = keypoints[-126:]  # Get hand keypoints (last 126 values)
         return np.mean(np.abs(hand_points)) > threshold
 
-    def update(self):
-        self.game.screen.fill((0, 0, 0))  # Clear screen
-        self.game.screen.blit(self.image, self.image_rect.topleft)  # Centered display
+    def process_frame(self, frame):
+        """Runs on the recognition worker: holistic landmarks, sequence model and overlay"""
+        # A call from the previous visit may still have been pushing; start this one clean
+        if self.sequence_visit != self.visit:
+            self.sequence.clear()
+            self.predictions.clear()
+            self.sequence_visit = self.visit
 
-        # Update webcam feed
-        if self.webcam:
-            ret, frame = self.webcam.read()
-            if ret:
-                # Flip the webcam frame horizontally
-                frame = cv2.flip(frame, 1)
-                
-                # Make detections
-                image, results = self.mediapipe_detection(frame)
+        # Flip the webcam frame horizontally
+        frame = cv2.flip(frame, 1)
+        
+        # Make detections
+        image, results = self.mediapipe_detection(frame)
+
+        prediction = None
+        confidence = None
+        
+        # Process frames for gesture recognition
+        if self.has_hands(results) and not self.confetti_triggered:
+            keypoints = self.extract_keypoints(results)
+            
+            if self.detect_motion(keypoints):
+                self.sequence.push(keypoints)
                 
-                # Process frames for gesture recognition
-                if self.has_hands(results) and not self.confetti_triggered:
-                    keypoints = self.extract_keypoints(results)
-                    
-                    if self.detect_motion(keypoints):
-                        self.sequence.append(keypoints)
-                        self.sequence = self.sequence[-self.sequence_length:]
+                if self.sequence.full:
+                    try:
+                        # Normalized (1, 30, 258) window, updated incrementally
+                        input_data = self.sequence.normalized()
+
+                        # Run inference and get prediction results
+                        res = self.classifier.predict(input_data)[0]
+                        max_prob = res[np.argmax(res)]
                         
-                        if len(self.sequence) == self.sequence_length:
-                            try:
-                                # Prepare input data
-                                input_data = np.array(self.sequence, dtype=np.float32)
-                                input_data = (input_data - np.mean(input_data)) / (np.std(input_data) + 1e-6)
-                                input_data = np.expand_dims(input_data, axis=0)
-
-                                # Set the tensor and run inference
-                                self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
-                                self.interpreter.invoke()
-                                
-                                # Get prediction results
-                                res = self.interpreter.get_tensor(self.output_details[0]['index'])[0]
-                                max_prob = res[np.argmax(res)]
+                        if max_prob > self.threshold:
+                            streak = self.predictions.push(self.actions[np.argmax(res)])
+                            
+                            if (streak >= self.min_consecutive_predictions and 
+                                max_prob > self.confidence_threshold):
                                 
-                                if max_prob > self.threshold:
-                                    prediction = self.actions[np.argmax(res)]
-                                    self.predictions.append(prediction)
-                                    
-                                    if len(self.predictions) > self.prediction_history_size:
-                                        self.predictions = self.predictions[-self.prediction_history_size:]
-                                    
-                                    if (len(self.predictions) >= self.min_consecutive_predictions and 
-                                        len(set(self.predictions[-self.min_consecutive_predictions:])) == 1 and 
-                                        max_prob > self.confidence_threshold):
-                                        
-                                        current_pred = self.predictions[-1]
-                                        # Map the prediction to expected format using the mapping dictionary
-                                        mapped_pred = self.phrase_mapping.get(current_pred, current_pred.upper())
-                                        
-                                        if mapped_pred == self.expected_phrase:
-                                            self.correct = True
-                                            if not self.confetti_triggered:
-                                                self.confetti_particles = [Confetti(1024, 600) for _ in range(100)]
-                                                self.confetti_triggered = True
-                                                self.confetti_sound.play()
-                                                self.save_progress()
-                                        else:
-                                            self.correct = False
-                                    
-                            except Exception as e:
-                                print(f"Inference error: {e}")
+                                current_pred = self.predictions.label
+                                # Map the prediction to expected format using the mapping dictionary
+                                prediction = self.phrase_mapping.get(current_pred, current_pred.upper())
+                                confidence = max_prob
+                        
+                    except Exception as e:
+                        print(f"Inference error: {e}")
+
+        # Draw landmarks
+        if results.pose_landmarks:
+            self.mp_drawing.draw_landmarks(
+                image, results.pose_landmarks, self.mp_holistic.POSE_CONNECTIONS)
+        if results.left_hand_landmarks:
+            self.mp_drawing.draw_landmarks(
+                image, results.left_hand_landmarks, self.mp_holistic.HAND_CONNECTIONS)
+        if results.right_hand_landmarks:
+            self.mp_drawing.draw_landmarks(
+                image, results.right_hand_landmarks, self.mp_holistic.HAND_CONNECTIONS)
+
+        return {
+            "frame": image,
+            "hands": self.has_hands(results),
+            "landmarks": results,
+            "prediction": prediction,
+            "confidence": confidence
+        }
 
-                # Draw landmarks
-                if results.pose_landmarks:
-                    self.mp_drawing.draw_landmarks(
-                        image, results.pose_landmarks, self.mp_holistic.POSE_CONNECTIONS)
-                if results.left_hand_landmarks:
-                    self.mp_drawing.draw_landmarks(
-                        image, results.left_hand_landmarks, self.mp_holistic.HAND_CONNECTIONS)
-                if results.right_hand_landmarks:
-                    self.mp_drawing.draw_landmarks(
-                        image, results.right_hand_landmarks, self.mp_holistic.HAND_CONNECTIONS)
+    def apply_result(self, result):
+        """Runs on the main thread: turn a worker result into lesson progress"""
+        if result["prediction"] is None or self.confetti_triggered:
+            return
 
-                # Display result
-                if self.correct is True:
-                    result_text = "Correct"
-                elif self.correct is False:
-                    result_text = "Try Again"
-                else:
-                    result_text = ""
+        if result["prediction"] == self.expected_phrase:
+            self.correct = True
+            self.confetti_particles = self.game.confetti.burst(100)
+            self.confetti_triggered = True
+            self.game.sfx.play("celebrate")
+            self.save_progress()
+        else:
+            self.correct = False
+
+    def pacing(self):
+        # Follow the camera, but keep a steady rate while confetti falls
+        return 30 if self.confetti_particles else PACE_CAMERA
 
-                result_surface = self.game.font.render(result_text, True, pygame.Color('white'))
-                result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
-                result_y = self.webcam_position[1] + self.webcam_size[1] + 8
-                self.game.screen.blit(result_surface, (result_x, result_y))
+    def update(self):
+        self.game.screen.fill((0, 0, 0))  # Clear screen
+        self.game.screen.blit(self.image, self.image_rect.topleft)  # Centered display
 
-                # Display webcam feed
-                webcam_surface = pygame.surfarray.make_surface(
-                    cv2.resize(cv2.cvtColor(image, cv2.COLOR_BGR2RGB), self.webcam_size).swapaxes(0, 1))
-                self.game.screen.blit(webcam_surface, self.webcam_position)
+        # Pick up the newest result published by the recognition worker
+        result = self.game.recognition.latest()
+        if result is not None and result["sequence"] != self.last_result_sequence:
+            self.last_result_sequence = result["sequence"]
+            self.apply_result(result)
+            self.webcam_surface = self.game.presenter.present(result["frame"], self.webcam_size)
+
+        text_rects = []  # Where the result/debug text lands, for game.dirty
+        # Update webcam feed
+        if self.webcam_surface is not None:
+            # Display result
+            if self.correct is True:
+                result_text = "Correct"
+            elif self.correct is False:
+                result_text = "Try Again"
+            else:
+                result_text = ""
+
+            result_surface = self.game.text.render(self.game.font, result_text, True, pygame.Color('white'))
+            result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
+            result_y = self.webcam_position[1] + self.webcam_size[1] + 8
+            text_rects.append(self.game.screen.blit(result_surface, (result_x, result_y)))
+
+            # Display webcam feed
+            self.game.screen.blit(self.webcam_surface, self.webcam_position)
 
         # Update and draw confetti particles
-        for particle in self.confetti_particles[:]:
-            particle.fall()
-            particle.draw(self.game.screen)
-            if particle.y > 600:
-                self.confetti_particles.remove(particle)
+        confetti_rect = self.confetti_particles.step(self.game.screen) if self.confetti_particles else None
         
         # Check if celebration has ended
         if self.confetti_triggered and len(self.confetti_particles) == 0:
@@ -2362,49 +2339,18 @@ class PhraseDisplayState(State):
         if self.hovered_button:
             pygame.draw.rect(self.game.screen, (0, 255, 0), self.hovered_button, 3)
 
+        report_lesson_regions(self, confetti_rect, text_rects)
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            if self.back_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.back_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.back_button_collision
-            elif self.next_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.next_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.next_button_collision
-            elif self.prev_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.prev_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.prev_button_collision
-            else:
-                self.hovered_button = None
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
 
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_phrases")
-            elif self.next_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                if self.game.current_state_name in self.game.phrase_sequence:
-                    current_index = self.game.phrase_sequence.index(self.game.current_state_name)
-                    if current_index < len(self.game.phrase_sequence) - 1:
-                        next_state = self.game.phrase_sequence[current_index + 1]
-                    else:
-                        next_state = "playing_phrases"
-                else:
-                    next_state = "playing_phrases"
-                self.game.change_state(next_state)
-            elif self.prev_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                if self.game.current_state_name in self.game.phrase_sequence:
-                    current_index = self.game.phrase_sequence.index(self.game.current_state_name)
-                    if current_index > 0:
-                        prev_state = self.game.phrase_sequence[current_index - 1]
-                    else:
-                        prev_state = "playing_phrases"
-                else:
-                    prev_state = "playing_phrases"
-                self.game.change_state(prev_state)
+            self.widgets.click(event.pos)  # Back returns to the menu; next and previous walk the sequence
+
+    def step_lesson(self, step):
+        """Move step places along the lesson sequence, back to the menu past either end"""
+        self.game.change_state(sequence_step(self.game.phrase_sequence, self.game.current_state_name, step, "playing_phrases"))
 
     def save_progress(self):
         if self.game.current_profile:
@@ -2434,27 +2380,20 @@ class CosmicCopyState(State):
         self.current_item = None
         self.expected_value = None
 
-        # Load the TFLite models
-        self.alphabet_model = tflite.Interpreter(model_path=resource_path("MODEL/asl_mlp_model_v2.tflite"))
-        self.alphabet_model.allocate_tensors()
-        self.number_model = tflite.Interpreter(model_path=resource_path("MODEL/asl_number_classifier.tflite"))
-        self.number_model.allocate_tensors()
-        self.phrase_model = tflite.Interpreter(model_path=resource_path("MODEL/gesture_model.tflite"))
-        self.phrase_model.allocate_tensors()
-        
-        # Input/output details for phrase model
-        self.phrase_input_details = self.phrase_model.get_input_details()
-        self.phrase_output_details = self.phrase_model.get_output_details()
+        # Shared TFLite models (the same interpreters the lesson states use)
+        self.alphabet_model = self.game.models.get("MODEL/asl_mlp_model_v2.tflite")
+        self.number_model = self.game.models.get("MODEL/asl_number_classifier.tflite")
+        self.phrase_model = self.game.models.get("MODEL/gesture_model.tflite")
 
         # Mediapipe setup for hand recognition (for alphabet and numbers)
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(static_image_mode=False, max_num_hands=1, min_detection_confidence=0.5)
         
         # Mediapipe Holistic setup (for phrases)
         self.mp_holistic = mp.solutions.holistic
-        self.holistic = self.mp_holistic.Holistic(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+        # Both graphs are shared via game.tracker
         
         self.mp_drawing = mp.solutions.drawing_utils
+        self.landmark_adapter = LandmarkAdapter()  # Reusable model-input buffers for the worker
 
         # Load the labels
         self.alphabet_labels = [chr(i) for i in range(ord('A'), ord('Z') + 1)]
@@ -2462,9 +2401,11 @@ class CosmicCopyState(State):
         self.phrase_labels = ['hello', 'thankyou', 'iloveyou', 'sorry']
 
         # Back button
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
+        self.widgets = Widgets(self.game)
+        self.widgets.add(self.back_button_collision, on_click=self.leave)
 
         self.hovered_button = None
         self.webcam = None  # Initialize webcam as None
@@ -2477,9 +2418,6 @@ class CosmicCopyState(State):
         self.confetti_particles = []
         self.confetti_triggered = False
         
-        # Load confetti sound effect
-        self.confetti_sound = pygame.mixer.Sound(resource_path("AUDIO/CELEB.mp3"))
-
         # Webcam feed parameters
         self.webcam_position = (600, 152)
         self.webcam_size = (350, 263)
@@ -2487,32 +2425,36 @@ class CosmicCopyState(State):
         # Track recently used items to prevent repeats
         self.recent_items = {"alphabet": [], "number": [], "phrase": []}
         self.last_category = None
+        self.item_id = 0  # Bumped on every new item so stale worker results can be dropped
         
         # Sequence variables for phrase recognition (same as in PhraseDisplayState)
-        self.sequence = []
         self.sequence_length = 30
-        self.predictions = []
+        self.sequence = SequenceWindow(self.sequence_length)  # Sliding (30, 258) keypoint window
+        self.predictions = PredictionStreak()  # Same phrase predicted in a row
         self.threshold = 0.85
         self.min_consecutive_predictions = 5
-        self.prediction_history_size = 15
         self.confidence_threshold = 0.90
         self.phrase_actions = np.array(['hello', 'thanks', 'iloveyou', 'sorry'])
+        self.sequence_item = None  # item_id the phrase sequence was collected for
 
     def enter(self):
-        self.webcam = cv2.VideoCapture(0, cv2.CAP_DSHOW)  # Initialize webcam
+        self.webcam = self.game.camera.subscribe(self)  # Shared, already-open webcam
         self.randomize_item()
         self.correct = False
         self.start_time = None
         self.confetti_particles = []  # Reset confetti particles
         self.confetti_triggered = False
-        # Reset sequence and predictions for phrase recognition
-        self.sequence = []
-        self.predictions = []
+        # The new item_id from randomize_item() makes the worker reset the phrase sequence
+        self.webcam_surface = None
+        self.last_result_sequence = 0
+        self.game.recognition.start(self.process_frame)
 
     def exit(self):
+        self.game.recognition.stop()
         if self.webcam:
-            self.webcam.release()  # Release the webcam
+            self.game.camera.unsubscribe(self)  # Camera stays open for the next state
             self.webcam = None
+        self.current_item = None  # Picked again on enter(); the asset cache owns the art
 
     def randomize_item(self):
         # Choose a category, avoiding the last one if possible
@@ -2541,7 +2483,7 @@ class CosmicCopyState(State):
             if len(self.recent_items["alphabet"]) > 5:
                 self.recent_items["alphabet"].pop(0)
                 
-            self.current_item = pygame.image.load(resource_path("GAME PROPER", "COSMIC COPY ALPHABET", f"{self.expected_value}.png")).convert_alpha()
+            self.current_item = self.game.assets.image(os.path.join("GAME PROPER", "COSMIC COPY ALPHABET", f"{self.expected_value}.png"), evictable=True, fit=(1024, 600))
             
         elif choice == "number":
             available_items = [item for item in self.number_labels 
@@ -2557,7 +2499,7 @@ class CosmicCopyState(State):
             if len(self.recent_items["number"]) > 3:  # Track last 3 numbers
                 self.recent_items["number"].pop(0)
                 
-            self.current_item = pygame.image.load(resource_path("GAME PROPER", "COSMIC COPY NUMBER", f"{self.expected_value}.png")).convert_alpha()
+            self.current_item = self.game.assets.image(os.path.join("GAME PROPER", "COSMIC COPY NUMBER", f"{self.expected_value}.png"), evictable=True, fit=(1024, 600))
             
         else:  # phrase
             available_items = [item for item in self.phrase_labels 
@@ -2573,31 +2515,23 @@ class CosmicCopyState(State):
             if len(self.recent_items["phrase"]) > 2:  # Track last 2 phrases
                 self.recent_items["phrase"].pop(0)
                 
-            self.current_item = pygame.image.load(resource_path("GAME PROPER", "COSMIC COPY PHRASES", f"{self.expected_value.upper()}.png")).convert_alpha()
+            self.current_item = self.game.assets.image(os.path.join("GAME PROPER", "COSMIC COPY PHRASES", f"{self.expected_value.upper()}.png"), evictable=True, fit=(1024, 600))
 
-        self.current_item = pygame.transform.smoothscale(self.current_item, self.get_scaled_dimensions(self.current_item, 1024, 600))
         self.current_item_rect = self.current_item.get_rect(center=(1024 // 2, 600 // 2))
+        self.item_id += 1
 
-    def get_scaled_dimensions(self, image, max_width, max_height):
-        """Returns new dimensions for the image while maintaining aspect ratio"""
-        img_width, img_height = image.get_size()
-        scale_factor = min(max_width / img_width, max_height / img_height)
-        return int(img_width * scale_factor), int(img_height * scale_factor)
-    
     # New methods for phrase recognition (from PhraseDisplayState)
     def mediapipe_detection(self, image):
         image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         image.flags.writeable = False
-        results = self.holistic.process(image)
+        results = self.game.tracker.process_holistic(image)
         image.flags.writeable = True
         image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
         return image, results
     
     def extract_keypoints(self, results):
-        pose = np.array([[res.x, res.y, res.z, res.visibility] for res in results.pose_landmarks.landmark]).flatten() if results.pose_landmarks else np.zeros(33*4)
-        lh = np.array([[res.x, res.y, res.z] for res in results.left_hand_landmarks.landmark]).flatten() if results.left_hand_landmarks else np.zeros(21*3)
-        rh = np.array([[res.x, res.y, res.z] for res in results.right_hand_landmarks.landmark]).flatten() if results.right_hand_landmarks else np.zeros(21*3)
-        return np.concatenate([pose, lh, rh])
+        """258 keypoints as a view into the adapter's buffer (valid until the next frame)"""
+        return self.landmark_adapter.holistic(results)
     
     def has_hands(self, results):
         return results.left_hand_landmarks is not None or results.right_hand_landmarks is not None
@@ -2606,160 +2540,168 @@ class CosmicCopyState(State):
         hand_points = keypoints[-126:]  # Get hand keypoints (last 126 values)
         return np.mean(np.abs(hand_points)) > threshold
 
-    def update(self):
-        self.game.screen.fill((0, 0, 0))  # Clear screen
-        self.game.screen.blit(self.current_item, self.current_item_rect.topleft)  # Centered display
-
-        # Update webcam feed
-        if self.webcam:
-            ret, webcam_frame = self.webcam.read()
-            if ret:
-                # Flip the webcam frame horizontally to mirror it
-                webcam_frame = cv2.flip(webcam_frame, 1)
+    def process_frame(self, webcam_frame):
+        """Runs on the recognition worker: picks hands or holistic for the current item"""
+        item_id = self.item_id
+        expected_value = self.expected_value
+
+        # Flip the webcam frame horizontally to mirror it
+        webcam_frame = cv2.flip(webcam_frame, 1)
+        hands = False
+        landmarks = None
+        prediction = None
+
+        if self.correct is True and self.start_time:
+            # Keep showing the webcam during the "Correct" delay, but skip recognition
+            pass
+
+        elif expected_value in self.phrase_labels:
+            # The sequence belongs to one item; start over when the item changes
+            if self.sequence_item != item_id:
+                self.sequence.clear()
+                self.predictions.clear()
+                self.sequence_item = item_id
+
+            # Use holistic model and sequence-based processing for phrases
+            image, results = self.mediapipe_detection(webcam_frame)
+            hands = self.has_hands(results)
+            landmarks = results
+            
+            if hands and not self.confetti_triggered:
+                keypoints = self.extract_keypoints(results)
                 
-                # Handle the decision to proceed to the next item
-                if self.correct is True and self.start_time:
-                    if time.time() - self.start_time > 5:  # Wait for 5 seconds
-                        self.randomize_item()  # Proceed to the next item
-                        self.correct = False  # Reset correct status
-                        self.start_time = None  # Reset start time
-                        self.confetti_triggered = False  # Reset confetti trigger for next item
-                        # Reset sequence and predictions for phrase recognition
-                        self.sequence = []
-                        self.predictions = []
-                    # Continue rendering confetti, webcam, landmarks, and "Correct" message during the delay
-                    self.render_webcam_and_confetti(webcam_frame, None)
-                    return  # Skip further processing
-
-                # Process the frame based on the type of expected value
-                if self.expected_value in self.phrase_labels:
-                    # Use holistic model and sequence-based processing for phrases
-                    image, results = self.mediapipe_detection(webcam_frame)
+                if self.detect_motion(keypoints):
+                    self.sequence.push(keypoints)
                     
-                    if self.has_hands(results) and not self.confetti_triggered:
-                        keypoints = self.extract_keypoints(results)
-                        
-                        if self.detect_motion(keypoints):
-                            self.sequence.append(keypoints)
-                            self.sequence = self.sequence[-self.sequence_length:]
+                    if self.sequence.full:
+                        try:
+                            # Normalized (1, 30, 258) window, updated incrementally
+                            input_data = self.sequence.normalized()
+
+                            # Run inference and get prediction results
+                            res = self.phrase_model.predict(input_data)[0]
+                            max_prob = res[np.argmax(res)]
                             
-                            if len(self.sequence) == self.sequence_length:
-                                try:
-                                    # Prepare input data
-                                    input_data = np.array(self.sequence, dtype=np.float32)
-                                    input_data = (input_data - np.mean(input_data)) / (np.std(input_data) + 1e-6)
-                                    input_data = np.expand_dims(input_data, axis=0)
-
-                                    # Set the tensor and run inference
-                                    self.phrase_model.set_tensor(self.phrase_input_details[0]['index'], input_data)
-                                    self.phrase_model.invoke()
-                                    
-                                    # Get prediction results
-                                    res = self.phrase_model.get_tensor(self.phrase_output_details[0]['index'])[0]
-                                    max_prob = res[np.argmax(res)]
+                            if max_prob > self.threshold:
+                                streak = self.predictions.push(self.phrase_actions[np.argmax(res)])
+                                
+                                if (streak >= self.min_consecutive_predictions and 
+                                    max_prob > self.confidence_threshold):
                                     
-                                    if max_prob > self.threshold:
-                                        prediction = self.phrase_actions[np.argmax(res)]
-                                        self.predictions.append(prediction)
-                                        
-                                        if len(self.predictions) > self.prediction_history_size:
-                                            self.predictions = self.predictions[-self.prediction_history_size:]
-                                        
-                                        if (len(self.predictions) >= self.min_consecutive_predictions and 
-                                            len(set(self.predictions[-self.min_consecutive_predictions:])) == 1 and 
-                                            max_prob > self.confidence_threshold):
-                                            
-                                            current_pred = self.predictions[-1]
-                                            # Map the prediction to the expected format
-                                            if current_pred == "thanks":
-                                                current_pred = "thankyou"
-                                                
-                                            if current_pred == self.expected_value:
-                                                if not self.correct:  # Ensure the logic runs only once
-                                                    self.correct = True
-                                                    self.start_time = time.time()  # Start the timer
-                                                    self.save_progress("phrase", self.expected_value)
-
-                                                    # Trigger confetti effect when correct
-                                                    if not self.confetti_triggered:
-                                                        self.confetti_particles = [Confetti(1024, 600) for _ in range(100)]
-                                                        self.confetti_triggered = True
-                                                        self.confetti_sound.play()  # Play confetti sound when triggered
-                                            else:
-                                                self.correct = False
-                                        
-                                except Exception as e:
-                                    print(f"Phrase inference error: {e}")
-                    
-                    # Draw holistic landmarks
-                    if results.pose_landmarks:
-                        self.mp_drawing.draw_landmarks(image, results.pose_landmarks, self.mp_holistic.POSE_CONNECTIONS)
-                    if results.left_hand_landmarks:
-                        self.mp_drawing.draw_landmarks(image, results.left_hand_landmarks, self.mp_holistic.HAND_CONNECTIONS)
-                    if results.right_hand_landmarks:
-                        self.mp_drawing.draw_landmarks(image, results.right_hand_landmarks, self.mp_holistic.HAND_CONNECTIONS)
-                    
-                    # Render updated webcam and result
-                    self.render_webcam_and_confetti(image, None)
-                    
-                else:
-                    # Use hands model for alphabet and numbers (original logic)
-                    h, w, _ = webcam_frame.shape
-                    roi = webcam_frame[:, w//2:]  # Right side ROI
-                    roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
-                    result = self.hands.process(roi_rgb)
-
-                    if result.multi_hand_landmarks:
-                        for hand_landmarks in result.multi_hand_landmarks:
-                            landmarks = []
-                            for lm in hand_landmarks.landmark:
-                                if self.expected_value in self.alphabet_labels:
-                                    landmarks.extend([lm.x, lm.y])  # Use only x and y coordinates for alphabet
-                                else:
-                                    landmarks.extend([lm.x, lm.y, lm.z])  # Use x, y, and z coordinates for numbers
-
-                            # Convert landmarks to NumPy array and reshape
-                            input_data = np.array(landmarks, dtype=np.float32).reshape(1, -1)
-
-                            # Perform inference based on the type of expected value
-                            if self.expected_value in self.alphabet_labels:
-                                self.interpreter = self.alphabet_model
-                            else:  # number
-                                self.interpreter = self.number_model
-
-                            self.interpreter.set_tensor(self.interpreter.get_input_details()[0]['index'], input_data)
-                            self.interpreter.invoke()
-                            output_data = self.interpreter.get_tensor(self.interpreter.get_output_details()[0]['index'])
-                            prediction = np.argmax(output_data)
-
-                            # Check if the prediction is correct
-                            if (self.expected_value in self.alphabet_labels and prediction < len(self.alphabet_labels) and self.expected_value == self.alphabet_labels[prediction]) or \
-                               (self.expected_value in self.number_labels and prediction < len(self.number_labels) and self.expected_value == self.number_labels[prediction]):
-                                if not self.correct:  # Ensure the logic runs only once
-                                    self.correct = True
-                                    self.start_time = time.time()  # Start the timer
-                                    self.save_progress("alphabet" if self.expected_value in self.alphabet_labels else "number", self.expected_value)
-
-                                    # Trigger confetti effect when correct
-                                    if not self.confetti_triggered:
-                                        self.confetti_particles = [Confetti(1024, 600) for _ in range(100)]
-                                        self.confetti_triggered = True
-                                        self.confetti_sound.play()  # Play confetti sound when triggered
-                            else:
-                                self.correct = False
-
-                            # Draw landmarks
-                            self.mp_drawing.draw_landmarks(
-                                roi, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
-                                self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
-                                self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
-                            )
-                    else:
-                        # No hand landmarks detected, do not display "Try Again"
-                        self.correct = None
+                                    prediction = self.predictions.label
+                                    # Map the prediction to the expected format
+                                    if prediction == "thanks":
+                                        prediction = "thankyou"
+                            
+                        except Exception as e:
+                            print(f"Phrase inference error: {e}")
+            
+            # Draw holistic landmarks
+            if results.pose_landmarks:
+                self.mp_drawing.draw_landmarks(image, results.pose_landmarks, self.mp_holistic.POSE_CONNECTIONS)
+            if results.left_hand_landmarks:
+                self.mp_drawing.draw_landmarks(image, results.left_hand_landmarks, self.mp_holistic.HAND_CONNECTIONS)
+            if results.right_hand_landmarks:
+                self.mp_drawing.draw_landmarks(image, results.right_hand_landmarks, self.mp_holistic.HAND_CONNECTIONS)
+            webcam_frame = image
+            
+        else:
+            # Use hands model for alphabet and numbers (original logic)
+            h, w, _ = webcam_frame.shape
+            roi = webcam_frame[:, w//2:]  # Right side ROI
+            roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
+            result = self.game.tracker.process_hands(roi_rgb)
+            hands = bool(result.multi_hand_landmarks)
+            landmarks = result.multi_hand_landmarks
+
+            if result.multi_hand_landmarks:
+                is_alphabet = expected_value in self.alphabet_labels
+                for hand_landmarks in result.multi_hand_landmarks:
+                    # x and y for the alphabet model, x, y and z for the number model
+                    input_data = self.landmark_adapter.hand(hand_landmarks, dims=2 if is_alphabet else 3)
+
+                    # Perform inference based on the type of expected value
+                    classifier = self.alphabet_model if is_alphabet else self.number_model
+                    labels = self.alphabet_labels if is_alphabet else self.number_labels
+                    output_data = classifier.predict(input_data)
+                    index = np.argmax(output_data)
+                    prediction = labels[index] if index < len(labels) else None
+
+                    # Draw landmarks
+                    self.mp_drawing.draw_landmarks(
+                        roi, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
+                        self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
+                        self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
+                    )
+
+        return {
+            "frame": webcam_frame,
+            "hands": hands,
+            "landmarks": landmarks,
+            "prediction": prediction,
+            "confidence": None,
+            "item_id": item_id
+        }
+
+    def apply_result(self, result):
+        """Runs on the main thread: turn a worker result into lesson progress"""
+        # Ignore results computed for a previous item or during the "Correct" delay
+        if result["item_id"] != self.item_id or (self.correct is True and self.start_time):
+            return
+
+        if self.expected_value in self.phrase_labels:
+            if result["prediction"] is None or self.confetti_triggered:
+                return
+            item_type = "phrase"
+        elif not result["hands"]:
+            # No hand landmarks detected, do not display "Try Again"
+            self.correct = None
+            return
+        else:
+            item_type = "alphabet" if self.expected_value in self.alphabet_labels else "number"
+
+        # Check if the prediction is correct
+        if result["prediction"] == self.expected_value:
+            if not self.correct:  # Ensure the logic runs only once
+                self.correct = True
+                self.start_time = time.time()  # Start the timer
+                self.save_progress(item_type, self.expected_value)
+
+                # Trigger confetti effect when correct
+                if not self.confetti_triggered:
+                    self.confetti_particles = self.game.confetti.burst(100)
+                    self.confetti_triggered = True
+                    self.game.sfx.play("celebrate")  # Play confetti sound when triggered
+        else:
+            self.correct = False
+
+    def pacing(self):
+        # Follow the camera, but keep a steady rate while confetti falls
+        return 30 if self.confetti_particles else PACE_CAMERA
+
+    def update(self):
+        self.game.screen.fill((0, 0, 0))  # Clear screen
+        self.game.screen.blit(self.current_item, self.current_item_rect.topleft)  # Centered display
 
-                    # Render webcam, confetti, and result
-                    self.render_webcam_and_confetti(webcam_frame, result)
+        # Pick up the newest result published by the recognition worker
+        result = self.game.recognition.latest()
+        if result is not None and result["sequence"] != self.last_result_sequence:
+            self.last_result_sequence = result["sequence"]
+            self.apply_result(result)
+            self.webcam_surface = self.game.presenter.present(result["frame"], self.webcam_size)
+
+        # Handle the decision to proceed to the next item
+        if self.correct is True and self.start_time:
+            if time.time() - self.start_time > 5:  # Wait for 5 seconds
+                self.randomize_item()  # Proceed to the next item
+                self.correct = False  # Reset correct status
+                self.start_time = None  # Reset start time
+                self.confetti_triggered = False  # Reset confetti trigger for next item
+                # The worker resets its phrase sequence when it sees the new item
+
+        # Render webcam, confetti, and result
+        if self.webcam_surface is not None:
+            self.render_webcam_and_confetti()
 
         # Draw back button
         self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
@@ -2768,29 +2710,13 @@ class CosmicCopyState(State):
         if self.hovered_button == self.back_button_collision:
             pygame.draw.rect(self.game.screen, (0, 255, 0), self.back_button_collision, 3)
 
-    def render_webcam_and_confetti(self, webcam_frame, result):
-        """Render the webcam feed, confetti particles, landmarks, and result text."""
-        # Convert the webcam frame to a surface and blit it
-        webcam_surface = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(webcam_frame, cv2.COLOR_BGR2RGB), self.webcam_size).swapaxes(0, 1))
-        self.game.screen.blit(webcam_surface, self.webcam_position)
+    def render_webcam_and_confetti(self):
+        """Render the webcam feed (landmarks already drawn by the worker), confetti particles and result text."""
+        self.game.screen.blit(self.webcam_surface, self.webcam_position)
 
         # Update and draw confetti particles
-        for particle in self.confetti_particles[:]:
-            particle.fall()
-            particle.draw(self.game.screen)
-
-            # Remove particles that fall off screen
-            if particle.y > 600 or particle.x < 0 or particle.x > 1024:
-                self.confetti_particles.remove(particle)
-
-        # Draw landmarks for hand detection if available (for alphabet and numbers)
-        if result and result.multi_hand_landmarks and not self.expected_value in self.phrase_labels:
-            for hand_landmarks in result.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    webcam_frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
-                    self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
-                )
+        if self.confetti_particles:
+            self.confetti_particles.step(self.game.screen)
 
         # Display result text
         if self.correct is True:
@@ -2800,27 +2726,23 @@ class CosmicCopyState(State):
         else:
             result_text = ""
 
-        result_surface = self.game.font.render(result_text, True, pygame.Color('white'))
+        result_surface = self.game.text.render(self.game.font, result_text, True, pygame.Color('white'))
         result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
         result_y = self.webcam_position[1] + self.webcam_size[1] + 10
         self.game.screen.blit(result_surface, (result_x, result_y))
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            if self.back_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.back_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.back_button_collision
-            else:
-                self.hovered_button = None
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
 
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.correct = False  # Reset correct status
-                self.start_time = None  # Reset start time
-                self.confetti_triggered = False  # Reset confetti trigger when going back
-                self.game.change_state("playing_home")
+            self.widgets.click(event.pos)
+
+    def leave(self):
+        self.correct = False  # Reset correct status
+        self.start_time = None  # Reset start time
+        self.confetti_triggered = False  # Reset confetti trigger when going back
+        self.game.change_state("playing_home")
 
     def save_progress(self, item_type, item_value):
         """Save the progress of the current profile"""
@@ -2879,31 +2801,33 @@ class StarQuestState(State):
         self.hovered_button = None
 
         # Back button
-        self.back_button_img = pygame.image.load(resource_path("BUTTONS/BACK.png")).convert_alpha()
+        self.back_button_img = self.game.assets.image("BUTTONS/BACK.png")
         self.back_button_rect = self.back_button_img.get_rect()
-        self.back_button_collision = get_collision_rect(self.back_button_img)
+        self.back_button_collision = self.game.assets.collision_rect(self.back_button_img)
+        self.widgets = Widgets(self.game)
+        self.widgets.add(self.back_button_collision, on_click=lambda: self.game.change_state("playing_home"))
 
     def load_images(self):
-        self.images = {}
+        # Only the paths are kept; level_image() fetches the art from the asset cache when drawn
+        self.image_paths = {}
         for level, _ in self.levels:
             for i in range(len(level) + 1):
-                img_path = resource_path(os.path.join("GAME PROPER", "STAR QUEST", f"{level}_{i}.png"))
-                self.images[f"{level}_{i}"] = pygame.image.load(img_path).convert_alpha()
+                self.image_paths[f"{level}_{i}"] = os.path.join("GAME PROPER", "STAR QUEST", f"{level}_{i}.png")
+
+    def level_image(self, img_key):
+        return self.game.assets.image(self.image_paths[img_key], evictable=True)
 
     def load_model(self):
-        self.interpreter = tflite.Interpreter(model_path=resource_path("MODEL/asl_mlp_model_v2.tflite"))
-        self.interpreter.allocate_tensors()
-        self.input_details = self.interpreter.get_input_details()
-        self.output_details = self.interpreter.get_output_details()
+        self.classifier = self.game.models.get("MODEL/asl_mlp_model_v2.tflite")
         self.labels = [chr(i) for i in range(ord('A'), ord('Z') + 1)]
 
     def setup_mediapipe(self):
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(static_image_mode=False, max_num_hands=1, min_detection_confidence=0.5)
+        self.mp_hands = mp.solutions.hands  # Graph itself is shared via game.tracker
         self.mp_drawing = mp.solutions.drawing_utils
+        self.landmark_adapter = LandmarkAdapter()  # Reusable model-input buffers for the worker
 
     def enter(self):
-        self.webcam = cv2.VideoCapture(0, cv2.CAP_DSHOW)  # Initialize webcam
+        self.webcam = self.game.camera.subscribe(self)  # Shared, already-open webcam
         self.current_level = 0
         self.current_step = 0
         self.correct = False
@@ -2911,12 +2835,49 @@ class StarQuestState(State):
         self.confetti_particles = []
         self.celebration_active = False
         self.celebration_start_time = None
+        self.webcam_surface = None
+        self.last_result_sequence = 0
+        self.game.recognition.start(self.process_frame)
 
     def exit(self):
+        self.game.recognition.stop()
         if self.webcam:
-            self.webcam.release()  # Release the webcam
+            self.game.camera.unsubscribe(self)  # Camera stays open for the next state
             self.webcam = None
 
+    def process_frame(self, webcam_frame):
+        """Runs on the recognition worker: hand landmarks, classification and overlay"""
+        webcam_frame = cv2.flip(webcam_frame, 1)
+        h, w, _ = webcam_frame.shape
+        roi = webcam_frame[:, w//2:]
+        roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
+        result = self.game.tracker.process_hands(roi_rgb)
+
+        prediction = None
+        if result.multi_hand_landmarks:
+            for hand_landmarks in result.multi_hand_landmarks:
+                input_data = self.landmark_adapter.hand(hand_landmarks, dims=2)
+                if input_data.shape[1] == self.classifier.input_shape[1]:
+                    output_data = self.classifier.predict(input_data)
+                    prediction = self.labels[np.argmax(output_data)]
+                self.mp_drawing.draw_landmarks(
+                    roi, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
+                    self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
+                    self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
+                )
+
+        return {
+            "frame": webcam_frame,
+            "hands": bool(result.multi_hand_landmarks),
+            "landmarks": result.multi_hand_landmarks,
+            "prediction": prediction,
+            "confidence": None
+        }
+
+    def pacing(self):
+        # Follow the camera, but keep a steady rate while confetti falls
+        return 30 if self.confetti_particles else PACE_CAMERA
+
     def update(self):
         self.game.screen.fill((0, 0, 0))
         level, steps = self.levels[self.current_level]
@@ -2926,15 +2887,12 @@ class StarQuestState(State):
             prev_level_index = self.current_level - 1 if self.current_level > 0 else len(self.levels) - 1
             prev_level, prev_steps = self.levels[prev_level_index]
             img_key = f"{prev_level}_{len(prev_steps)}"
-            self.game.screen.blit(self.images[img_key], (0, 0))
+            self.game.screen.blit(self.level_image(img_key), (0, 0))
 
             # Continue drawing confetti during transition
             if self.celebration_active:
-                for particle in self.confetti_particles[:]:
-                    particle.fall()
-                    particle.draw(self.game.screen)
-                    if particle.y > 600 or particle.x < 0 or particle.x > 1024:
-                        self.confetti_particles.remove(particle)
+                if self.confetti_particles:
+                    self.confetti_particles.step(self.game.screen)
 
                 if self.celebration_start_time and time.time() - self.celebration_start_time > 5:
                     self.celebration_active = False
@@ -2944,71 +2902,53 @@ class StarQuestState(State):
             return
 
         img_key = f"{level}_{self.current_step}"
-        self.game.screen.blit(self.images[img_key], (0, 0))
-
-        if self.webcam:
-            ret, webcam_frame = self.webcam.read()
-            if ret:
-                webcam_frame = cv2.flip(webcam_frame, 1)
-                h, w, _ = webcam_frame.shape
-                roi = webcam_frame[:, w//2:]
-                roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
-                result = self.hands.process(roi_rgb)
-
-                if result.multi_hand_landmarks:
-                    for hand_landmarks in result.multi_hand_landmarks:
-                        landmarks = []
-                        for lm in hand_landmarks.landmark:
-                            landmarks.extend([lm.x, lm.y])
-                        input_data = np.array(landmarks, dtype=np.float32).reshape(1, -1)
-                        if input_data.shape[1] == self.input_details[0]['shape'][1]:
-                            self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
-                            self.interpreter.invoke()
-                            output_data = self.interpreter.get_tensor(self.output_details[0]['index'])
-                            prediction = np.argmax(output_data)
-                            if self.labels[prediction] == steps[self.current_step]:
-                                self.correct = True
-                                if self.start_time is None:
-                                    self.start_time = time.time()
-                            else:
-                                self.correct = False
-                        self.mp_drawing.draw_landmarks(
-                            roi, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
-                            self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2),
-                            self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
-                        )
-                else:
-                    # No hand landmarks detected, do not display "Try Again"
-                    self.correct = None
-
-                # Display result
-                if self.correct is True:
-                    result_text = "Correct"
-                    if self.start_time and time.time() - self.start_time > 1:
-                        self.current_step += 1
+        self.game.screen.blit(self.level_image(img_key), (0, 0))
+
+        # Pick up the newest result published by the recognition worker
+        result = self.game.recognition.latest()
+        if result is not None and result["sequence"] != self.last_result_sequence:
+            self.last_result_sequence = result["sequence"]
+            self.webcam_surface = self.game.presenter.present(result["frame"], self.webcam_size)
+            if result["hands"]:
+                if result["prediction"] is not None:
+                    if result["prediction"] == steps[self.current_step]:
+                        self.correct = True
+                        if self.start_time is None:
+                            self.start_time = time.time()
+                    else:
                         self.correct = False
-                        self.start_time = None
-                        if self.current_step >= len(steps):
-                            self.current_step = len(steps)
-                            self.celebrate()
-                            self.save_progress(level)
-                            self.word_transition_time = time.time()
-                            self.current_level += 1
-                            if self.current_level >= len(self.levels):
-                                self.current_level = 0
-                            self.current_step = 0
-                elif self.correct is False:
-                    result_text = "Try Again"
+            else:
+                # No hand landmarks detected, do not display "Try Again"
+                self.correct = None
+
+        if self.webcam_surface is not None:
+            # Display result
+            if self.correct is True:
+                result_text = "Correct"
+                if self.start_time and time.time() - self.start_time > 1:
+                    self.current_step += 1
+                    self.correct = False
                     self.start_time = None
-                else:
-                    result_text = ""
+                    if self.current_step >= len(steps):
+                        self.current_step = len(steps)
+                        self.celebrate()
+                        self.save_progress(level)
+                        self.word_transition_time = time.time()
+                        self.current_level += 1
+                        if self.current_level >= len(self.levels):
+                            self.current_level = 0
+                        self.current_step = 0
+            elif self.correct is False:
+                result_text = "Try Again"
+                self.start_time = None
+            else:
+                result_text = ""
 
-                result_surface = self.game.font.render(result_text, True, pygame.Color('white'))
-                result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
-                result_y = self.webcam_position[1] + self.webcam_size[1] + 8
-                self.game.screen.blit(result_surface, (result_x, result_y))
-                webcam_surface = pygame.surfarray.make_surface(cv2.resize(cv2.cvtColor(webcam_frame, cv2.COLOR_BGR2RGB), self.webcam_size).swapaxes(0, 1))
-                self.game.screen.blit(webcam_surface, self.webcam_position)
+            result_surface = self.game.text.render(self.game.font, result_text, True, pygame.Color('white'))
+            result_x = self.webcam_position[0] + (self.webcam_size[0] - result_surface.get_width()) // 2
+            result_y = self.webcam_position[1] + self.webcam_size[1] + 8
+            self.game.screen.blit(result_surface, (result_x, result_y))
+            self.game.screen.blit(self.webcam_surface, self.webcam_position)
 
         self.game.screen.blit(self.back_button_img, self.back_button_rect.topleft)
         if self.hovered_button == self.back_button_collision:
@@ -3016,26 +2956,17 @@ class StarQuestState(State):
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            if self.back_button_collision.collidepoint(event.pos):
-                if self.hovered_button != self.back_button_collision:
-                    pygame.mixer.Sound(resource_path("AUDIO/CURSOR ON TOP.mp3")).play()
-                self.hovered_button = self.back_button_collision
-            else:
-                self.hovered_button = None
+            self.hovered_button = self.widgets.hover(event.pos, self.hovered_button)
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.back_button_collision.collidepoint(event.pos):
-                pygame.mixer.Sound(resource_path("AUDIO/MOUSE CLICK.mp3")).play()
-                self.game.change_state("playing_home")
+            self.widgets.click(event.pos)
 
     def celebrate(self):
         # Create confetti particles
-        self.confetti_particles = [Confetti(1024, 600) for _ in range(150)]  # More particles for word completion
+        self.confetti_particles = self.game.confetti.burst(150)  # More particles for word completion
         self.celebration_active = True
         self.celebration_start_time = time.time()
         
-        # Load confetti sound effect
-        self.confetti_sound = pygame.mixer.Sound(resource_path("AUDIO/CELEB.mp3"))
-        self.confetti_sound.play()  # This line plays the sound
+        self.game.sfx.play("celebrate")
 
     def save_progress(self, word):
         """Save the progress of the current profile"""
@@ -3102,19 +3033,25 @@ def send_email(profile_name, completed_lessons):
     except Exception as e:
         print(f"Failed to send email: {e}")
 
+# Fonts for the loading screen, created on the first call and reused for every progress tick
+loading_screen_fonts = {}
+
 # Function to show the loading screen
-def show_loading_screen(screen, progress):
+def show_loading_screen(screen, progress, status=None):
     screen.fill((0, 0, 0))  # Black background
     
     # Load Nunito font
     # You'll need to install the font file in your project directory
-    try:
-        developers_font = pygame.font.Font(resource_path("fonts/Nunito-Regular.ttf"), 18)  # Smaller font for "DEVELOPERS:"
-        names_font = pygame.font.Font(resource_path("fonts/Nunito-Bold.ttf"), 24)  # Larger font for names
-    except:
-        # Fallback if font file isn't found
-        developers_font = pygame.font.Font(None, 24)
-        names_font = pygame.font.Font(None, 36)
+    if not loading_screen_fonts:
+        try:
+            loading_screen_fonts["developers"] = pygame.font.Font(resource_path("FONTS/Nunito-Regular.ttf"), 18)  # Smaller font for "DEVELOPERS:"
+            loading_screen_fonts["names"] = pygame.font.Font(resource_path("FONTS/Nunito-Bold.ttf"), 24)  # Larger font for names
+        except:
+            # Fallback if font file isn't found
+            loading_screen_fonts["developers"] = pygame.font.Font(None, 24)
+            loading_screen_fonts["names"] = pygame.font.Font(None, 36)
+    developers_font = loading_screen_fonts["developers"]
+    names_font = loading_screen_fonts["names"]
     
     # Define color palette for developer names
     colors = {
@@ -3172,40 +3109,105 @@ def show_loading_screen(screen, progress):
     
     # Draw progress bar (green)
     pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, int(bar_width * (progress / 100)), bar_height))
+
+    # Asset count under the bar
+    if status:
+        status_text = developers_font.render(status, True, (150, 150, 150))
+        screen.blit(status_text, (screen.get_width() // 2 - status_text.get_width() // 2, bar_y + bar_height + 10))
     
     pygame.display.flip()
     pygame.event.pump()  # Prevent freezing
 
+# Assets decoded during the loading screen; lesson images are left to the states that need them
+STARTUP_FONTS = [("FONTS/ARIAL.ttf", 36)]
+STARTUP_MODELS = ["MODEL/asl_mlp_model_v2.tflite", "MODEL/asl_number_classifier.tflite", "MODEL/gesture_model.tflite"]
+def scene_path(key):
+    return f"SCENES/{key.upper()}.mp4"
+
+VIDEO_KEYS = ["welcome", "intro", "usertype", "llanding", "glanding", "lgsign", "ggsign", "lplanet", "gplanet", "home", "blgsign", "gexplorer", "galpha", "gnum", "gphrases"]
+
+def decode_asset(kind, path, size=None, models=None, scenes=None):
+    """Runs on a loader thread: everything except display-format conversion"""
+    if kind == "image":
+        return pygame.image.load(resource_path(path))
+    if kind == "sound":
+        return pygame.mixer.Sound(resource_path(path))
+    if kind == "font":
+        # FreeType is not thread-safe; the Font itself is created on the main thread
+        with open(resource_path(path), "rb") as f:
+            return f.read()
+    if kind == "model":
+        return models.get(path)
+    if kind == "video":
+        return cv2.VideoCapture(resource_path(path)), scenes.open(path)
+
 # Function to load assets
-def load_assets(screen):
-    total_assets = len(os.listdir(resource_path("BUTTONS"))) + len(os.listdir(resource_path("AUDIO"))) + 15  # Approximate total
+def load_assets(screen, assets, models, scenes):
+    """Decode startup assets on a thread pool while the loading screen shows real progress.
+
+    Images, sounds, fonts and models are published into the shared AssetCache /
+    ModelRegistry the states read from; the scene clips are returned as a
+    VideoService.
+    """
+    jobs = []
+    for folder, _, files in os.walk(resource_path("BUTTONS")):
+        for file in files:
+            if file.lower().endswith(".png"):
+                jobs.append(("image", os.path.relpath(os.path.join(folder, file), resource_path(".")), None))
+    jobs.append(("image", "SCENES/SENYASPIC.png", None))
+    for path in SFX_FILES.values():
+        jobs.append(("sound", path, None))
+    for path, size in STARTUP_FONTS:
+        jobs.append(("font", path, size))
+    for path in STARTUP_MODELS:
+        jobs.append(("model", path, None))
+    for key in VIDEO_KEYS:
+        jobs.append(("video", scene_path(key), key))
+
+    # Progress is measured in bytes of the files behind each job
+    def job_bytes(path):
+        try:
+            return os.path.getsize(resource_path(path))
+        except OSError:
+            return 0
+    sizes = [job_bytes(path) for _, path, _ in jobs]
+    total_bytes = max(1, sum(sizes))
+    loaded_bytes = 0
     loaded_assets = 0
-    
-    images = {}
-    for file in os.listdir(resource_path("BUTTONS")):
-        if file.endswith(".png"):
-            images[file] = pygame.image.load(resource_path(f"BUTTONS/{file}")).convert_alpha()
-            loaded_assets += 1
-            show_loading_screen(screen, loaded_assets * 100 // total_assets)
-            pygame.time.delay(50)
-    
-    sounds = {}
-    for file in os.listdir(resource_path("AUDIO")):
-        if file.endswith(".mp3"):
-            sounds[file] = pygame.mixer.Sound(resource_path(f"AUDIO/{file}"))
-            loaded_assets += 1
-            show_loading_screen(screen, loaded_assets * 100 // total_assets)
-            pygame.time.delay(50)
-    
-    videos = {}
-    video_keys = ["welcome", "intro", "usertype", "llanding", "glanding", "lgsign", "ggsign", "lplanet", "gplanet", "home", "blgsign", "gexplorer", "galpha", "gnum", "gphrases"]
-    for key in video_keys:
-        videos[key] = cv2.VideoCapture(resource_path(f"SCENES/{key.upper()}.mp4"))
-        loaded_assets += 1
-        show_loading_screen(screen, loaded_assets * 100 // total_assets)
-        pygame.time.delay(50)
-    
-    return images, sounds, videos
+
+    videos = VideoService()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            pool.submit(decode_asset, kind, path, extra, models, scenes): (kind, path, extra, size)
+            for (kind, path, extra), size in zip(jobs, sizes)
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, path, extra, size = futures[future]
+                loaded_bytes += size
+                loaded_assets += 1
+                try:
+                    value = future.result()
+                except Exception as e:
+                    print(f"Failed to load {path}: {e}")
+                    continue
+
+                # Display-format conversion and font creation have to happen on the main thread
+                if kind == "image":
+                    assets.put_image(path, value.convert() if path.startswith("SCENES") else value.convert_alpha(),
+                                     alpha=not path.startswith("SCENES"))
+                elif kind == "sound":
+                    assets.put_sound(path, value)
+                elif kind == "font":
+                    assets.put_font(path, extra, pygame.font.Font(io.BytesIO(value), extra))
+                elif kind == "video":
+                    videos.add(extra, *value)
+
+            show_loading_screen(screen, loaded_bytes * 100 // total_bytes, f"{loaded_assets} / {len(jobs)} assets")
+
+    return videos
 
 import os, sys, traceback, json, pygame
 
@@ -3215,6 +3217,1623 @@ def resource_path(rel):
     base = getattr(sys, "_MEIPASS", os.path.abspath("."))
     return os.path.join(base, rel)
 
+# ------------------------------------------------------------------
+class AssetCache:
+    """Images, sounds and fonts shared by every state.
+
+    Filled by load_assets() during the loading screen; anything not preloaded
+    is loaded from disk on first request and kept for the next state. Keys are
+    normalized absolute paths, so "BUTTONS/BACK.png", "BUTTONS\\BACK.png" and
+    resource_path("BUTTONS/BACK.png") all share one surface.
+
+    Images requested with evictable=True (full-screen lesson art) are counted
+    against image_budget and dropped least-recently-used first; buttons,
+    backgrounds, sounds and fonts stay resident. Lesson states only hold their
+    art while they are on screen, so an evicted image is really freed.
+    """
+    def __init__(self, image_budget=64 * 1024 * 1024):
+        self.images = {}
+        self.sounds = {}
+        self.fonts = {}
+        self.collision_rects = weakref.WeakKeyDictionary()
+
+        # Evictable image keys, least recently used first, and their sizes
+        self.evictable_images = OrderedDict()
+        self.image_budget = image_budget
+        self.evictable_bytes = 0
+        self.resident_bytes = 0
+
+    @staticmethod
+    def key(path):
+        return os.path.normcase(os.path.normpath(resource_path(path)))
+
+    @staticmethod
+    def surface_bytes(surface):
+        return surface.get_pitch() * surface.get_height()
+
+    @staticmethod
+    def fit_size(size, max_size):
+        """Largest size with the same aspect ratio that fits within max_size"""
+        scale_factor = min(max_size[0] / size[0], max_size[1] / size[1])
+        return int(size[0] * scale_factor), int(size[1] * scale_factor)
+
+    def image(self, path, alpha=True, evictable=False, fit=None):
+        """Shared converted surface; with fit=(w, h) only the smoothscaled copy is kept"""
+        key = (self.key(path), alpha, fit)
+        surface = self.images.get(key)
+        if surface is not None:
+            if key in self.evictable_images:
+                self.evictable_images.move_to_end(key)
+            return surface
+
+        surface = pygame.image.load(key[0])
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        if fit:
+            surface = pygame.transform.smoothscale(surface, self.fit_size(surface.get_size(), fit))
+        self.store_image(key, surface, evictable)
+        return surface
+
+    def put_image(self, path, surface, alpha=True, evictable=False):
+        self.store_image((self.key(path), alpha, None), surface, evictable)
+
+    def store_image(self, key, surface, evictable):
+        if key in self.images:
+            self.drop_image(key)
+        self.images[key] = surface
+        size = self.surface_bytes(surface)
+        if evictable:
+            self.evictable_images[key] = size
+            self.evictable_bytes += size
+            self.evict_images()
+        else:
+            self.resident_bytes += size
+
+    def drop_image(self, key):
+        surface = self.images.pop(key)
+        size = self.evictable_images.pop(key, None)
+        if size is None:
+            self.resident_bytes -= self.surface_bytes(surface)
+        else:
+            self.evictable_bytes -= size
+
+    def evict_images(self):
+        """Drop least recently used lesson images until under budget (always keeps the newest)"""
+        while self.evictable_bytes > self.image_budget and len(self.evictable_images) > 1:
+            key = next(iter(self.evictable_images))
+            self.drop_image(key)
+
+    def collision_rect(self, surface):
+        """Memoized get_collision_rect(); returns a copy since states resize their rects"""
+        rect = self.collision_rects.get(surface)
+        if rect is None:
+            rect = get_collision_rect(surface)
+            self.collision_rects[surface] = rect
+        return rect.copy()
+
+    def sound(self, path):
+        key = self.key(path)
+        sound = self.sounds.get(key)
+        if sound is None:
+            sound = pygame.mixer.Sound(key)
+            self.sounds[key] = sound
+        return sound
+
+    def put_sound(self, path, sound):
+        self.sounds[self.key(path)] = sound
+
+    def font(self, path, size):
+        key = (None if path is None else self.key(path), size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(key[0], size)
+            self.fonts[key] = font
+        return font
+
+    def put_font(self, path, size, font):
+        self.fonts[(self.key(path), size)] = font
+
+# ------------------------------------------------------------------
+class TextCache:
+    """Rendered text surfaces, shared by every state.
+
+    Labels such as "Correct", key caps and profile lines are drawn every
+    frame but rarely change, so font.render results are kept in an LRU keyed
+    by (font, text, colour, antialias); a Font object already stands for one
+    face at one size. Returned surfaces are shared: blit them, never draw on
+    them. hits/misses show whether steady-state frames still rasterize.
+    """
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(pygame.Color(color)),
+               None if background is None else tuple(pygame.Color(background)))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+# ------------------------------------------------------------------
+# Short effects played from event handlers, by name
+SFX_FILES = {
+    "hover": "AUDIO/CURSOR ON TOP.mp3",
+    "click": "AUDIO/MOUSE CLICK.mp3",
+    "celebrate": "AUDIO/CELEB.mp3",
+}
+SFX_CATEGORIES = {"hover": "ui", "click": "ui", "celebrate": "celebration"}
+
+# Mixer channels set aside per category; UI gets two so a hover does not cut off a click
+SFX_CHANNELS = {"ui": 2, "celebration": 1}
+
+class SoundEffects:
+    """Pre-decoded sound effects played on reserved mixer channels.
+
+    Each effect is decoded once through the AssetCache, and each category owns
+    its own channels, so hover/click sounds never steal the channel a
+    celebration is playing on. Narration streams separately (NarrationPlayer).
+    """
+    def __init__(self, assets):
+        self.assets = assets
+        self.channels = {}
+        self.next_channel = {}
+        try:
+            pygame.mixer.set_reserved(sum(SFX_CHANNELS.values()))
+            index = 0
+            for category, count in SFX_CHANNELS.items():
+                self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+                self.next_channel[category] = 0
+                index += count
+        except pygame.error as e:
+            print(f"Sound effects disabled: {e}")
+
+        self.sounds = {}
+        for name, path in SFX_FILES.items():
+            try:
+                self.sounds[name] = assets.sound(path)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Failed to load sound effect {name}: {e}")
+
+    def channel(self, category):
+        """Next channel for a category, round-robin"""
+        channels = self.channels.get(category)
+        if not channels:
+            return None
+        index = self.next_channel[category]
+        self.next_channel[category] = (index + 1) % len(channels)
+        return channels[index]
+
+    def play(self, name):
+        sound = self.sounds.get(name)
+        if sound is not None:
+            self.play_sound(sound, SFX_CATEGORIES[name])
+
+    def play_sound(self, sound, category):
+        channel = self.channel(category)
+        if channel is not None:
+            channel.play(sound)
+        else:
+            sound.play()
+
+    def stop(self, category):
+        for channel in self.channels.get(category, []):
+            channel.stop()
+
+# ------------------------------------------------------------------
+# Posted by pygame.mixer.music when a narration track finishes
+NARRATION_END = pygame.USEREVENT + 1
+
+class NarrationPlayer:
+    """Streams narration and background tracks through pygame.mixer.music.
+
+    Only the active track is decoded, incrementally, while it plays; nothing
+    is held in memory between scenes. Game.run() clears the current track on
+    NARRATION_END. Stopping or replacing a track also posts that event, so
+    play() and stop() drop it before it can end the next track early.
+    """
+    def __init__(self):
+        self.current = None
+        try:
+            pygame.mixer.music.set_endevent(NARRATION_END)
+        except pygame.error as e:
+            print(f"Narration disabled: {e}")
+
+    def play(self, path):
+        """Replace whatever is playing with this track"""
+        try:
+            pygame.mixer.music.load(resource_path(path))
+            pygame.mixer.music.play()
+            self.current = path
+        except pygame.error as e:
+            print(f"Failed to play {path}: {e}")
+            self.current = None
+        self.drop_end_events()
+
+    def stop(self):
+        self.current = None
+        try:
+            pygame.mixer.music.stop()
+            pygame.mixer.music.unload()
+        except pygame.error:
+            pass
+        self.drop_end_events()
+
+    def drop_end_events(self):
+        """Forget end events posted for a track that was stopped or replaced"""
+        try:
+            pygame.event.clear(NARRATION_END)
+        except pygame.error:
+            pass
+
+    def handle_end(self):
+        """Called from the event loop when the current track finishes"""
+        try:
+            if pygame.mixer.music.get_busy():
+                return  # A late event for a track that has since been replaced
+        except pygame.error:
+            pass
+        self.current = None
+
+    def elapsed(self):
+        """Seconds into the current track, or None; used as a video presentation clock"""
+        pos = self.get_pos()
+        return None if pos is None else pos / 1000.0
+
+    def get_pos(self):
+        """Milliseconds into the current track, or None if nothing is playing"""
+        if self.current is None:
+            return None
+        try:
+            pos = pygame.mixer.music.get_pos()
+        except pygame.error:
+            return None
+        return pos if pos >= 0 else None
+
+# ------------------------------------------------------------------
+class DirtyRects:
+    """Regions of the screen that changed this frame.
+
+    States that opt in with partial_updates still draw the whole frame into
+    the back buffer, but report what actually changed here; the main loop then
+    hands only those rects to pygame.display.update instead of flipping the
+    whole window. invalidate() marks the full screen, e.g. on a state change
+    or a new background video frame.
+    """
+    def __init__(self, size):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.rects = []
+        self.full = True
+        self.tracked = {}  # name -> rect reported last frame
+
+    def add(self, rect):
+        if rect is not None and not self.full:
+            self.rects.append(pygame.Rect(rect).clip(self.screen_rect))
+
+    def track(self, name, rect):
+        """Report a region that moves or vanishes: the old spot is dirty as well"""
+        previous = self.tracked.pop(name, None)
+        if previous != rect:
+            self.add(previous)
+            self.add(rect)
+        if rect is not None:
+            self.tracked[name] = pygame.Rect(rect)
+
+    def invalidate(self):
+        self.full = True
+        self.rects = []
+
+    def take(self):
+        """Return the rects to push this frame, or None for the full screen"""
+        rects = None if self.full else self.rects
+        self.full = False
+        self.rects = []
+        return rects
+
+    def reset(self):
+        self.tracked.clear()
+        self.invalidate()
+
+# ------------------------------------------------------------------
+class Widgets:
+    """A screen's clickable rects, found through a coarse spatial grid.
+
+    Each rect is registered in every grid cell it overlaps, so resolving the
+    widget under the pointer looks at one cell's few entries instead of
+    scanning every button. Earlier registrations win where rects overlap.
+    hover() and click() also play the shared hover/click sounds and run the
+    widget's on_hover/on_click callback.
+    """
+    def __init__(self, game, cell_size=64):
+        self.game = game
+        self.cell_size = cell_size
+        self.cells = {}  # (column, row) -> [(rect, value, on_click, on_hover), ...] in registration order
+
+    def add(self, rect, value=None, on_click=None, on_hover=None):
+        entry = (rect, value, on_click, on_hover)
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                self.cells.setdefault((column, row), []).append(entry)
+
+    def at(self, pos):
+        """The (rect, value, on_click, on_hover) entry under pos, or None"""
+        for entry in self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size), ()):
+            if entry[0].collidepoint(pos):
+                return entry
+        return None
+
+    def hover(self, pos, hovered=None):
+        """Return the rect under pos; when it differs from hovered, play the hover sound and run its on_hover"""
+        entry = self.at(pos)
+        if entry is None:
+            return None
+        if entry[0] != hovered:
+            self.game.sfx.play("hover")
+            if entry[3] is not None:
+                entry[3]()
+        return entry[0]
+
+    def click(self, pos):
+        """Play the click sound and run the callback of the widget under pos; returns its value"""
+        entry = self.at(pos)
+        if entry is None:
+            return None
+        self.game.sfx.play("click")
+        if entry[2] is not None:
+            entry[2]()
+        return entry[1]
+
+# ------------------------------------------------------------------
+class UILayer:
+    """Static parts of a screen pre-rendered once onto their own surface.
+
+    draw(surface) paints the layer (buttons, hover outlines, overlays). It is
+    only called again after invalidate() or when the key passed to blit()
+    changes, e.g. the hovered button, so each frame costs one blit of the
+    layer's bounding rect however many buttons it holds.
+    """
+    def __init__(self, size, draw, alpha=True):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+        self.draw = draw
+        self.alpha = alpha
+        self.rect = self.surface.get_rect()
+        self.valid = False
+        self.key = None
+
+    def invalidate(self):
+        self.valid = False
+
+    def blit(self, target, key=None, pos=(0, 0)):
+        if not self.valid or key != self.key:
+            if self.alpha:
+                self.surface.fill((0, 0, 0, 0))
+            self.draw(self.surface)
+            # Transparent margins are skipped when compositing
+            self.rect = self.surface.get_bounding_rect() if self.alpha else self.surface.get_rect()
+            self.valid = True
+            self.key = key
+        target.blit(self.surface, (pos[0] + self.rect.x, pos[1] + self.rect.y), self.rect)
+
+# ------------------------------------------------------------------
+class FramePresenter:
+    """Scales frames straight into reusable buffers that pygame surfaces view.
+
+    Each target size gets a fixed number of slots, each a NumPy buffer plus a
+    Surface created once with pygame.image.frombuffer over it. cv2.resize
+    writes into the buffer in place and the surface is declared with the
+    frame's channel order, so no colour conversion, transposition or new
+    Surface is needed per frame. Slots are handed out round-robin: a surface
+    stays valid until its slot comes round again.
+    """
+    def __init__(self, slots=1):
+        self.slots = slots
+        self.targets = {}
+        self.next_slot = {}
+
+    def target(self, size, channel_order="BGR"):
+        key = (size, channel_order)
+        targets = self.targets.setdefault(key, [])
+        index = self.next_slot.get(key, 0)
+        self.next_slot[key] = (index + 1) % self.slots
+        if index == len(targets):
+            buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            targets.append((buffer, pygame.image.frombuffer(buffer, size, channel_order)))
+        return targets[index]
+
+    def present(self, frame, size):
+        """Scale a BGR frame (OpenCV order) into the next slot and return its surface"""
+        buffer, surface = self.target(size, "BGR")
+        cv2.resize(frame, size, dst=buffer)
+        return surface
+
+    def present_rgb(self, frame, size):
+        """Copy an already scaled RGB frame into the next slot and return its surface"""
+        buffer, surface = self.target(size, "RGB")
+        np.copyto(buffer, frame.reshape(buffer.shape))
+        return surface
+
+# ------------------------------------------------------------------
+class VideoPlayer:
+    """One SCENES clip decoded on its own thread into a small ring of surfaces.
+
+    The worker reads, converts and scales frames ahead of playback; read()
+    just pops the next ready surface. restart() rewinds on the worker with a
+    seek instead of releasing the capture, so a clip can be replayed or looped
+    any number of times. stop() pauses decoding and drops the buffered frames.
+
+    Once the clip has a BakedScene, frames come from the scene cache instead
+    of the capture; a bake finished mid-playback takes over at the next rewind.
+
+    restart(loop=True) marks a looping background. A clip that is not baked
+    yet records its first full pass, delta-encoded, into the shared
+    LoopCache. Later passes decode from that in-memory scene instead of the
+    capture. Baked clips never record, since rewinding the mapping is free.
+    The decode thread records each frame as it reads it, so recording costs
+    the main thread nothing; restart() and stop() hand the recording over
+    under the player's lock.
+
+    Playback follows a presentation clock rather than the game loop: read()
+    returns the frame due at the current clip time, dropping any that are
+    late and repeating the current one when the next is not due yet. The
+    decoder skips colour conversion and scaling for frames that are already
+    late. The clock is the narration position when restart() is given one
+    (keeping picture and sound in sync), and wall time otherwise; it holds
+    still while nobody reads, so a paused scene resumes where it stopped.
+    """
+    PAUSE_GAP = 0.25  # seconds without a read() that count as the scene being paused
+
+    def __init__(self, key, capture, scene=None, loop_cache=None, size=(1024, 600), ring_size=3):
+        self.key = key
+        self.capture = capture
+        self.fps = (scene.fps if scene is not None else capture.get(cv2.CAP_PROP_FPS)) or 30
+        if self.fps <= 0:
+            self.fps = 30  # Some backends report -1 when the rate is unknown
+        self.audio_clock = None      # returns seconds into the narration, or None
+        self.clock_start = None      # perf_counter() time of clip position 0
+        self.last_read = None
+        self.current = None          # (index, surface) on screen
+        self.target_index = 0        # frame index due now; older frames get skipped by the decoder
+        self.decode_index = 0
+        self.dropped = 0
+        self.loop_cache = loop_cache
+        self.loop_scene = None       # cached pass to decode from at the next rewind
+        self.recording = None        # LoopRecording the worker fills with the pass it is decoding
+        self.primed = False          # first frames decoded ahead by prime(), not yet played
+        self.scene = scene
+        self.pending_scene = None
+        self.source = scene          # scene the worker decodes from; picked at every rewind
+        self.size = size
+        self.ring_size = ring_size
+        # Slots for the ring, the frame on screen and the one being decoded
+        self.presenter = FramePresenter(slots=ring_size + 2)
+        self.ring = deque()
+        self.cond = threading.Condition()
+        self.generation = 0          # bumped by restart()/stop() so stale frames are discarded
+        self.running = False
+        self.ended = False
+        self.seek_requested = False
+        self.closed = False
+        self.thread = None
+
+    def restart(self, loop=False, clock=None):
+        """Rewind to the first frame and start decoding ahead (from the loop cache if it has the clip)"""
+        self.audio_clock = clock
+        self.clock_start = None
+        self.current = None
+        loop_scene = None
+        recording = None
+        if loop and self.loop_cache is not None and self.scene is None and self.pending_scene is None:
+            loop_scene = self.loop_cache.get(self.key)
+            if loop_scene is None:
+                recording = LoopRecording(self.size, self.fps)
+        with self.cond:
+            self.recording = recording
+            if self.primed and loop_scene is self.loop_scene and recording is None:
+                # Already rewound and decoding from the first frame
+                self.primed = False
+                return
+            self.loop_scene = loop_scene
+            self._rewind()
+
+    def prime(self):
+        """Start decoding the first frames of an idle clip ahead of restart()"""
+        with self.cond:
+            if self.running or self.ring or self.closed:
+                return False
+            self._rewind()
+            self.primed = True
+            return True
+
+    def unprime(self):
+        if self.primed:
+            self.stop()
+
+    def _rewind(self):
+        # Caller holds self.cond
+        self.generation += 1
+        self.target_index = 0
+        self.ring.clear()
+        self.ended = False
+        self.running = True
+        self.seek_requested = True
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._decode_loop, daemon=True)
+            self.thread.start()
+        self.cond.notify_all()
+
+    def use_scene(self, scene):
+        with self.cond:
+            self.pending_scene = scene
+
+    def stop(self):
+        self.current = None
+        with self.cond:
+            self.recording = None
+            self.primed = False
+            self.generation += 1
+            self.ring.clear()
+            self.running = False
+            self.ended = False
+            self.cond.notify_all()
+
+    def due_index(self):
+        """Frame index the presentation clock is at"""
+        now = time.perf_counter()
+        if self.clock_start is None:
+            self.clock_start = now
+        elif now - self.last_read > self.PAUSE_GAP:
+            self.clock_start += now - self.last_read  # not read for a while: hold the clock
+        self.last_read = now
+
+        audio = self.audio_clock() if self.audio_clock is not None else None
+        if audio is not None:
+            # Follow the narration, and keep the wall clock anchored to it for when it ends
+            self.clock_start = now - audio
+        return int((now - self.clock_start) * self.fps)
+
+    def read(self):
+        """Frame due now as (ret, surface); ret is False once the clip has ended"""
+        due = self.due_index() if self.current is not None else 0
+        surface = None
+        with self.cond:
+            self.primed = False
+            if not self.running and not self.ended and not self.ring:
+                self._rewind()  # first read without restart()
+            self.target_index = due
+            if self.current is None:
+                # Nothing on screen yet: wait for the first frame
+                while not self.ring and self.running and not self.closed:
+                    self.cond.wait()
+            late = []
+            while len(self.ring) > 1 and self.ring[1][0] <= due:
+                late.append(self.ring.popleft())
+            if self.ring and (self.current is None or self.ring[0][0] <= due):
+                self.current = self.ring.popleft()
+                surface = self.current[1]
+            # The last frame still gets its full frame time on screen
+            finished = self.ended and not self.ring and (self.current is None or due > self.current[0])
+            self.dropped += len(late)
+            self.cond.notify_all()  # room for the decoder
+
+        if surface is not None:
+            if self.current[0] == 0:
+                self.clock_start = None
+                self.due_index()  # clip time starts with the first frame shown
+            return True, surface
+        if finished:
+            return False, None
+        # Next frame not due yet (or the decoder is catching up): keep showing this one
+        return self.current is not None, None if self.current is None else self.current[1]
+
+    def _decode_loop(self):
+        while True:
+            with self.cond:
+                while not self.closed and not self.seek_requested and (not self.running or len(self.ring) >= self.ring_size):
+                    self.cond.wait()
+                if self.closed:
+                    break
+                seek = self.seek_requested
+                self.seek_requested = False
+                generation = self.generation
+                if seek:
+                    self.decode_index = 0
+                    if self.pending_scene is not None:
+                        self.scene, self.pending_scene = self.pending_scene, None
+                    self.source = self.scene if self.scene is not None else self.loop_scene
+                    if self.source is not None:
+                        self.recording = None  # a bake landed since restart(); nothing to record
+                index = self.decode_index
+                recording = self.recording
+                # Frame 0 is always shown; after that, frames already behind the clock are skipped
+                # (never while recording, so the pass stays complete)
+                skip = index > 0 and index < self.target_index and recording is None
+
+            surface = None
+            decoded = False
+            try:
+                if self.source is not None:
+                    if seek:
+                        self.source.rewind()
+                    if skip:
+                        decoded = self.source.skip()
+                    else:
+                        surface = self.source.next_surface(self.presenter)
+                else:
+                    if seek:
+                        self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    if skip:
+                        decoded = self.capture.grab()  # decode without retrieve/convert
+                    else:
+                        ret, frame = self.capture.read()
+                        if ret:
+                            surface = self.presenter.present(frame, self.size)
+                            if recording is not None:
+                                recording.add(frame)
+            except Exception as e:
+                print(f"Video decode failed: {e}")
+                recording = None
+
+            finished = None
+            with self.cond:
+                if generation != self.generation:
+                    continue
+                self.decode_index = index + 1
+                if recording is not None and (recording.nbytes > self.loop_cache.budget or surface is None):
+                    # Over budget the clip can never fit; at the end the pass is complete
+                    self.recording = None
+                    if surface is None and recording.frame_count:
+                        finished = recording
+                if surface is not None:
+                    self.ring.append((index, surface))
+                elif decoded:
+                    self.dropped += 1
+                else:
+                    self.ended = True
+                    self.running = False
+                self.cond.notify_all()
+            if finished is not None:
+                self.loop_cache.put(self.key, finished.scene())
+        self.capture.release()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+        else:
+            self.capture.release()
+
+class LoopCache:
+    """Recorded passes of looping clips, shared by every scene under one memory budget.
+
+    Entries are whole passes, delta-encoded and zlib-compressed in memory like
+    a baked scene: a 268-frame galaxy menu loop takes about 33 MB (65 MB
+    uncompressed), and a clip that changes most of the frame every frame
+    around 0.8 MB per frame. The budget holds the five menu loops; the least
+    recently played clip is dropped first when a new pass would go over it.
+    Players put finished passes from their decode threads, hence the lock.
+    """
+    def __init__(self, budget=384 * 1024 * 1024):
+        self.budget = budget
+        self.used = 0
+        self.entries = OrderedDict()  # key -> (frames, bytes), least recently used first
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, scene):
+        size = scene.nbytes
+        if size > self.budget:
+            return
+        with self.lock:
+            self._discard(key)
+            while self.used + size > self.budget:
+                self._discard(next(iter(self.entries)))
+            self.entries[key] = (scene, size)
+            self.used += size
+
+    def discard(self, key):
+        with self.lock:
+            self._discard(key)
+
+    def _discard(self, key):
+        # Caller holds self.lock
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.used -= entry[1]
+
+class VideoService:
+    """The scene players, looked up by video key like the old capture dict"""
+    def __init__(self, loop_cache=None):
+        self.players = {}
+        self.loop_cache = loop_cache if loop_cache is not None else LoopCache()
+
+    def add(self, key, capture, scene=None):
+        self.players[key] = VideoPlayer(key, capture, scene, self.loop_cache)
+
+    def __getitem__(self, key):
+        return self.players[key]
+
+    def __contains__(self, key):
+        return key in self.players
+
+    def close(self):
+        for player in self.players.values():
+            player.close()
+
+# ------------------------------------------------------------------
+# Baked scene frames, one set of files per clip content hash
+SCENE_CACHE_VERSION = 2
+SCENE_BLOCK = 64  # bytes per delta block; 1024x600x3 frames split into 28800 blocks
+SCENE_ZLIB_LEVEL = 1  # fastest level; about halves the delta frames of the SCENES clips
+
+def scene_cache_dir():
+    """Per-user cache folder for baked scenes, independent of the working directory"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+    elif sys.platform == "darwin":
+        base = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+    return os.path.join(base, "SENYAS", "scene_cache")
+
+def changed_blocks(blocks, previous):
+    """Indices of the SCENE_BLOCK-byte blocks that differ from the previous frame (all of them for the first)"""
+    if previous is None:
+        return np.arange(len(blocks), dtype=np.int32)
+    return np.flatnonzero((blocks != previous).any(axis=1)).astype(np.int32)
+
+def encode_delta(blocks, previous):
+    """One delta frame: the changed block positions (int32) then those blocks, zlib-compressed.
+
+    Returns the compressed bytes and the number of changed blocks.
+    """
+    positions = changed_blocks(blocks, previous)
+    return zlib.compress(positions.tobytes() + blocks[positions].tobytes(), SCENE_ZLIB_LEVEL), len(positions)
+
+class BakedScene:
+    """Display-ready frames of one clip, memory-mapped from the scene cache.
+
+    Frames are stored as 1024x600 RGB. With "raw" compression every frame is
+    a straight slice of the mapping; with "delta" the first frame is stored
+    whole and later frames only as the SCENE_BLOCK-byte blocks that changed,
+    each frame zlib-compressed (see encode_delta). Decoding inflates one frame
+    and applies its blocks to a working buffer with a single NumPy scatter;
+    it runs on the player's decode thread, and zlib releases the GIL.
+    """
+    def __init__(self, meta, index, data):
+        self.width = meta["width"]
+        self.height = meta["height"]
+        self.fps = meta["fps"]
+        self.compression = meta["compression"]
+        self.frame_count = len(index)
+        self.index = index  # (frames, 3): byte offset, byte length, block count
+        self.data = data
+        self.position = 0
+        self.buffer = np.zeros(self.height * self.width * 3, dtype=np.uint8)
+
+    @property
+    def nbytes(self):
+        return self.index.nbytes + self.data.nbytes
+
+    def rewind(self):
+        self.position = 0
+
+    def apply_delta(self, offset, length, blocks):
+        payload = np.frombuffer(zlib.decompress(self.data[offset:offset + length]), dtype=np.uint8)
+        positions = payload[:4 * blocks].view(np.int32)
+        self.buffer.reshape(-1, SCENE_BLOCK)[positions] = payload[4 * blocks:].reshape(-1, SCENE_BLOCK)
+
+    def skip(self):
+        """Step past a late frame, applying its blocks but building no surface"""
+        if self.position >= self.frame_count:
+            return False
+        if self.compression != "raw":
+            self.apply_delta(*(int(v) for v in self.index[self.position]))
+        self.position += 1
+        return True
+
+    def next_surface(self, presenter):
+        if self.position >= self.frame_count:
+            return None
+        offset, length, blocks = (int(v) for v in self.index[self.position])
+        self.position += 1
+        if self.compression == "raw":
+            # Straight view of the mapping, nothing to copy
+            return pygame.image.frombuffer(self.data[offset:offset + length], (self.width, self.height), "RGB")
+        self.apply_delta(offset, length, blocks)
+        # The ring holds several frames at once, so the working buffer goes into a presenter slot
+        return presenter.present_rgb(self.buffer, (self.width, self.height))
+
+class LoopRecording:
+    """One pass of a clip that is not baked yet, delta-encoded in memory.
+
+    add() takes each captured frame on the player's decode thread, scales it
+    and encodes it like a baked frame; scene() turns the pass into a
+    BakedScene over the in-memory data, ready for the LoopCache.
+    """
+    def __init__(self, size, fps):
+        self.size = size
+        self.fps = fps
+        self.chunks = []
+        self.index = []
+        self.nbytes = 0
+        self.previous = None
+        self.scaled = np.empty((size[1], size[0], 3), dtype=np.uint8)
+
+    @property
+    def frame_count(self):
+        return len(self.index)
+
+    def add(self, frame):
+        """Append a BGR capture frame"""
+        cv2.resize(frame, self.size, dst=self.scaled)
+        blocks = cv2.cvtColor(self.scaled, cv2.COLOR_BGR2RGB).reshape(-1, SCENE_BLOCK)
+        payload, count = encode_delta(blocks, self.previous)
+        self.chunks.append(payload)
+        self.index.append((self.nbytes, len(payload), count))
+        self.nbytes += len(payload)
+        self.previous = blocks
+
+    def scene(self):
+        width, height = self.size
+        meta = {"width": width, "height": height, "fps": self.fps, "compression": "delta"}
+        index = np.array(self.index, dtype=np.int64).reshape(-1, 3)
+        return BakedScene(meta, index, np.frombuffer(b"".join(self.chunks), dtype=np.uint8))
+
+class SceneCache:
+    """Bakes SCENES clips into memory-mapped frame stores keyed by content hash.
+
+    bake() decodes a clip once (colour conversion and scaling included) and
+    writes <hash>.bin, <hash>.idx.npy and <hash>.json; open() maps an existing
+    bake so playback needs no codec or resize work. Editing a clip changes its
+    hash, so stale bakes are simply never looked up again. Hashes are kept in
+    digests.json next to the bakes and only recomputed when a clip's size or
+    modification time changes, so a launch does not re-read every clip.
+
+    A bake running in the background yields to recognition: pause() holds it
+    between frames while a lesson has the webcam, resume() lets it go on.
+    """
+    def __init__(self, directory=None, size=(1024, 600), compression="delta"):
+        self.directory = directory or scene_cache_dir()
+        self.size = size
+        self.compression = compression
+        self.cancelled = threading.Event()  # set by close() to abandon a bake in progress
+        self.running = threading.Event()  # cleared by pause()
+        self.running.set()
+        self.digests = None  # clip path -> [size, mtime_ns, sha1], loaded on first use
+        self.digest_lock = threading.Lock()  # content_key() runs on the main thread and the bake thread
+
+    def pause(self):
+        self.running.clear()
+
+    def resume(self):
+        self.running.set()
+
+    def digests_path(self):
+        return os.path.join(self.directory, "digests.json")
+
+    def load_digests(self):
+        try:
+            with open(self.digests_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_digests(self):
+        # Caller holds self.digest_lock
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.digests_path() + ".tmp", "w") as f:
+                json.dump(self.digests, f)
+            os.replace(self.digests_path() + ".tmp", self.digests_path())
+        except OSError as e:
+            print(f"Could not save scene digests: {e}")
+
+    def content_key(self, path):
+        full_path = resource_path(path)
+        stat = os.stat(full_path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        with self.digest_lock:
+            if self.digests is None:
+                self.digests = self.load_digests()
+            entry = self.digests.get(full_path)
+        if entry is None or entry[:2] != stamp:
+            digest = hashlib.sha1()
+            with open(full_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            entry = stamp + [digest.hexdigest()]
+            with self.digest_lock:
+                self.digests[full_path] = entry
+                self.save_digests()
+        width, height = self.size
+        return f"{entry[2]}-{width}x{height}-v{SCENE_CACHE_VERSION}"
+
+    def files(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".idx.npy", base + ".bin"
+
+    def open(self, path):
+        """Map the bake for this clip, or None if it has not been baked yet"""
+        if not os.path.exists(resource_path(path)):
+            return None
+        meta_path, index_path, data_path = self.files(self.content_key(path))
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            index = np.load(index_path)
+            data = np.memmap(data_path, dtype=np.uint8, mode="r")
+        except (OSError, ValueError) as e:
+            print(f"Ignoring baked scene for {path}: {e}")
+            return None
+        return BakedScene(meta, index, data)
+
+    def bake(self, path):
+        """Decode a clip into the cache (no-op if already baked); returns the BakedScene"""
+        scene = self.open(path)
+        if scene is not None or not os.path.exists(resource_path(path)):
+            return scene
+
+        os.makedirs(self.directory, exist_ok=True)
+        meta_path, index_path, data_path = self.files(self.content_key(path))
+        capture = cv2.VideoCapture(resource_path(path))
+        width, height = self.size
+        previous = None
+        index = []
+        offset = 0
+        # Written under temporary names and renamed at the end, so a half-baked clip is never opened
+        with open(data_path + ".tmp", "wb") as out:
+            while not self.cancelled.is_set():
+                if not self.running.is_set():
+                    self.running.wait(0.25)
+                    continue
+                ret, frame = capture.read()
+                if not ret:
+                    break
+                frame = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), self.size).reshape(-1)
+                if self.compression == "raw":
+                    out.write(frame.tobytes())
+                    index.append((offset, frame.size, 0))
+                    offset += frame.size
+                    continue
+                blocks = frame.reshape(-1, SCENE_BLOCK)
+                payload, count = encode_delta(blocks, previous)
+                out.write(payload)
+                index.append((offset, len(payload), count))
+                offset += len(payload)
+                previous = blocks
+        fps = capture.get(cv2.CAP_PROP_FPS) or 30
+        capture.release()
+        if self.cancelled.is_set():
+            os.remove(data_path + ".tmp")
+            return None
+
+        with open(index_path + ".tmp", "wb") as f:
+            np.save(f, np.array(index, dtype=np.int64).reshape(-1, 3))
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump({"width": width, "height": height, "fps": fps, "compression": self.compression, "source": path}, f)
+        os.replace(data_path + ".tmp", data_path)
+        os.replace(index_path + ".tmp", index_path)
+        os.replace(meta_path + ".tmp", meta_path)
+        return self.open(path)
+
+    def bake_missing(self, videos, paths):
+        """First-run step: bake every clip not yet in the cache, handing each to its player"""
+        for key, path in paths.items():
+            if self.cancelled.is_set():
+                return
+            if key in videos and videos[key].scene is not None:
+                continue
+            try:
+                scene = self.bake(path)
+            except Exception as e:
+                print(f"Failed to bake {path}: {e}")
+                continue
+            if scene is not None and key in videos:
+                videos[key].use_scene(scene)
+
+    def close(self):
+        self.cancelled.set()
+        self.running.set()
+
+# ------------------------------------------------------------------
+class Classifier:
+    """Thread-safe handle around one shared TFLite interpreter.
+
+    The interpreter is not re-entrant, so set_tensor/invoke/get_tensor run
+    under a lock; the tensor indices are looked up once at load time.
+    """
+    def __init__(self, model_path):
+        self.model_path = model_path
+        self.interpreter = tflite.Interpreter(model_path=model_path)
+        self.interpreter.allocate_tensors()
+        self.input_details = self.interpreter.get_input_details()
+        self.output_details = self.interpreter.get_output_details()
+        self.input_index = self.input_details[0]['index']
+        self.output_index = self.output_details[0]['index']
+        self.input_shape = tuple(self.input_details[0]['shape'])
+        self.lock = threading.Lock()
+
+    def predict(self, input_data):
+        """Run one inference and return a copy of the output tensor"""
+        with self.lock:
+            self.interpreter.set_tensor(self.input_index, input_data)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self.output_index)
+
+class ModelRegistry:
+    """Loads each model file once and hands out the shared Classifier.
+
+    Interpreters are built under a per-model lock, so loader threads load
+    different models in parallel and a lookup of a loaded model never waits
+    behind a load in progress.
+    """
+    def __init__(self):
+        self.classifiers = {}
+        self.load_locks = {}
+        self.lock = threading.Lock()
+
+    def get(self, relative_path):
+        model_path = os.path.normpath(resource_path(relative_path))
+        with self.lock:
+            classifier = self.classifiers.get(model_path)
+            if classifier is not None:
+                return classifier
+            load_lock = self.load_locks.setdefault(model_path, threading.Lock())
+        with load_lock:
+            with self.lock:
+                classifier = self.classifiers.get(model_path)
+            if classifier is None:
+                classifier = Classifier(model_path)
+                with self.lock:
+                    self.classifiers[model_path] = classifier
+        return classifier
+
+# ------------------------------------------------------------------
+class HandTracker:
+    """One MediaPipe Hands graph and one Holistic graph for the whole game.
+
+    Graphs are created the first time a state asks for them and reset on
+    every state change so a new lesson never inherits the previous hand.
+    The reset is only requested on the main thread and applied by the
+    recognition worker before its next process(), so a state change never
+    waits for a Holistic call in flight.
+    """
+    def __init__(self):
+        self.mp_hands = mp.solutions.hands
+        self.mp_holistic = mp.solutions.holistic
+        self.hands = None
+        self.holistic = None
+        self.reset_pending = False
+        self.lock = threading.Lock()
+
+    def process_hands(self, image_rgb):
+        with self.lock:
+            self.apply_reset()
+            if self.hands is None:
+                self.hands = self.mp_hands.Hands(static_image_mode=False, max_num_hands=1, min_detection_confidence=0.5)
+            return self.hands.process(image_rgb)
+
+    def process_holistic(self, image_rgb):
+        with self.lock:
+            self.apply_reset()
+            if self.holistic is None:
+                self.holistic = self.mp_holistic.Holistic(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+            return self.holistic.process(image_rgb)
+
+    def reset(self):
+        """Drop any tracked landmarks carried over from the previous state"""
+        self.reset_pending = True
+
+    def apply_reset(self):
+        # Caller holds self.lock
+        if self.reset_pending:
+            self.reset_pending = False
+            for graph in (self.hands, self.holistic):
+                if graph is not None:
+                    graph.reset()
+
+    def close(self):
+        with self.lock:
+            for graph in (self.hands, self.holistic):
+                if graph is not None:
+                    graph.close()
+            self.hands = None
+            self.holistic = None
+
+# ------------------------------------------------------------------
+class LandmarkAdapter:
+    """Turns MediaPipe landmarks into model input without per-frame allocation.
+
+    Each adapter owns reusable float32 buffers: (1, 42) and (1, 63) for the
+    hand classifiers and 258 values (pose 33x4, left and right hand 21x3)
+    for the holistic sequence model. Coordinates are written one by one
+    through a memoryview of the buffer (item assignment there is cheaper
+    than NumPy's and builds no intermediate list), and the returned arrays
+    are the buffers themselves, so they are only valid until the next call.
+    Copy anything that has to outlive the frame.
+    """
+    POSE_SIZE = 33 * 4
+    HAND_SIZE = 21 * 3
+    HOLISTIC_SIZE = POSE_SIZE + 2 * HAND_SIZE
+
+    def __init__(self):
+        self.hand_buffers = {2: np.zeros((1, 42), dtype=np.float32),
+                             3: np.zeros((1, 63), dtype=np.float32)}
+        self.hand_views = {dims: memoryview(buffer.reshape(-1)) for dims, buffer in self.hand_buffers.items()}
+        self.keypoints = np.zeros(self.HOLISTIC_SIZE, dtype=np.float32)
+        self.keypoints_view = memoryview(self.keypoints)
+        self.pose = self.keypoints[:self.POSE_SIZE]
+        self.left_hand = self.keypoints[self.POSE_SIZE:self.POSE_SIZE + self.HAND_SIZE]
+        self.right_hand = self.keypoints[self.POSE_SIZE + self.HAND_SIZE:]
+
+    def hand(self, hand_landmarks, dims=2):
+        """(1, 21 * dims) view of one hand: x, y (dims=2) or x, y, z (dims=3)"""
+        landmarks = hand_landmarks.landmark
+        buffer = self.hand_buffers[dims]
+        if len(landmarks) * dims != buffer.shape[1]:
+            # Unexpected landmark count: hand back a fresh array so the caller's shape check rejects it
+            return np.array([[lm.x, lm.y, lm.z][:dims] for lm in landmarks], dtype=np.float32).reshape(1, -1)
+        view = self.hand_views[dims]
+        i = 0
+        if dims == 2:
+            for lm in landmarks:
+                view[i] = lm.x
+                view[i + 1] = lm.y
+                i += 2
+        else:
+            for lm in landmarks:
+                view[i] = lm.x
+                view[i + 1] = lm.y
+                view[i + 2] = lm.z
+                i += 3
+        return buffer
+
+    def holistic(self, results):
+        """(258,) view of pose, left hand and right hand; missing parts are zeros"""
+        view = self.keypoints_view
+        pose = results.pose_landmarks
+        if pose:
+            i = 0
+            for lm in pose.landmark:
+                view[i] = lm.x
+                view[i + 1] = lm.y
+                view[i + 2] = lm.z
+                view[i + 3] = lm.visibility
+                i += 4
+        else:
+            self.pose.fill(0)
+        for offset, target, hand in ((self.POSE_SIZE, self.left_hand, results.left_hand_landmarks),
+                                     (self.POSE_SIZE + self.HAND_SIZE, self.right_hand, results.right_hand_landmarks)):
+            if hand:
+                i = offset
+                for lm in hand.landmark:
+                    view[i] = lm.x
+                    view[i + 1] = lm.y
+                    view[i + 2] = lm.z
+                    i += 3
+            else:
+                target.fill(0)
+        return self.keypoints
+
+# ------------------------------------------------------------------
+class SequenceWindow:
+    """Fixed-size sliding window of keypoint rows for the phrase model.
+
+    Rows live in a circular float32 buffer that is written twice (at i and
+    i + length), so the newest `length` rows are always one contiguous
+    slice and never need to be rebuilt. Per-row sums and sums of squares
+    keep the window's global mean and std up to date as rows come and go,
+    and normalized() writes the model input into a preallocated
+    (1, length, width) array.
+    """
+    def __init__(self, length=30, width=LandmarkAdapter.HOLISTIC_SIZE):
+        self.length = length
+        self.rows = np.zeros((2 * length, width), dtype=np.float32)
+        self.row_sums = np.zeros(length)
+        self.row_squares = np.zeros(length)
+        self.input = np.zeros((1, length, width), dtype=np.float32)
+        self.clear()
+
+    def clear(self):
+        self.head = 0  # Slot the next row is written to
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        # Stale per-row sums would be subtracted again when their slot is overwritten
+        self.row_sums[:] = 0
+        self.row_squares[:] = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def full(self):
+        return self.count == self.length
+
+    def push(self, row):
+        """Copy one row in, evicting the oldest once the window is full"""
+        slot = self.head
+        row_sum = float(row.sum(dtype=np.float64))
+        row_square = float(np.dot(row, row))
+        self.total += row_sum - self.row_sums[slot]
+        self.total_squares += row_square - self.row_squares[slot]
+        self.row_sums[slot] = row_sum
+        self.row_squares[slot] = row_square
+        self.rows[slot] = row
+        self.rows[slot + self.length] = row
+        self.head = (slot + 1) % self.length
+        self.count = min(self.count + 1, self.length)
+        if self.head == 0:
+            # Re-sum once per lap so the running totals never drift
+            self.total = float(self.row_sums.sum())
+            self.total_squares = float(self.row_squares.sum())
+
+    def window(self):
+        """Oldest-to-newest rows as a contiguous (length, width) view"""
+        return self.rows[self.head:self.head + self.length]
+
+    def normalized(self):
+        """(1, length, width) model input: the full window scaled to zero mean, unit std"""
+        size = self.rows.shape[1] * self.length
+        mean = self.total / size
+        std = max(self.total_squares / size - mean * mean, 0.0) ** 0.5
+        np.subtract(self.window(), mean, out=self.input[0])
+        self.input *= 1.0 / (std + 1e-6)
+        return self.input
+
+class PredictionStreak:
+    """Counts how many times in a row the same label has been predicted"""
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.label = None
+        self.count = 0
+
+    def push(self, label):
+        if label == self.label:
+            self.count += 1
+        else:
+            self.label = label
+            self.count = 1
+        return self.count
+
+# ------------------------------------------------------------------
+class CameraService:
+    """Keeps the webcam open for the whole session and captures on a thread.
+
+    Only the newest frame is kept (a single slot stamped with its capture
+    time and a sequence number), so readers never see OpenCV's buffered,
+    stale frames. Capture only runs while at least one state is subscribed.
+    Frames are shared between readers and must not be modified in place.
+    """
+    def __init__(self, device=0):
+        self.device = device
+        self.capture = None
+        self.frame = None
+        self.timestamp = 0.0
+        self.sequence = 0
+        self.subscribers = set()
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+
+    def subscribe(self, owner):
+        with self.condition:
+            if not self.subscribers:
+                self.frame = None  # Don't hand out a frame from the last session
+            self.subscribers.add(owner)
+            if self.thread is None:
+                self.running = True
+                self.thread = threading.Thread(target=self._capture_loop, daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+        return self
+
+    def unsubscribe(self, owner):
+        with self.condition:
+            self.subscribers.discard(owner)
+
+    def _capture_loop(self):
+        # Opened on the capture thread so subscribe() never blocks the UI
+        self.capture = cv2.VideoCapture(self.device, cv2.CAP_DSHOW)
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        while True:
+            with self.condition:
+                while self.running and not self.subscribers:
+                    self.condition.wait()
+                if not self.running:
+                    break
+
+            ret, frame = self.capture.read()
+            if not ret:
+                time.sleep(0.05)
+                continue
+
+            with self.condition:
+                self.frame = frame
+                self.timestamp = time.time()
+                self.sequence += 1
+                self.condition.notify_all()
+        self.capture.release()
+
+    def latest(self):
+        """Return (frame, timestamp, sequence) of the newest captured frame"""
+        with self.condition:
+            return self.frame, self.timestamp, self.sequence
+
+    def read(self):
+        """Same contract as VideoCapture.read(), but never blocks"""
+        frame, _, _ = self.latest()
+        return frame is not None, frame
+
+    def wait_for_frame(self, after_sequence, timeout=None):
+        """Block until a frame newer than after_sequence arrives (or timeout)"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.sequence != after_sequence or not self.running, timeout)
+            return self.frame, self.timestamp, self.sequence
+
+    def close(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+            self.thread = None
+
+# ------------------------------------------------------------------
+class RecognitionPipeline:
+    """Runs capture -> landmarks -> classification off the render loop.
+
+    The active state installs a processor (its process_frame method) which
+    the worker thread calls for every new camera frame. The processor returns
+    a result dict (display-ready webcam frame, landmarks, prediction and
+    confidence); the newest one is published with a sequence number so the
+    main loop only has to pick it up and draw.
+    """
+    def __init__(self, camera):
+        self.camera = camera
+        self.processor = None
+        self.result = None
+        self.sequence = 0
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+
+    def start(self, processor):
+        with self.condition:
+            self.processor = processor
+            self.result = None
+            if self.thread is None:
+                self.running = True
+                self.thread = threading.Thread(target=self._worker_loop, daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    def stop(self):
+        with self.condition:
+            self.processor = None
+            self.result = None
+
+    def latest(self):
+        """Return the newest published result dict, or None"""
+        with self.condition:
+            return self.result
+
+    def _worker_loop(self):
+        last_frame_sequence = 0
+        while True:
+            with self.condition:
+                while self.running and self.processor is None:
+                    self.condition.wait()
+                if not self.running:
+                    break
+                processor = self.processor
+
+            frame, timestamp, frame_sequence = self.camera.wait_for_frame(last_frame_sequence, timeout=0.5)
+            if frame is None or frame_sequence == last_frame_sequence:
+                continue
+            last_frame_sequence = frame_sequence
+
+            try:
+                result = processor(frame)
+            except Exception as e:
+                print(f"Recognition error: {e}")
+                continue
+
+            with self.condition:
+                # Drop results for a state that has been switched away from
+                if self.processor is processor:
+                    self.sequence += 1
+                    result["sequence"] = self.sequence
+                    result["timestamp"] = timestamp
+                    self.result = result
+                    self.condition.notify_all()
+
+    def wait_for_result(self, after_sequence, timeout=None):
+        """Block until a result newer than after_sequence is published (or timeout)"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.sequence != after_sequence or not self.running, timeout)
+            return self.sequence
+
+    def close(self):
+        with self.condition:
+            self.running = False
+            self.processor = None
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+            self.thread = None
+
+# ------------------------------------------------------------------
+class Prefetcher:
+    """Warms up the states the user can reach from the current one.
+
+    After every state change Game hands over current_state.successors(), and
+    Game.run() calls step() once per frame. Each step builds one successor
+    through the StateRegistry (its buttons, collision rects and classifier
+    all come along) and primes the first frames of its background clip on
+    that clip's own decode thread, so the switch shows a frame immediately.
+    Everything here runs on the main thread: surfaces are only created
+    there, and players are only restarted, primed and stopped from there.
+
+    A clip the current state uses is never primed, since its frames may still
+    be on screen. Clips primed for states a new plan no longer leads to are
+    stopped again when the plan is made.
+
+    Only the first max_successors are warmed, so a menu with 26 letter buttons
+    does not build 26 lesson states, and each warm evicts cold lessons other
+    than the current state and its planned successors.
+    """
+    def __init__(self, game, max_successors=4):
+        self.game = game
+        self.max_successors = max_successors
+        self.pending = deque()
+        self.planned = set()
+        self.primed = {}  # video key -> state name it was primed for
+
+    def plan(self, names):
+        self.pending = deque([name for name in names if name in self.game.states][:self.max_successors])
+        self.planned = set(self.pending)
+        self.release_stale()
+
+    def step(self):
+        """Warm the next planned successor, if any"""
+        if not self.pending:
+            return
+        name = self.pending.popleft()
+        try:
+            self.warm(name)
+        except Exception as e:
+            print(f"Prefetch of {name} failed: {e}")
+
+    @staticmethod
+    def video_key(state):
+        return getattr(state, "video_key", None) or getattr(state, "background_video", None)
+
+    def warm(self, name):
+        state = self.game.states.get(name, touch=False)
+        # Building it may have taken the registry over its lesson limit
+        self.game.states.evict_cold(keep=(self.game.current_state_name, *self.planned))
+        key = self.video_key(state)
+        if key == self.video_key(self.game.current_state):
+            return
+        if key in self.game.videos and self.game.videos[key].prime():
+            self.primed[key] = name
+
+    def release_stale(self):
+        """Stop clips primed for states the current plan no longer leads to"""
+        for key, name in list(self.primed.items()):
+            if name not in self.planned:
+                self.game.videos[key].unprime()
+                del self.primed[key]
+
+    def close(self):
+        self.pending.clear()
+
+# ------------------------------------------------------------------
+class StateRegistry:
+    """Builds game states on demand instead of all at once at startup.
+
+    Each state is registered as a factory; the instance is created the first
+    time it is looked up. States registered as evictable (the per-letter,
+    per-number and per-phrase lessons) are kept in an LRU and the coldest ones
+    are dropped once more than max_resident_lessons are alive.
+    """
+    def __init__(self, max_resident_lessons=None):
+        self.factories = {}
+        self.instances = {}
+        self.evictable = set()
+        self.max_resident_lessons = max_resident_lessons
+        self.resident_lessons = []  # Evictable states in use order, coldest first
+
+    def register(self, name, factory, evictable=False):
+        self.factories[name] = factory
+        if evictable:
+            self.evictable.add(name)
+
+    def __contains__(self, name):
+        return name in self.factories
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def get(self, name, touch=True):
+        state = self.instances.get(name)
+        if state is None:
+            state = self.factories[name]()
+            self.instances[name] = state
+
+        if name in self.evictable and (touch or name not in self.resident_lessons):
+            if name in self.resident_lessons:
+                self.resident_lessons.remove(name)
+            self.resident_lessons.append(name)
+        return state
+
+    def evict(self, name):
+        """Forget a built state so it is rebuilt from its factory next time"""
+        self.instances.pop(name, None)
+        if name in self.resident_lessons:
+            self.resident_lessons.remove(name)
+
+    def evict_cold(self, keep=()):
+        """Evict the least recently used lesson states over the resident limit"""
+        if self.max_resident_lessons is None:
+            return
+        for name in list(self.resident_lessons):
+            if len(self.resident_lessons) <= self.max_resident_lessons:
+                break
+            if name not in keep:
+                self.evict(name)
+
+# ------------------------------------------------------------------
+# Frame pacing: State.pacing() returns one of these, or a fixed frame rate
+PACE_IDLE = "idle"  # nothing animates: block on input instead of redrawing
+PACE_CAMERA = "camera"  # redraw whenever recognition publishes a new webcam frame
+IDLE_WAKE_MS = 250  # idle screens still wake this often for timers and background work
+CAMERA_WAIT = 1 / 15  # longest wait for a webcam frame, so input stays responsive
+MAX_FPS = 60
+
+def coalesce_motion(events):
+    """Merge each run of back-to-back MOUSEMOTION events into one at the latest position.
+
+    Hover only needs where the pointer ended up, so a fast mouse costs one
+    hover resolution per frame; rel is summed so drags keep their distance,
+    and clicks stay in order between the merged motions.
+    """
+    merged = []
+    for event in events:
+        if event.type == pygame.MOUSEMOTION and merged and merged[-1].type == pygame.MOUSEMOTION:
+            previous = merged[-1]
+            rel = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+            merged[-1] = pygame.event.Event(pygame.MOUSEMOTION, {**event.dict, "rel": rel})
+        else:
+            merged.append(event)
+    return merged
+
 # ------------------------------------------------------------------
 class Game:
     def __init__(self):
@@ -3225,68 +4844,87 @@ class Game:
 
             self.screen = pygame.display.set_mode((1024, 600))
             pygame.display.set_caption("SENYAS")
+            self.dirty = DirtyRects(self.screen.get_size())
 
             # ---------- runtime fields ------------
             self.current_profile = None
             self.current_state_name = "welcome"
             self.current_state_data = None
-            self.font = pygame.font.Font(None, 36)
+            self.assets = AssetCache()
+            self.text = TextCache()
+            self.font = self.assets.font(None, 36)
+            self.models = ModelRegistry()
+            self.tracker = HandTracker()
+            self.camera = CameraService()
+            self.recognition = RecognitionPipeline(self.camera)
+            self.presenter = FramePresenter()
+            self.confetti = ConfettiAtlas(*self.screen.get_size())  # Rotated sprites for every celebration
 
             # ---------- load assets ---------------
             show_loading_screen(self.screen, 0)
-            self.images, self.sounds, self.videos = load_assets(self.screen)
+            self.scenes = SceneCache()
+            self.videos = load_assets(self.screen, self.assets, self.models, self.scenes)
+            # First run: bake the clips that are not cached yet; players switch over as each finishes
+            self.scene_baker = threading.Thread(target=self.scenes.bake_missing,
+                                                args=(self.videos, {key: scene_path(key) for key in VIDEO_KEYS}),
+                                                daemon=True)
+            self.scene_baker.start()
+            self.sfx = SoundEffects(self.assets)
+            self.narration = NarrationPlayer()
 
             # ---------- base states --------------
-            self.states: dict[str, object] = {
-                "welcome": WelcomeState(
-                    self,
-                    "welcome",
-                    [(resource_path("BUTTONS/LAUNCH.png"), None, "playing_welcome")],
-                    resource_path("AUDIO/LAUNCH SOUND.mp3")
-                ),
-                "playing_welcome":  VideoState(self, "welcome",  "playing_intro"),
-                "playing_intro":    VideoState(self, "intro",    "playing_usertype",
-                                               resource_path("AUDIO/INTRO.mp3")),
-                "playing_usertype": UserTypeState(
-                    self,
-                    "usertype",
-                    [
-                        (resource_path("BUTTONS/LEARNER.png"),  None, "playing_learner_planet"),
-                        (resource_path("BUTTONS/GUARDIAN.png"), None, "playing_guardian_planet")
-                    ],
-                    resource_path("AUDIO/USERTYPE.mp3")
-                ),
-                "load_game": LoadGameState(self, "blgsign"),
-                "playing_learner_planet":  VideoState(self, "lplanet",  "playing_learner_landing"),
-                "playing_learner_landing": VideoState(self, "llanding", "playing_blgsign",
-                                                      resource_path("AUDIO/LLANDING.mp3")),
-                "playing_blgsign": BLGSignState(
-                    self,
-                    "blgsign",
-                    [
-                        (resource_path("BUTTONS/NEW GAME.png"),  None, "playing_lgsign"),
-                        (resource_path("BUTTONS/LOAD GAME.png"), None, "load_game")
-                    ]
-                ),
-                "playing_lgsign":   VideoWithSignInState(self, "lgsign", "playing_home"),
-                "playing_guardian_planet":  VideoState(self, "gplanet",  "playing_guardian_landing"),
-                "playing_guardian_landing": VideoState(self, "glanding", "playing_home",
-                                                       resource_path("AUDIO/GLANDING.mp3")),
-                "playing_home":     HomeState(self, "home", None, resource_path("AUDIO/HOME.mp3")),
-                "playing_galaxy":   GalaxyExplorerState(self, "gexplorer"),
-                "playing_alphabets":GalaxyExplorerAlphabetState(self, "galpha"),
-                "playing_numbers":  GalaxyExplorerNumberState(self, "gnum"),
-                "playing_phrases":  GalaxyExplorerPhrasesstate(self, "gphrases"),
-                "on_screen_keyboard": OnScreenKeyboardState(self),
-                "playing_star":       StarQuestState(self)
-            }
+            # States are registered as factories and only built the first
+            # time change_state() targets them (see StateRegistry).
+            self.states = StateRegistry(max_resident_lessons=6)
+            self.states.register("welcome", lambda: WelcomeState(
+                self,
+                "welcome",
+                [(resource_path("BUTTONS/LAUNCH.png"), None, "playing_welcome")],
+                resource_path("AUDIO/LAUNCH SOUND.mp3")
+            ))
+            self.states.register("playing_welcome", lambda: VideoState(self, "welcome", "playing_intro"))
+            self.states.register("playing_intro", lambda: VideoState(self, "intro", "playing_usertype",
+                                                                     resource_path("AUDIO/INTRO.mp3")))
+            self.states.register("playing_usertype", lambda: UserTypeState(
+                self,
+                "usertype",
+                [
+                    (resource_path("BUTTONS/LEARNER.png"),  None, "playing_learner_planet"),
+                    (resource_path("BUTTONS/GUARDIAN.png"), None, "playing_guardian_planet")
+                ],
+                resource_path("AUDIO/USERTYPE.mp3")
+            ))
+            self.states.register("load_game", lambda: LoadGameState(self, "blgsign"))
+            self.states.register("playing_learner_planet", lambda: VideoState(self, "lplanet", "playing_learner_landing"))
+            self.states.register("playing_learner_landing", lambda: VideoState(self, "llanding", "playing_blgsign",
+                                                                               resource_path("AUDIO/LLANDING.mp3")))
+            self.states.register("playing_blgsign", lambda: BLGSignState(
+                self,
+                "blgsign",
+                [
+                    (resource_path("BUTTONS/NEW GAME.png"),  None, "playing_lgsign"),
+                    (resource_path("BUTTONS/LOAD GAME.png"), None, "load_game")
+                ]
+            ))
+            self.states.register("playing_lgsign", lambda: VideoWithSignInState(self, "lgsign", "playing_home"))
+            self.states.register("playing_guardian_planet", lambda: VideoState(self, "gplanet", "playing_guardian_landing"))
+            self.states.register("playing_guardian_landing", lambda: VideoState(self, "glanding", "playing_home",
+                                                                                resource_path("AUDIO/GLANDING.mp3")))
+            self.states.register("playing_home", lambda: HomeState(self, "home", None, resource_path("AUDIO/HOME.mp3")))
+            self.states.register("playing_galaxy", lambda: GalaxyExplorerState(self, "gexplorer"))
+            self.states.register("playing_alphabets", lambda: GalaxyExplorerAlphabetState(self, "galpha"))
+            self.states.register("playing_numbers", lambda: GalaxyExplorerNumberState(self, "gnum"))
+            self.states.register("playing_phrases", lambda: GalaxyExplorerPhrasesstate(self, "gphrases"))
+            self.states.register("on_screen_keyboard", lambda: OnScreenKeyboardState(self))
+            self.states.register("playing_star", lambda: StarQuestState(self))
 
             # ---------- dynamic phrases ----------
             self.phrase_sequence = []
             for phrase in ["HELLO", "THANKYOU", "ILOVEYOU", "SORRY"]:
                 s = f"playing_{phrase.lower()}"
                 img = resource_path(os.path.join("GAME PROPER", "GEXPLORER PHRASES", f"{phrase}.png"))
-                self.states[s] = PhraseDisplayState(self, img, phrase, None)
+                self.states.register(s, lambda img=img, phrase=phrase: PhraseDisplayState(self, img, phrase, None),
+                                     evictable=True)
                 self.phrase_sequence.append(s)
 
             # ---------- dynamic numbers ----------
@@ -3294,7 +4932,8 @@ class Game:
             for i in range(10):
                 s = f"playing_{i}"
                 img = resource_path(os.path.join("GAME PROPER", "GEXPLORER NUMBER", f"{i}.png"))
-                self.states[s] = NumberDisplayState(self, img, expected_number=i)
+                self.states.register(s, lambda img=img, i=i: NumberDisplayState(self, img, expected_number=i),
+                                     evictable=True)
                 self.number_sequence.append(s)
 
             # ---------- dynamic alphabets --------
@@ -3302,16 +4941,20 @@ class Game:
             for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
                 s = f"playing_{letter.lower()}"
                 img = resource_path(os.path.join("GAME PROPER", "GEXPLORER ALPHABET", f"{letter}.png"))
-                self.states[s] = AlphabetDisplayState(self, img, expected_letter=letter)
+                self.states.register(s, lambda img=img, letter=letter: AlphabetDisplayState(self, img, expected_letter=letter),
+                                     evictable=True)
                 self.alphabet_sequence.append(s)
 
             # ---------- cosmic copy --------------
-            self.states["playing_cosmic"] = CosmicCopyState(self)
+            self.states.register("playing_cosmic", lambda: CosmicCopyState(self))
 
             # ---------- start game ---------------
+            self.prefetcher = Prefetcher(self)
             self.current_state = self.states["welcome"]
             self.current_state.enter()
+            self.prefetcher.plan(self.current_state.successors())
             self.clock = pygame.time.Clock()
+            self.pending_events = []  # Input that woke an idle frame, handled on the next one
 
         except Exception:
             # full traceback to console & file
@@ -3328,22 +4971,79 @@ class Game:
         self.current_state = self.states[new_state]
         self.current_state_name = new_state
         self.current_state_data = data
+        self.tracker.reset()
+        self.dirty.reset()
         self.current_state.enter()
+        # A first-run scene bake waits while a lesson needs the CPU for recognition
+        if self.camera.subscribers:
+            self.scenes.pause()
+        else:
+            self.scenes.resume()
+        # Drop lesson states the learner has moved away from
+        self.states.evict_cold(keep=(new_state,))
+        self.prefetcher.plan(self.current_state.successors())
+
+    # ------------------------------------------
+    def quit(self):
+        self.prefetcher.close()
+        self.current_state.exit()
+        self.narration.stop()
+        self.scenes.close()
+        self.scene_baker.join(timeout=2.0)
+        self.videos.close()
+        self.recognition.close()
+        self.camera.close()
+        self.tracker.close()
+        pygame.quit(); sys.exit()
+
+    # ------------------------------------------
+    def pace(self, result_sequence):
+        """Wait for the next frame the way the current state asks to be paced"""
+        pacing = self.current_state.pacing()
+        if pacing == PACE_IDLE:
+            event = pygame.event.wait(IDLE_WAKE_MS)
+            if event.type != pygame.NOEVENT:
+                self.pending_events.append(event)
+            self.clock.tick()
+        elif pacing == PACE_CAMERA:
+            self.recognition.wait_for_result(result_sequence, timeout=CAMERA_WAIT)
+            self.clock.tick(MAX_FPS)
+        else:
+            self.clock.tick(min(pacing, MAX_FPS))
 
     # ------------------------------------------
     def run(self):
         while True:
             self.screen.fill((0, 0, 0))
-            for event in pygame.event.get():
+            events, self.pending_events = self.pending_events + pygame.event.get(), []
+            for event in coalesce_motion(events):
                 if event.type == pygame.QUIT:
-                    pygame.quit(); sys.exit()
+                    self.quit()
+                if event.type == NARRATION_END:
+                    self.narration.handle_end()
+                if event.type in self.current_state.redraw_events:
+                    self.dirty.invalidate()
                 self.current_state.handle_event(event)
 
+            result_sequence = self.recognition.sequence
             self.current_state.update()
             self.current_state.render()
-            pygame.display.flip()
-            self.clock.tick(30)
+            # Push only what changed when the state reports its dirty regions
+            rects = self.dirty.take()
+            if rects is None or not self.current_state.partial_updates:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+            self.prefetcher.step()
+            self.pace(result_sequence)
 
 # --------------------------------------------------
 if __name__ == "__main__":
+    if "--bake-scenes" in sys.argv:
+        # Build step: bake every scene clip into the scene cache ahead of time
+        scene_cache = SceneCache()
+        for key in VIDEO_KEYS:
+            if scene_cache.bake(scene_path(key)) is not None:
+                print(f"Baked {scene_path(key)}")
+        sys.exit()
     Game().run()
\ No newline at end of file